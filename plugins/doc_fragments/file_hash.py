@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r"""
+    options:
+      hash_parallelism:
+        type: int
+        required: false
+        default: 0
+        version_added: 1.3.0
+        description:
+          - The maximum number of files whose SHA256 checksums are calculated at the same time.
+          - If V(0), the number of logical processors on the host is used.
+          - If V(1), files are hashed one at a time.
+      hash_cache:
+        type: bool
+        required: false
+        default: true
+        version_added: 1.3.0
+        description:
+          - Whether to use the file hash cache stored in the C(Control\Ansible) directory of the MDT share.
+          - If V(true), the SHA256 checksum of a file is only calculated if its size, last write time, or file ID has changed since it was cached.
+          - If V(false), the SHA256 checksum of every file is calculated.
+          - The cache is not saved in check mode.
+      rehash:
+        type: bool
+        required: false
+        default: false
+        version_added: 1.3.0
+        description:
+          - Whether to calculate the SHA256 checksum of every file, even if the cached checksum is current.
+          - If V(true) and O(hash_cache=true), the cache is refreshed with the calculated checksums.
+    """
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+
+class ModuleDocFragment(object):
+
+    DOCUMENTATION = r"""
+    options:
+      read_backend:
+        type: str
+        required: false
+        default: provider
+        choices:
+          - provider
+          - control_files
+        version_added: 1.3.0
+        description:
+          - The method used to read the MDT share.
+          - If V(provider), the MDT PowerShell module is imported and the MDT share is read through the MDT PowerShell provider.
+          - If V(control_files), the XML files within the C(Control) directory of the MDT share are read directly.
+            The MDT PowerShell module is not imported and no MDT PowerShell drive is created.
+            This is much faster on large MDT shares and does not require MDT to be installed.
+          - The returned information is identical for either method.
+    """
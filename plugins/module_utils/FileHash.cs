@@ -0,0 +1,264 @@
+using Microsoft.Win32.SafeHandles;
+using System;
+using System.ComponentModel;
+using System.IO;
+using System.Runtime.InteropServices;
+using System.Security.Cryptography;
+using System.Text;
+
+namespace ansible_collections.trippsc2.mdt.plugins.module_utils.FileHash
+{
+    public static class FileHash
+    {
+        private const int BufferSize = 1024 * 1024;
+
+        private const ulong Prime64_1 = 11400714785074694791UL;
+        private const ulong Prime64_2 = 14029467366897019727UL;
+        private const ulong Prime64_3 = 1609587929392839161UL;
+        private const ulong Prime64_4 = 9650029242287828579UL;
+        private const ulong Prime64_5 = 2870177450012600261UL;
+
+        [StructLayout(LayoutKind.Sequential)]
+        private struct FILETIME
+        {
+            public uint dwLowDateTime;
+            public uint dwHighDateTime;
+        }
+
+        [StructLayout(LayoutKind.Sequential)]
+        private struct BY_HANDLE_FILE_INFORMATION
+        {
+            public uint dwFileAttributes;
+            public FILETIME ftCreationTime;
+            public FILETIME ftLastAccessTime;
+            public FILETIME ftLastWriteTime;
+            public uint dwVolumeSerialNumber;
+            public uint nFileSizeHigh;
+            public uint nFileSizeLow;
+            public uint nNumberOfLinks;
+            public uint nFileIndexHigh;
+            public uint nFileIndexLow;
+        }
+
+        [DllImport("kernel32.dll", SetLastError = true)]
+        private static extern bool GetFileInformationByHandle(
+            SafeFileHandle hFile,
+            out BY_HANDLE_FILE_INFORMATION lpFileInformation);
+
+        /// <summary>
+        /// Gets the file ID of a file.
+        /// The file ID is the volume serial number and the file index, which together identify a file on a system.
+        /// </summary>
+        /// <param name="path">The path of the file.</param>
+        /// <returns>The file ID formatted as a hexadecimal string.</returns>
+        public static string GetFileId(string path)
+        {
+            using (FileStream stream = new FileStream(
+                path,
+                FileMode.Open,
+                FileAccess.Read,
+                FileShare.ReadWrite | FileShare.Delete))
+            {
+                BY_HANDLE_FILE_INFORMATION information;
+
+                if (!GetFileInformationByHandle(stream.SafeFileHandle, out information))
+                {
+                    throw new Win32Exception(Marshal.GetLastWin32Error());
+                }
+
+                return String.Format(
+                    "{0:X8}-{1:X8}{2:X8}",
+                    information.dwVolumeSerialNumber,
+                    information.nFileIndexHigh,
+                    information.nFileIndexLow);
+            }
+        }
+
+        /// <summary>
+        /// Gets the SHA256 checksum of a file.
+        /// The file is read sequentially with a large buffer to reduce the number of reads on large files.
+        /// </summary>
+        /// <param name="path">The path of the file.</param>
+        /// <returns>The SHA256 checksum formatted as an uppercase hexadecimal string, matching Get-FileHash.</returns>
+        public static string GetSha256(string path)
+        {
+            using (FileStream stream = new FileStream(
+                path,
+                FileMode.Open,
+                FileAccess.Read,
+                FileShare.Read,
+                4096,
+                FileOptions.SequentialScan))
+            {
+                return GetSha256(stream);
+            }
+        }
+
+        /// <summary>
+        /// Gets the SHA256 checksum of the remaining content of a stream.
+        /// This allows an entry of an archive to be hashed while it is decompressed, without extracting it.
+        /// </summary>
+        /// <param name="stream">The stream, which is read to its end but not closed.</param>
+        /// <returns>The SHA256 checksum formatted as an uppercase hexadecimal string, matching Get-FileHash.</returns>
+        public static string GetSha256(Stream stream)
+        {
+            byte[] buffer = new byte[BufferSize];
+
+            using (SHA256 sha256 = SHA256.Create())
+            {
+                int bytesRead;
+
+                while ((bytesRead = stream.Read(buffer, 0, buffer.Length)) > 0)
+                {
+                    sha256.TransformBlock(buffer, 0, bytesRead, null, 0);
+                }
+
+                sha256.TransformFinalBlock(buffer, 0, 0);
+
+                return ToHexString(sha256.Hash);
+            }
+        }
+
+        /// <summary>
+        /// Gets the xxHash64 checksum of a file.
+        /// xxHash64 is a non-cryptographic hash that is much faster to calculate than SHA256.
+        /// It is suitable for detecting changes to a file, but not for detecting tampering.
+        /// </summary>
+        /// <param name="path">The path of the file.</param>
+        /// <returns>The xxHash64 checksum, with a seed of 0, formatted as an uppercase hexadecimal string.</returns>
+        public static string GetXxHash64(string path)
+        {
+            byte[] buffer = new byte[BufferSize];
+
+            ulong accumulator1 = unchecked(Prime64_1 + Prime64_2);
+            ulong accumulator2 = Prime64_2;
+            ulong accumulator3 = 0;
+            ulong accumulator4 = unchecked(0 - Prime64_1);
+
+            long totalLength = 0;
+            int bufferedLength = 0;
+
+            using (FileStream stream = new FileStream(
+                path,
+                FileMode.Open,
+                FileAccess.Read,
+                FileShare.Read,
+                4096,
+                FileOptions.SequentialScan))
+            {
+                int bytesRead;
+
+                while ((bytesRead = stream.Read(buffer, bufferedLength, buffer.Length - bufferedLength)) > 0)
+                {
+                    totalLength += bytesRead;
+
+                    int availableLength = bufferedLength + bytesRead;
+                    int offset = 0;
+
+                    while (availableLength - offset >= 32)
+                    {
+                        accumulator1 = Round(accumulator1, BitConverter.ToUInt64(buffer, offset));
+                        accumulator2 = Round(accumulator2, BitConverter.ToUInt64(buffer, offset + 8));
+                        accumulator3 = Round(accumulator3, BitConverter.ToUInt64(buffer, offset + 16));
+                        accumulator4 = Round(accumulator4, BitConverter.ToUInt64(buffer, offset + 24));
+                        offset += 32;
+                    }
+
+                    bufferedLength = availableLength - offset;
+                    Buffer.BlockCopy(buffer, offset, buffer, 0, bufferedLength);
+                }
+            }
+
+            unchecked
+            {
+                ulong hash;
+
+                if (totalLength >= 32)
+                {
+                    hash = RotateLeft(accumulator1, 1) +
+                        RotateLeft(accumulator2, 7) +
+                        RotateLeft(accumulator3, 12) +
+                        RotateLeft(accumulator4, 18);
+
+                    hash = MergeRound(hash, accumulator1);
+                    hash = MergeRound(hash, accumulator2);
+                    hash = MergeRound(hash, accumulator3);
+                    hash = MergeRound(hash, accumulator4);
+                }
+                else
+                {
+                    hash = Prime64_5;
+                }
+
+                hash += (ulong)totalLength;
+
+                int index = 0;
+
+                while (index + 8 <= bufferedLength)
+                {
+                    hash ^= Round(0, BitConverter.ToUInt64(buffer, index));
+                    hash = RotateLeft(hash, 27) * Prime64_1 + Prime64_4;
+                    index += 8;
+                }
+
+                if (index + 4 <= bufferedLength)
+                {
+                    hash ^= BitConverter.ToUInt32(buffer, index) * Prime64_1;
+                    hash = RotateLeft(hash, 23) * Prime64_2 + Prime64_3;
+                    index += 4;
+                }
+
+                while (index < bufferedLength)
+                {
+                    hash ^= buffer[index] * Prime64_5;
+                    hash = RotateLeft(hash, 11) * Prime64_1;
+                    index++;
+                }
+
+                hash ^= hash >> 33;
+                hash *= Prime64_2;
+                hash ^= hash >> 29;
+                hash *= Prime64_3;
+                hash ^= hash >> 32;
+
+                return hash.ToString("X16");
+            }
+        }
+
+        private static ulong Round(ulong accumulator, ulong input)
+        {
+            unchecked
+            {
+                accumulator += input * Prime64_2;
+                accumulator = RotateLeft(accumulator, 31);
+                return accumulator * Prime64_1;
+            }
+        }
+
+        private static ulong MergeRound(ulong accumulator, ulong value)
+        {
+            unchecked
+            {
+                accumulator ^= Round(0, value);
+                return accumulator * Prime64_1 + Prime64_4;
+            }
+        }
+
+        private static ulong RotateLeft(ulong value, int count)
+        {
+            return (value << count) | (value >> (64 - count));
+        }
+
+        private static string ToHexString(byte[] bytes)
+        {
+            StringBuilder builder = new StringBuilder(bytes.Length * 2);
+
+            foreach (byte value in bytes)
+            {
+                builder.Append(value.ToString("X2"));
+            }
+
+            return builder.ToString();
+        }
+    }
+}
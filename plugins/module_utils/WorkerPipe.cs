@@ -0,0 +1,115 @@
+using System;
+using System.ComponentModel;
+using System.Runtime.InteropServices;
+using System.Security.Principal;
+
+namespace ansible_collections.trippsc2.mdt.plugins.module_utils.WorkerPipe
+{
+    public static class WorkerPipe
+    {
+        private const uint ProcessQueryLimitedInformation = 0x1000;
+        private const uint TokenQuery = 0x0008;
+        private const int TokenUser = 1;
+
+        [DllImport("kernel32.dll", SetLastError = true)]
+        private static extern bool GetNamedPipeServerProcessId(
+            SafeHandle Pipe,
+            out uint ServerProcessId);
+
+        [DllImport("kernel32.dll", SetLastError = true)]
+        private static extern IntPtr OpenProcess(
+            uint dwDesiredAccess,
+            bool bInheritHandle,
+            uint dwProcessId);
+
+        [DllImport("advapi32.dll", SetLastError = true)]
+        private static extern bool OpenProcessToken(
+            IntPtr ProcessHandle,
+            uint DesiredAccess,
+            out IntPtr TokenHandle);
+
+        [DllImport("advapi32.dll", SetLastError = true)]
+        private static extern bool GetTokenInformation(
+            IntPtr TokenHandle,
+            int TokenInformationClass,
+            IntPtr TokenInformation,
+            int TokenInformationLength,
+            out int ReturnLength);
+
+        [DllImport("kernel32.dll", SetLastError = true)]
+        private static extern bool CloseHandle(IntPtr hObject);
+
+        /// <summary>
+        /// Gets the ID of the process that created the server end of a connected named pipe.
+        /// </summary>
+        /// <param name="pipe">The handle of the client end of the named pipe.</param>
+        /// <returns>The ID of the server process.</returns>
+        public static int GetServerProcessId(SafeHandle pipe)
+        {
+            uint processId;
+
+            if (!GetNamedPipeServerProcessId(pipe, out processId))
+            {
+                throw new Win32Exception(Marshal.GetLastWin32Error());
+            }
+
+            return (int)processId;
+        }
+
+        /// <summary>
+        /// Gets the user that a process runs as.
+        /// </summary>
+        /// <param name="processId">The ID of the process.</param>
+        /// <returns>The security identifier of the user.</returns>
+        public static SecurityIdentifier GetProcessUser(int processId)
+        {
+            IntPtr process = OpenProcess(ProcessQueryLimitedInformation, false, (uint)processId);
+
+            if (process == IntPtr.Zero)
+            {
+                throw new Win32Exception(Marshal.GetLastWin32Error());
+            }
+
+            try
+            {
+                IntPtr token;
+
+                if (!OpenProcessToken(process, TokenQuery, out token))
+                {
+                    throw new Win32Exception(Marshal.GetLastWin32Error());
+                }
+
+                try
+                {
+                    int length;
+                    GetTokenInformation(token, TokenUser, IntPtr.Zero, 0, out length);
+
+                    IntPtr buffer = Marshal.AllocHGlobal(length);
+
+                    try
+                    {
+                        if (!GetTokenInformation(token, TokenUser, buffer, length, out length))
+                        {
+                            throw new Win32Exception(Marshal.GetLastWin32Error());
+                        }
+
+                        // TOKEN_USER starts with a pointer to the SID of the user.
+                        return new SecurityIdentifier(Marshal.ReadIntPtr(buffer));
+                    }
+                    finally
+                    {
+                        Marshal.FreeHGlobal(buffer);
+                    }
+                }
+                finally
+                {
+                    CloseHandle(token);
+                }
+            }
+            finally
+            {
+                CloseHandle(process);
+            }
+        }
+    }
+}
@@ -86,14 +86,15 @@ function Get-ExpectedDependencyValue {
     .PARAMETER Module
     The Ansible module.
 
-    .PARAMETER MDTDriveName
-    The MDT drive name.
+    .PARAMETER Graph
+    The application dependency graph returned by New-MDTApplicationDependencyGraph.
+    Each dependency is looked up within the graph by GUID or name.
 
     .PARAMETER Existing
     The existing dependencies.
 
     .EXAMPLE
-    Get-ExpectedDependencyValue -Module $module -MDTDriveName $mdtDrive.Name -Existing $existing
+    Get-ExpectedDependencyValue -Module $module -Graph $graph -Existing $existing
 
     .OUTPUTS
     string[]
@@ -104,7 +105,7 @@ function Get-ExpectedDependencyValue {
         [Parameter(Mandatory = $true)]
         [Ansible.Basic.AnsibleModule]$Module,
         [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName,
+        [System.Collections.Hashtable]$Graph,
         [Parameter(Mandatory = $false)]
         [System.Collections.Hashtable[]]$Existing
     )
@@ -119,9 +120,9 @@ function Get-ExpectedDependencyValue {
 
         foreach ($dependency in $Module.Params.set) {
 
-            $applications = [Array](Get-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Guid $dependency.guid -Name $dependency.name)
+            $node = Get-MDTApplicationDependencyGraphNode -Graph $Graph -Guid $dependency.guid -Name $dependency.name
 
-            if ($null -eq $applications) {
+            if ($null -eq $node) {
 
                 if ($null -ne $dependency.guid) {
                     $Module.FailJson("Dependency with GUID '$($dependency.guid)' does not exist.")
@@ -131,8 +132,8 @@ function Get-ExpectedDependencyValue {
             }
 
             $expectedDependency = @{
-                guid = $applications[0].guid
-                name = $applications[0].Name
+                guid = $node.guid
+                name = $node.name
             }
 
             $expectedDependencies.Add($expectedDependency) | Out-Null
@@ -147,9 +148,9 @@ function Get-ExpectedDependencyValue {
 
         foreach ($dependency in $Module.Params.add) {
 
-            $applications = [Array](Get-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Guid $dependency.guid -Name $dependency.name)
+            $node = Get-MDTApplicationDependencyGraphNode -Graph $Graph -Guid $dependency.guid -Name $dependency.name
 
-            if ($null -eq $applications) {
+            if ($null -eq $node) {
 
                 if ($null -ne $dependency.guid) {
                     $Module.FailJson("Dependency with GUID '$($dependency.guid)' does not exist.")
@@ -159,8 +160,8 @@ function Get-ExpectedDependencyValue {
             }
 
             $addDependency = @{
-                guid = $applications[0].guid
-                name = $applications[0].Name
+                guid = $node.guid
+                name = $node.name
             }
 
             $addDependencies.Add($addDependency) | Out-Null
@@ -173,9 +174,9 @@ function Get-ExpectedDependencyValue {
 
         foreach ($dependency in $Module.Params.remove) {
 
-            $applications = [Array](Get-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Guid $dependency.guid -Name $dependency.name)
+            $node = Get-MDTApplicationDependencyGraphNode -Graph $Graph -Guid $dependency.guid -Name $dependency.name
 
-            if ($null -eq $applications) {
+            if ($null -eq $node) {
 
                 if ($null -ne $dependency.guid) {
 
@@ -185,7 +186,7 @@ function Get-ExpectedDependencyValue {
                         guid = $dependency.guid
                     }
 
-                    $removeDependencies.Add($removeDependencies) | Out-Null
+                    $removeDependencies.Add($removeDependency) | Out-Null
                     continue
                 }
 
@@ -194,8 +195,8 @@ function Get-ExpectedDependencyValue {
             }
 
             $removeDependency = @{
-                guid = $applications[0].guid
-                name = $applications[0].Name
+                guid = $node.guid
+                name = $node.name
             }
 
             $removeDependencies.Add($removeDependency) | Out-Null
@@ -243,6 +244,8 @@ function Set-DependencyValue {
         [Ansible.Basic.AnsibleModule]$Module,
         [Parameter(Mandatory = $true)]
         [string]$MDTDriveName,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Graph,
         [Parameter(Mandatory = $false)]
         [System.Collections.Hashtable[]]$Existing,
         [Parameter(Mandatory = $false)]
@@ -280,8 +283,10 @@ function Set-DependencyValue {
         $application.Item("Dependency") = [System.Object[]]($Expected | ForEach-Object { $_.guid })
     }
 
+    Clear-MDTItemIndex -NodeType "Application"
+
     $applications = Get-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Guid $Module.Params.guid -Name $Module.Params.name
-    $application = $applications | Format-MDTApplication -Module $Module -MDTDriveName $MDTDriveName
+    $application = $applications | Format-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Graph $Graph
     $dependencies = $application.dependencies
 
     $Module.Diff.after = @{ dependencies = $dependencies }
@@ -392,9 +397,11 @@ $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
 
 $module.Result.changed = $false
 
-$applications = Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+$graph = New-MDTApplicationDependencyGraph -Applications (Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name)
 
-if ($null -eq $applications) {
+$application = Get-MDTApplicationDependencyGraphNode -Graph $graph -Guid $module.Params.guid -Name $module.Params.name
+
+if ($null -eq $application) {
 
     if ($null -ne $module.Params.guid) {
         $module.FailJson("Application with GUID '$($module.Params.guid)' does not exist.")
@@ -403,25 +410,40 @@ if ($null -eq $applications) {
     $module.FailJson("Application '$($module.Params.name)' does not exist.")
 }
 
-$application = $applications | Format-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name
-
-$existing = $application.dependencies
+$existing = [System.Collections.Hashtable[]]@($application.dependencies | Format-MDTApplicationDependencyGraphNode -Graph $graph)
 
 $module.Diff.before = @{ dependencies = $existing }
 
-$expected = [System.Collections.Hashtable[]](Get-ExpectedDependencyValue -Module $module -MDTDriveName $mdtDrive.Name -Existing $existing)
+$expected = [System.Collections.Hashtable[]](Get-ExpectedDependencyValue -Module $module -Graph $graph -Existing $existing)
 
 if ($null -eq $expected) {
     $expected = [System.Collections.Hashtable[]]@()
 }
 
-$module.Result.changed = $false
+$graph.Nodes[$application.guid] = @{
+    guid = $application.guid
+    name = $application.name
+    dependencies = [string[]]@($expected | ForEach-Object { $_.guid })
+}
+
+$cycle = [Array](Find-MDTApplicationDependencyCycle -Graph $graph -Guid $application.guid)
+
+if ($null -ne $cycle) {
+
+    $cycleNames = $cycle | Format-MDTApplicationDependencyGraphNode -Graph $graph | ForEach-Object { $_.name }
+    $module.FailJson("The dependencies of application '$($application.name)' would create a dependency cycle: $($cycleNames -join ' -> ').")
+}
+
+$installOrder = [System.Collections.Hashtable[]](Get-MDTApplicationInstallOrder -Graph $graph -Guid $application.guid |
+    Format-MDTApplicationDependencyGraphNode -Graph $graph)
 
 $module.Diff.after = @{ dependencies = $expected }
 $module.Result.application_dependencies = $expected
+$module.Result.transitive_dependencies = [System.Collections.Hashtable[]]@($installOrder | Select-Object -First ($installOrder.Length - 1))
+$module.Result.install_order = $installOrder
 
-Set-DependencyValue -Module $module -MDTDriveName $mdtDrive.Name -Existing $existing -Expected $expected | Out-Null
+Set-DependencyValue -Module $module -MDTDriveName $mdtDrive.Name -Graph $graph -Existing $existing -Expected $expected | Out-Null
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Remove-MDTPSDrive -Module $module | Out-Null
 
 $module.ExitJson()
@@ -12,6 +12,12 @@ author:
 short_description: Creates, updates, or deletes an MDT application dependency
 description:
   - Creates, updates, or deletes an MDT application dependency.
+  - >-
+    A dependency graph is built once from the C(Dependency) lists of every application in the MDT share, and each dependency is
+    looked up within it by GUID or name.
+  - >-
+    The expected dependencies are checked for a dependency cycle before any change is made.  If the change would make the
+    application depend on itself, directly or transitively, the module fails.
 extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode
@@ -138,4 +144,45 @@ application_dependencies:
       type: str
       description:
         - The GUID of the application.
+transitive_dependencies:
+  type: list
+  elements: dict
+  returned: success
+  version_added: 1.3.0
+  description:
+    - Every application the application depends on, directly or transitively, in the order they should be installed.
+  contains:
+    name:
+      type: str
+      description:
+        - The full name of the application.
+        - This is not returned if the application does not exist.
+    guid:
+      type: str
+      description:
+        - The GUID of the application.
+install_order:
+  type: list
+  elements: dict
+  returned: success
+  version_added: 1.3.0
+  description:
+    - The application and every application it depends on, directly or transitively, in the order they should be installed.
+    - Every application is listed after all of its dependencies, and the application itself is listed last.
+  contains:
+    name:
+      type: str
+      description:
+        - The full name of the application.
+        - This is not returned if the application does not exist.
+    guid:
+      type: str
+      description:
+        - The GUID of the application.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -2,6 +2,7 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Application
 
 function Confirm-ApplicationInfoParamsAreValid {
@@ -33,6 +34,49 @@ function Confirm-ApplicationInfoParamsAreValid {
     }
 }
 
+function Add-ApplicationInstallOrderValue {
+    <#
+    .SYNOPSIS
+    Adds the install order of an application to the formatted application.
+
+    .DESCRIPTION
+    This function adds the install order of an application and its transitive dependencies to the formatted
+    application, as 'install_order'.
+    If the dependencies of the application contain a cycle, no install order exists, so 'install_order' is empty and
+    the cycle is added as 'dependency_cycle'.
+
+    .PARAMETER Application
+    The formatted application.
+
+    .PARAMETER Graph
+    The application dependency graph returned by New-MDTApplicationDependencyGraph.
+
+    .EXAMPLE
+    Add-ApplicationInstallOrderValue -Application $application -Graph $graph
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Application,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Graph
+    )
+
+    $cycle = [Array](Find-MDTApplicationDependencyCycle -Graph $Graph -Guid $Application.guid)
+
+    if ($null -ne $cycle) {
+        $Application.install_order = [System.Collections.Hashtable[]]@()
+        $Application.dependency_cycle = [System.Collections.Hashtable[]]($cycle | Format-MDTApplicationDependencyGraphNode -Graph $Graph)
+
+        return
+    }
+
+    $Application.install_order = [System.Collections.Hashtable[]](Get-MDTApplicationInstallOrder -Graph $Graph -Guid $Application.guid |
+        Format-MDTApplicationDependencyGraphNode -Graph $Graph)
+    $Application.dependency_cycle = [System.Collections.Hashtable[]]@()
+}
+
 $spec = @{
     options = @{
         installation_path = @{
@@ -44,6 +88,30 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
+        hash_cache = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        rehash = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        hash_parallelism = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
         guid = @{
             type = 'str'
             required = $false
@@ -52,6 +120,48 @@ $spec = @{
             type = 'str'
             required = $false
         }
+        include_files = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        include_install_order = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        expand_dependencies = @{
+            type = 'str'
+            required = $false
+            default = 'direct'
+            choices = @(
+                'direct',
+                'transitive'
+            )
+        }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'publisher',
+                'short_name',
+                'version',
+                'language',
+                'type',
+                'command_line',
+                'working_directory',
+                'files_path',
+                'comments',
+                'enabled',
+                'hidden',
+                'reboot',
+                'dependencies',
+                'paths'
+            )
+        }
     }
     mutually_exclusive = @(
         , @('name', 'guid')
@@ -65,12 +175,77 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-ApplicationInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
+Open-MDTFileHashSession -Module $module
+
+$expandTransitiveDependencies = $module.Params.expand_dependencies -eq 'transitive'
+$additionalFields = New-Object -TypeName System.Collections.Generic.List[string]
+
+if ($module.Params.include_files) {
+    $additionalFields.Add("files")
+}
+
+if ($expandTransitiveDependencies) {
+    $additionalFields.Add("transitive_dependencies")
+}
+
+$fields = New-MDTReturnFieldSet -Module $module -AdditionalFields $additionalFields.ToArray()
 
-$mdtDrive = Get-MDTPSDrive -Module $module
+# The dependency graph is only needed when a dependency field or the install order is returned.
+$buildGraph = $expandTransitiveDependencies -or
+    $module.Params.include_install_order -or
+    (Test-MDTReturnFieldIsIncluded -Fields $fields -Name "dependencies")
+
+if ($module.Params.read_backend -eq 'control_files') {
+
+    $catalog = Get-MDTControlCatalog -Module $module -ItemType Application
+
+    $formatParameters = @{
+        Module = $module
+        Catalog = $catalog
+        Fields = $fields
+        IncludeFiles = $module.Params.include_files
+        ExpandTransitiveDependencies = $expandTransitiveDependencies
+    }
 
-$application = Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name |
-    Format-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name
+    if ($buildGraph) {
+        $graph = New-MDTApplicationDependencyGraph -Applications $catalog.Items.ToArray()
+        $formatParameters.Graph = $graph
+    }
+
+    $application = Get-MDTControlItem -Module $module -ItemType Application -Guid $module.Params.guid -Name $module.Params.name |
+        Format-MDTControlApplication @formatParameters
+
+    if ($null -ne $application -and $module.Params.include_install_order) {
+        Add-ApplicationInstallOrderValue -Application $application -Graph $graph | Out-Null
+    }
+}
+else {
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module
+
+    $formatParameters = @{
+        Module = $module
+        MDTDriveName = $mdtDrive.Name
+        Fields = $fields
+        IncludeFiles = $module.Params.include_files
+        ExpandTransitiveDependencies = $expandTransitiveDependencies
+    }
+
+    if ($buildGraph) {
+        $graph = New-MDTApplicationDependencyGraph -Applications (Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name)
+        $formatParameters.Graph = $graph
+    }
+
+    $application = Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name |
+        Format-MDTApplication @formatParameters
+
+    if ($null -ne $application -and $module.Params.include_install_order) {
+        Add-ApplicationInstallOrderValue -Application $application -Graph $graph | Out-Null
+    }
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+}
 
 $module.Result.exists = $null -ne $application
 
@@ -78,6 +253,6 @@ if ($null -ne $application) {
     $module.Result.application = $application
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Close-MDTFileHashSession -Module $module
 
 $module.ExitJson()
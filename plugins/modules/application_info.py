@@ -16,6 +16,8 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.file_hash
+  - trippsc2.mdt.read_backend
 options:
   guid:
     type: str
@@ -29,6 +31,68 @@ options:
     description:
       - The full name of the application.
       - This is mutually exclusive with O(guid).  One of the two must be provided.
+  include_files:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether to include the files of the application and their SHA256 checksums in the result.
+      - This only applies to applications with source files.
+  include_install_order:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether to include the install order of the application and its transitive dependencies in the result.
+      - >-
+        The install order is computed from a dependency graph built once from the C(Dependency) lists of every application
+        in the MDT share.
+      - If the dependencies of the application contain a cycle, no install order exists and the cycle is returned instead.
+  expand_dependencies:
+    type: str
+    required: false
+    default: direct
+    choices:
+      - direct
+      - transitive
+    version_added: 1.3.0
+    description:
+      - How to expand the dependencies of the application.
+      - If V(direct), only the applications the application depends on directly are returned in RV(application.dependencies).
+      - >-
+        If V(transitive), every application the application depends on, directly or transitively, is also returned in
+        RV(application.transitive_dependencies).
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - publisher
+      - short_name
+      - version
+      - language
+      - type
+      - command_line
+      - working_directory
+      - files_path
+      - comments
+      - enabled
+      - hidden
+      - reboot
+      - dependencies
+      - paths
+    version_added: 1.3.0
+    description:
+      - The fields of the application to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
+      - >-
+        The fields requested by O(include_files), O(include_install_order), and O(expand_dependencies) are returned
+        regardless of this option.
 """
 
 EXAMPLES = r"""
@@ -41,6 +105,26 @@ EXAMPLES = r"""
   trippsc2.mdt.application_info:
     mdt_share_path: C:\\MDTShare
     guid: "{12345678-1234-1234-1234-123456789012}"
+
+- name: Get application info with the install order of its dependencies
+  trippsc2.mdt.application_info:
+    mdt_share_path: C:\\MDTShare
+    name: Application 1
+    include_install_order: true
+
+- name: Get application info with all of its transitive dependencies
+  trippsc2.mdt.application_info:
+    mdt_share_path: C:\\MDTShare
+    name: Application 1
+    expand_dependencies: transitive
+
+- name: Get only the GUID and dependencies of an application
+  trippsc2.mdt.application_info:
+    mdt_share_path: C:\\MDTShare
+    name: Application 1
+    return_fields:
+      - guid
+      - dependencies
 """
 
 RETURN = r"""
@@ -49,6 +133,21 @@ exists:
   returned: success
   description:
     - Whether the application exists.
+hash_cache:
+  type: dict
+  returned: O(hash_cache=true)
+  version_added: 1.3.0
+  description:
+    - The usage of the file hash cache.
+  contains:
+    hits:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was read from the cache.
+    misses:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was calculated.
 application:
   type: dict
   returned: RV(exists=true)
@@ -133,4 +232,80 @@ application:
           type: str
           description:
             - The GUID of the dependency.
+    transitive_dependencies:
+      type: list
+      elements: dict
+      returned: O(expand_dependencies=transitive)
+      version_added: 1.3.0
+      description:
+        - Every application the application depends on, directly or transitively, in the order they should be installed.
+        - Each application is listed once, even if it is depended on more than once or within a dependency cycle.
+      contains:
+        name:
+          type: str
+          description:
+            - The full name of the dependency.
+            - This is not returned if no application with the GUID exists.
+        guid:
+          type: str
+          description:
+            - The GUID of the dependency.
+    files:
+      type: list
+      elements: dict
+      returned: O(include_files=true)
+      version_added: 1.3.0
+      description:
+        - The list of files in the application source.
+      contains:
+        path:
+          type: str
+          description:
+            - The relative path of the file within the source path.
+        sha256_checksum:
+          type: str
+          description:
+            - The SHA256 checksum of the file.
+    install_order:
+      type: list
+      elements: dict
+      returned: O(include_install_order=true)
+      version_added: 1.3.0
+      description:
+        - The application and every application it depends on, directly or transitively, in the order they should be installed.
+        - Every application is listed after all of its dependencies, and the application itself is listed last.
+        - This is empty if RV(application.dependency_cycle) is not empty.
+      contains:
+        name:
+          type: str
+          description:
+            - The full name of the application.
+            - This is not returned if the application does not exist.
+        guid:
+          type: str
+          description:
+            - The GUID of the application.
+    dependency_cycle:
+      type: list
+      elements: dict
+      returned: O(include_install_order=true)
+      version_added: 1.3.0
+      description:
+        - A dependency cycle reachable from the application, with the first application repeated at the end.
+        - This is empty if there is no cycle.
+      contains:
+        name:
+          type: str
+          description:
+            - The full name of the application.
+        guid:
+          type: str
+          description:
+            - The GUID of the application.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
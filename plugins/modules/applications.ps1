@@ -0,0 +1,315 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Application
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        hash_cache = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        rehash = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        hash_parallelism = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
+        change_detection = @{
+            type = 'str'
+            required = $false
+            default = 'sha256'
+            choices = @(
+                'metadata',
+                'fast_hash',
+                'sha256'
+            )
+        }
+        applications = @{
+            type = 'list'
+            elements = 'dict'
+            required = $true
+            options = @{
+                guid = @{
+                    type = 'str'
+                    required = $false
+                }
+                name = @{
+                    type = 'str'
+                    required = $false
+                }
+                paths = @{
+                    type = 'dict'
+                    required = $false
+                    options = @{
+                        add = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                        remove = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                        set = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                    }
+                    mutually_exclusive = @(
+                        @('add', 'set'),
+                        @('remove', 'set')
+                    )
+                    required_one_of = @(
+                        , @('add', 'remove', 'set')
+                    )
+                }
+                type = @{
+                    type = 'str'
+                    required = $false
+                    choices = @('source', 'no_source', 'bundle')
+                }
+                publisher = @{
+                    type = 'str'
+                    required = $false
+                }
+                short_name = @{
+                    type = 'str'
+                    required = $false
+                }
+                version = @{
+                    type = 'str'
+                    required = $false
+                }
+                language = @{
+                    type = 'str'
+                    required = $false
+                }
+                command_line = @{
+                    type = 'str'
+                    required = $false
+                }
+                working_directory = @{
+                    type = 'path'
+                    required = $false
+                }
+                source_path = @{
+                    type = 'path'
+                    required = $false
+                }
+                destination_folder = @{
+                    type = 'str'
+                    required = $false
+                }
+                comments = @{
+                    type = 'str'
+                    required = $false
+                }
+                enabled = @{
+                    type = 'bool'
+                    required = $false
+                }
+                hidden = @{
+                    type = 'bool'
+                    required = $false
+                }
+                reboot = @{
+                    type = 'bool'
+                    required = $false
+                }
+                state = @{
+                    type = 'str'
+                    required = $false
+                    default = 'present'
+                    choices = @('present', 'absent')
+                }
+            }
+            required_if = @(
+                , @('state', 'present', @('type', 'short_name'))
+            )
+            required_one_of = @(
+                , @('name', 'guid')
+            )
+        }
+    }
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$applicationParams = $module.Params.applications
+
+foreach ($params in $applicationParams) {
+    $params | Confirm-ApplicationParamsAreValid -Module $module | Out-Null
+}
+
+Open-MDTFileHashSession -Module $module
+Import-MDTModule -Module $module | Out-Null
+
+$mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+
+$identifiers = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+$plans = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+foreach ($params in $applicationParams) {
+
+    $existingApplications = [Array](Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -Guid $params.guid -Name $params.name)
+    $existing = $existingApplications | Format-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -IncludeFiles
+
+    $plan = @{
+        Params = $params
+        ExistingApplications = $existingApplications
+        Existing = $existing
+        Expected = $null
+        PropertyChanges = $null
+        Changed = $false
+    }
+
+    if ($params.state -eq "present") {
+
+        $expected = Get-ExpectedApplication -Module $module -Params $params -Existing $existing
+
+        foreach ($path in $expected.paths) {
+
+            $pathSegments = $path -split "\\" | Where-Object { -not [string]::IsNullOrEmpty($_) }
+            $fullPath = @(@("Applications"); $pathSegments) | Get-FullPath -MDTDriveName $mdtDrive.Name
+
+            if (-not (Test-Path -LiteralPath $fullPath -PathType Container)) {
+                $module.FailJson("The directory 'Applications\$($path)' does not exist in the MDT share.")
+            }
+        }
+
+        $plan.Expected = $expected
+
+        if ($null -eq $existing) {
+            $plan.Changed = $true
+        }
+        else {
+
+            $plan.PropertyChanges = Compare-ExpectedApplicationToExisting `
+                -Module $module `
+                -Params $params `
+                -MDTDriveName $mdtDrive.Name `
+                -Expected $expected `
+                -Existing $existing
+
+            $plan.Changed = $plan.PropertyChanges.Count -gt 0
+        }
+
+        $planIdentifiers = @($expected.guid, $expected.name)
+    }
+    elseif ($null -ne $existing) {
+
+        $plan.Changed = $true
+        $planIdentifiers = @($existing.guid, $existing.name)
+    }
+    else {
+        $planIdentifiers = @($params.guid, $params.name)
+    }
+
+    foreach ($identifier in $planIdentifiers) {
+
+        if ([string]::IsNullOrEmpty($identifier)) {
+            continue
+        }
+
+        if (-not $identifiers.Add($identifier)) {
+            $module.FailJson("The application '$($identifier)' is specified more than once in the 'applications' parameter.")
+        }
+    }
+
+    $plans.Add($plan)
+}
+
+$changedPlans = [Array]($plans | Where-Object { $_.Changed })
+
+if ($null -eq $changedPlans) {
+    $changedPlans = @()
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "absent") {
+        Remove-MDTApplication -Module $module -Applications $plan.ExistingApplications | Out-Null
+    }
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "present" -and $null -ne $plan.Existing) {
+
+        $propertyChanges = $plan.PropertyChanges
+        Set-MDTApplication -Module $module -Application $plan.ExistingApplications[0] @propertyChanges | Out-Null
+    }
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "present" -and $null -eq $plan.Existing) {
+        New-MDTApplication -Module $module -Params $plan.Params -MDTDriveName $mdtDrive.Name -Expected $plan.Expected | Out-Null
+    }
+}
+
+$results = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+$before = New-Object -TypeName System.Collections.Generic.List[System.Object]
+$after = New-Object -TypeName System.Collections.Generic.List[System.Object]
+
+foreach ($plan in $plans) {
+
+    $result = @{
+        changed = $plan.Changed
+        state = $plan.Params.state
+    }
+
+    $application = $null
+
+    if ($plan.Params.state -eq "present") {
+
+        $application = $plan.Expected
+
+        if ($plan.Changed -and -not $module.CheckMode) {
+
+            $application = Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -Guid $plan.Expected.guid -Name $plan.Expected.name |
+                Format-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name -IncludeFiles
+        }
+
+        $result.application = $application
+    }
+
+    $result.diff = @{
+        before = $plan.Existing
+        after = $application
+    }
+
+    $results.Add($result)
+    $before.Add($plan.Existing)
+    $after.Add($application)
+}
+
+$module.Result.changed = $changedPlans.Length -gt 0
+$module.Result.applications = $results.ToArray()
+$module.Diff.before = $before.ToArray()
+$module.Diff.after = $after.ToArray()
+
+Remove-MDTPSDrive -Module $module | Out-Null
+
+Close-MDTFileHashSession -Module $module
+
+$module.ExitJson()
@@ -0,0 +1,315 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: applications
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Creates, updates, or deletes multiple MDT applications
+description:
+  - Creates, updates, or deletes multiple MDT applications in a single module run.
+  - >-
+    The MDT share is scanned for applications once, every application is compared with its expected configuration, and then the
+    applications are removed, updated, and created in that order.
+  - >-
+    Every application is validated before any application is changed, so an invalid item does not leave the MDT share
+    partially changed.
+  - Each item of O(applications) accepts the same options as the M(trippsc2.mdt.application) module.
+  - An application must not be specified more than once in O(applications).
+  - This module makes the assumption that a single directory does not contain files for multiple source applications.
+  - This assumption is in-line with how the MDT console works.
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+  - trippsc2.mdt.file_hash
+options:
+  change_detection:
+    type: str
+    required: false
+    default: sha256
+    choices:
+      - metadata
+      - fast_hash
+      - sha256
+    description:
+      - The method used to detect whether the application files in the MDT share differ from the source files.
+      - If V(sha256), the SHA256 checksum of every file is compared.
+      - If V(fast_hash), the sizes and last write times of the files are compared first.
+        The xxHash64 checksums are only calculated and compared for files whose sizes match but last write times differ.
+        xxHash64 is a non-cryptographic hash that is much faster to calculate than SHA256.
+      - If V(metadata), the sizes and last write times of the files are compared.
+        If the sizes match but the last write times differ, the xxHash64 checksums are compared.
+      - The returned C(files) include the values that were used to compare them.
+  applications:
+    type: list
+    required: true
+    elements: dict
+    description:
+      - The applications to create, update, or delete.
+    suboptions:
+      guid:
+        type: str
+        required: false
+        description:
+          - The GUID of the application.
+          - Either O(applications[].name) or O(applications[].guid) must be provided.
+          - The GUID will be used to identify the application.
+          - If O(applications[].state=absent), O(applications[].guid) and O(applications[].name) are mutually exclusive.
+      name:
+        type: str
+        required: false
+        description:
+          - The name of the application.
+          - Either O(applications[].name) or O(applications[].guid) must be provided.
+          - If O(applications[].guid) is not provided, the name will be used to identify the application.
+          - If O(applications[].guid) is provided, it will be used to identify the application and the application's name will be set to the provided value.
+          - >-
+            If not provided, O(applications[].state=present), and the application doesn't already exist, the full name will be created from the O(applications[].publisher),
+            O(applications[].short_name), and O(applications[].version) options.
+          - If O(applications[].state=absent), O(applications[].guid) and O(applications[].name) are mutually exclusive.
+      type:
+        type: str
+        required: false
+        choices:
+          - source
+          - no_source
+          - bundle
+        description:
+          - The type of application.
+          - If O(applications[].state=present), this is required.
+          - If O(applications[].state=absent), this should not be provided.
+      paths:
+        type: dict
+        required: false
+        description:
+          - The expected configuration for paths at which the application should be found.
+          - If not provided and the application does not exist, the application will be placed in the V(Applications) folder.
+          - If not provided and the application exists, the application will not be moved or copied into any folders.
+          - This refers to the logical placement of the application.  For the physical location of application files, see O(applications[].destination_folder).
+        suboptions:
+          add:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of additional paths to add to the application.
+              - These paths are relative to the V(Applications) folder within the MDT share.
+              - This is mutually exclusive with O(applications[].paths.set).
+          remove:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to remove from the application.
+              - These paths are relative to the V(Applications) folder within the MDT share.
+              - This is mutually exclusive with O(applications[].paths.set).
+              - If the application is not found at any other paths than these, the module will fail.  Use O(applications[].state=absent) to remove the application instead.
+          set:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to set for the application.
+              - These paths are relative to the V(Applications) folder within the MDT share.
+              - This is mutually exclusive with O(applications[].paths.add) and O(applications[].paths.remove).
+              - If this is an empty list, the module will fail.  Use O(applications[].state=absent) to remove the application instead.
+      publisher:
+        type: str
+        required: false
+        description:
+          - The publisher of the application.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided, the publisher will be left blank.
+      short_name:
+        type: str
+        required: false
+        description:
+          - The short name of the application, not including the publisher, version, or language information.
+          - If O(applications[].state=absent), this should not be provided.
+          - If O(applications[].state=present), this is required.
+      version:
+        type: str
+        required: false
+        description:
+          - The version of the application.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and O(applications[].state=present), the version will be left blank.
+      language:
+        type: str
+        required: false
+        description:
+          - The language of the application.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and O(applications[].state=present), the language will be left blank.
+      command_line:
+        type: str
+        required: false
+        description:
+          - The command line to run the application.
+          - This is the command line that will be executed when the application is run.
+          - This command will be run from the O(applications[].working_directory).
+          - If O(applications[].state=absent), this should not be provided.
+          - If O(applications[].state=present) and O(applications[].type=bundle), this should not be provided.
+          - If O(applications[].state=present) and O(applications[].type=source) or O(applications[].type=no_source), this is required.
+      working_directory:
+        type: path
+        required: false
+        description:
+          - The working directory for the application.
+          - This is the directory from which the O(applications[].command_line) command will be run.
+          - If a relative path is provided, it will be relative to the MDT share root.
+          - If O(applications[].state=absent), this should not be provided.
+          - If O(applications[].state=absent) and O(applications[].type=bundle), this should not be provided.
+          - If not provided, O(applications[].state=present), and O(applications[].destination_folder) is provided, the working directory will be set to the O(applications[].destination_folder).
+          - If not provided, O(applications[].state=present), and O(applications[].destination_folder) is not provided, the working directory will not be provided.
+      source_path:
+        type: path
+        required: false
+        description:
+          - The source path for the application files.
+          - This should be a directory containing the application files.
+          - If O(applications[].state=absent), this should not be provided.
+          - If O(applications[].state=present) and O(applications[].type=bundle) or O(applications[].type=no_source), this should not be provided.
+          - If O(applications[].state=present) and O(applications[].type=source), this is required.
+      destination_folder:
+        type: str
+        required: false
+        description:
+          - The destination folder for the application files.
+          - This is a folder relative to the V(Applications) folder within the MDT share.
+          - If O(applications[].state=absent), this should not be provided.
+          - If O(applications[].state=present) and O(applications[].type=bundle) or O(applications[].type=no_source), this should not be provided.
+          - >-
+            If not provided, O(applications[].state=present), and O(applications[].type=source), the application files will be placed in a subfolder of the V(Applications) folder
+            named after the full name of the Application.
+          - This refers to the physical location of the application files.  For the logical placement of the application, see O(applications[].paths).
+      comments:
+        type: str
+        required: false
+        description:
+          - Comments about the application.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and the application exists, the comments will not be changed.
+          - If not provided and the application does not exist, the comments will be left blank.
+      enabled:
+        type: bool
+        required: false
+        description:
+          - Whether the application is enabled.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and the application exists, the enabled state will not be changed.
+          - If not provided and the application does not exist, the application will be created enabled.
+      hidden:
+        type: bool
+        required: false
+        description:
+          - Whether the application is hidden.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and the application exists, the hidden state will not be changed.
+          - If not provided and the application does not exist, the application will be created and not be hidden.
+      reboot:
+        type: bool
+        required: false
+        description:
+          - Whether the application requires a reboot.
+          - If O(applications[].state=absent), this should not be provided.
+          - If not provided and the application exists, the reboot state will not be changed.
+          - If not provided and the application does not exist, the application will be created and not require a reboot.
+      state:
+        type: str
+        required: false
+        default: present
+        choices:
+          - present
+          - absent
+        description:
+          - The state of the application.
+          - If V(present), the application will be created or updated.
+          - If V(absent), the application will be removed.
+"""
+
+EXAMPLES = r"""
+- name: Create, update, and remove MDT applications
+  trippsc2.mdt.applications:
+    mdt_share_path: C:\\MDTShare
+    applications:
+      - type: source
+        short_name: 7zip
+        version: '24.09'
+        command_line: 7z2409-x64.exe /S
+        source_path: C:\\Temp\\7zip
+        destination_folder: 7zip 24.09
+      - type: no_source
+        short_name: Notepad++
+        version: '8.7'
+        command_line: npp.8.7.Installer.x64.exe /S
+        working_directory: C:\\Temp\\Notepad++
+      - type: bundle
+        short_name: Base Applications
+      - name: 7zip 23.01
+        state: absent
+"""
+
+RETURN = r"""
+applications:
+  type: list
+  elements: dict
+  returned: success
+  description:
+    - The result for each item of O(applications), in the same order.
+  contains:
+    changed:
+      type: bool
+      description:
+        - Whether the application was changed.
+    state:
+      type: str
+      description:
+        - The state of the application.
+    application:
+      type: dict
+      returned: O(applications[].state=present)
+      description:
+        - The current state of the application.
+        - This has the same structure as the RV(trippsc2.mdt.application#module:application) return value of the M(trippsc2.mdt.application) module.
+    diff:
+      type: dict
+      description:
+        - The state of the application before and after the module run.
+      contains:
+        before:
+          type: dict
+          description:
+            - The state of the application before the module run.
+            - This is V(null) if the application did not exist.
+        after:
+          type: dict
+          description:
+            - The state of the application after the module run.
+            - This is V(null) if O(applications[].state=absent).
+hash_cache:
+  type: dict
+  returned: O(hash_cache=true)
+  description:
+    - The usage of the file hash cache.
+  contains:
+    hits:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was read from the cache.
+    misses:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was calculated.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
+"""
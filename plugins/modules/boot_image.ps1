@@ -2,6 +2,256 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.DeploymentShare
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.BootImage
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Job
+
+function Add-BootImageArtifactResult {
+    <#
+    .SYNOPSIS
+    Adds the x64 boot image artifacts to the top level of the module result.
+
+    .DESCRIPTION
+    This function copies the x64 boot image artifacts from the x64 section of the module result to the top level of
+    the module result, where they were returned before the architectures option was added.
+    If x64 is not one of the architectures, nothing is added.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .EXAMPLE
+    Add-BootImageArtifactResult -Module $module
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module
+    )
+
+    if (-not $Module.Result.ContainsKey("x64")) {
+        return
+    }
+
+    foreach ($artifactName in @("litetouch_wim", "litetouch_iso", "generic_wim", "generic_iso")) {
+
+        if ($Module.Result.x64.ContainsKey($artifactName)) {
+            $Module.Result[$artifactName] = $Module.Result.x64[$artifactName]
+        }
+    }
+}
+
+function Start-BootImageJob {
+    <#
+    .SYNOPSIS
+    Starts a background job that generates the boot images.
+
+    .DESCRIPTION
+    This function starts a background job that generates the boot images of the specified platforms and then writes
+    the boot image fingerprint.
+    The job result contains the same changed, x86, and x64 values as the module result.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Platforms
+    The platforms of the boot images to generate.
+
+    .PARAMETER PlatformStates
+    The state of each platform, keyed by platform.
+
+    .PARAMETER Fingerprint
+    The boot image fingerprint.
+
+    .EXAMPLE
+    Start-BootImageJob -Module $module -Platforms @("x64") -PlatformStates $platformStates -Fingerprint $fingerprint
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string[]]$Platforms,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$PlatformStates,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Fingerprint
+    )
+
+    $mdtSharePath = $Module.Params.mdt_share_path.TrimEnd('\')
+    $jobArtifacts = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+    foreach ($platform in $Platforms) {
+
+        $platformState = $PlatformStates[$platform]
+
+        foreach ($artifact in $platformState.Artifacts) {
+
+            $previousState = $platformState.PreviousStates[$artifact.Name]
+
+            $jobArtifact = @{
+                platform = $platform
+                name = $artifact.Name
+                file_name = $artifact.FileName
+                path = $artifact.Path
+                sha256_hash = $null
+            }
+
+            if ($null -ne $previousState) {
+                $jobArtifact.sha256_hash = $previousState.sha256_hash
+            }
+
+            $jobArtifacts.Add($jobArtifact)
+        }
+
+        $Fingerprint.inputs[$platform] = $platformState.Inputs
+    }
+
+    $parameters = @{
+        installation_path = $Module.Params.installation_path
+        mdt_share_path = $mdtSharePath
+        compress = $Module.Params.compress
+        force = $Module.Params.force
+        platforms = $Platforms
+        artifacts = $jobArtifacts.ToArray()
+        fingerprint = $Fingerprint
+        fingerprint_path = Get-MDTBootImageFingerprintPath -MDTSharePath $mdtSharePath
+    }
+
+    $script = @'
+param (
+    [Parameter(Mandatory = $true)]
+    [System.Object]$Parameters
+)
+
+$ErrorActionPreference = 'Stop'
+
+Import-Module -Name ([System.IO.Path]::Combine($Parameters.installation_path, "Bin", "MicrosoftDeploymentToolkit.psd1")) | Out-Null
+
+function Save-Fingerprint {
+
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Object]$Fingerprint
+    )
+
+    $temporaryPath = "$($Parameters.fingerprint_path).tmp"
+    [System.IO.File]::WriteAllText($temporaryPath, (ConvertTo-Json -InputObject $Fingerprint -Depth 10 -Compress))
+
+    if ([System.IO.File]::Exists($Parameters.fingerprint_path)) {
+        [System.IO.File]::Replace($temporaryPath, $Parameters.fingerprint_path, $null)
+    }
+    else {
+        [System.IO.File]::Move($temporaryPath, $Parameters.fingerprint_path)
+    }
+}
+
+$fingerprint = $Parameters.fingerprint
+
+$mdtDrive = New-PSDrive -Name "DS001" -PSProvider MDTProvider -Root $Parameters.mdt_share_path
+$rootFolder = Get-Item -LiteralPath "$($mdtDrive.Name):\"
+$supportValues = @{}
+
+foreach ($platform in @("x86", "x64")) {
+
+    $enabledProperty = "Support$($platform.ToUpper())"
+    $supportValue = $rootFolder.Item($enabledProperty)
+
+    if ([bool]::Parse($supportValue) -ne ($Parameters.platforms -contains $platform)) {
+        $supportValues[$enabledProperty] = $supportValue
+    }
+}
+
+# The original values are recorded before they are changed, so they are restored by the next module run if this
+# process is killed during the build.
+# The recorded fingerprint does not contain the inputs of the platforms being built, so they are built again then.
+$pendingFingerprint = ConvertTo-Json -InputObject $fingerprint -Depth 10 | ConvertFrom-Json
+
+foreach ($platform in $Parameters.platforms) {
+    $pendingFingerprint.inputs.PSObject.Properties.Remove($platform)
+}
+
+if ($supportValues.Count -gt 0) {
+    $pendingFingerprint | Add-Member -NotePropertyName support_values -NotePropertyValue $supportValues -Force
+    Save-Fingerprint -Fingerprint $pendingFingerprint
+}
+
+try {
+    foreach ($enabledProperty in $supportValues.Keys) {
+        $rootFolder.Item($enabledProperty) = (-not [bool]::Parse($supportValues[$enabledProperty])).ToString()
+    }
+
+    if ($Parameters.force) {
+        Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Force | Out-Null
+    }
+    else {
+        Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Compress:$Parameters.compress | Out-Null
+    }
+}
+finally {
+    foreach ($enabledProperty in $supportValues.Keys) {
+        $rootFolder.Item($enabledProperty) = $supportValues[$enabledProperty]
+    }
+
+    if ($supportValues.Count -gt 0) {
+        $pendingFingerprint.PSObject.Properties.Remove("support_values")
+        Save-Fingerprint -Fingerprint $pendingFingerprint
+    }
+
+    $mdtDrive | Remove-PSDrive | Out-Null
+}
+
+$result = @{
+    changed = $false
+}
+
+foreach ($platform in $Parameters.platforms) {
+    $result[$platform] = @{
+        changed = $false
+    }
+}
+
+foreach ($artifact in $Parameters.artifacts) {
+
+    $file = New-Object -TypeName System.IO.FileInfo -ArgumentList $artifact.path
+
+    if (-not $file.Exists) {
+        throw "Boot image artifact '$($artifact.path)' was not generated."
+    }
+
+    $sha256Hash = (Get-FileHash -LiteralPath $file.FullName -Algorithm SHA256).Hash
+
+    if ($sha256Hash -ne $artifact.sha256_hash) {
+        $result.changed = $true
+        $result[$artifact.platform].changed = $true
+    }
+
+    $result[$artifact.platform][$artifact.name] = @{
+        path = $artifact.path
+        sha256_hash = $sha256Hash
+    }
+
+    $state = @{
+        size = $file.Length.ToString()
+        last_write_time = $file.LastWriteTimeUtc.Ticks.ToString()
+        sha256_hash = $sha256Hash
+    }
+
+    $fingerprint.artifacts | Add-Member -NotePropertyName $artifact.file_name -NotePropertyValue $state -Force
+}
+
+Save-Fingerprint -Fingerprint $fingerprint
+
+return $result
+'@
+
+    return Start-MDTJob -Module $Module -Name "boot_image" -Key $mdtSharePath -Script $script -Parameters $parameters
+}
 
 $spec = @{
     options = @{
@@ -24,159 +274,296 @@ $spec = @{
             required = $false
             default = $false
         }
+        detach = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        architectures = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            default = @(
+                'x64'
+            )
+            choices = @(
+                'x86',
+                'x64'
+            )
+        }
     }
-    supports_check_mode = $false
+    supports_check_mode = $true
 }
 
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
-Import-MDTModule -Module $module | Out-Null
-
 $compress = $module.Params.compress
 $force = $module.Params.force
 $mdtSharePath = $module.Params.mdt_share_path
 
-$mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+if (-not (Test-Path -LiteralPath $mdtSharePath.TrimEnd('\') -PathType Container)) {
+    $module.FailJson("MDT share path '$($mdtSharePath.TrimEnd('\'))' does not exist.")
+}
 
-$rootFolder = Get-Item -LiteralPath "$($mdtDrive.Name):\"
+$fingerprint = Get-MDTBootImageFingerprint -Module $module
+$restoredSupportValues = @{}
+
+# Platform support settings left changed by an interrupted build are restored before the settings are read, unless the
+# build is still running in a background job.
+if ($null -eq (Get-MDTActiveJob -Module $module -Key $mdtSharePath.TrimEnd('\'))) {
+    $restoredSupportValues = Restore-MDTBootImagePlatformSupport -Module $module -Fingerprint $fingerprint
+}
+
+$settings = Get-MDTControlSettings -Module $module
+
+if ($null -eq $settings) {
+    $module.FailJson("MDT share path '$($mdtSharePath)' does not contain a Settings.xml control file.")
+}
+
+foreach ($enabledProperty in $restoredSupportValues.Keys) {
+    $settings[$enabledProperty] = $restoredSupportValues[$enabledProperty]
+}
 
-$useLiteTouchISO = [bool]::Parse($rootFolder.Item('Boot.x64.GenerateLiteTouchISO'))
-$useGenericISO = [bool]::Parse($rootFolder.Item('Boot.x64.GenerateGenericISO'))
-$useGenericWIM = [bool]::Parse($rootFolder.Item('Boot.x64.GenerateGenericWIM'))
+$deploymentShare = $settings | Format-MDTDeploymentShare
 
-$liteTouchISOFilename = $rootFolder.Item('Boot.x64.LiteTouchISOName')
-$genericISOFilename = $rootFolder.Item('Boot.x64.GenericISOName')
+$architectures = New-Object -TypeName System.Collections.Generic.List[string]
 
-$liteTouchWIMPath = "$($mdtSharePath)\Boot\LiteTouchPE_x64.wim"
-$liteTouchISOPath = "$($mdtSharePath)\Boot\$($liteTouchISOFilename)"
-$genericWIMPath = "$($mdtSharePath)\Boot\Generic_x64.wim"
-$genericISOPath = "$($mdtSharePath)\Boot\$($genericISOFilename)"
+foreach ($platform in @("x86", "x64")) {
+
+    if ($module.Params.architectures -notcontains $platform) {
+        continue
+    }
+
+    if (-not $deploymentShare[$platform].enabled) {
+        $module.FailJson("Architecture '$($platform)' is not enabled on the MDT share '$($mdtSharePath)'.")
+    }
+
+    $architectures.Add($platform)
+}
+
+if ($architectures.Count -eq 0) {
+    $module.FailJson("At least one architecture must be specified.")
+}
 
 $module.Diff.before = @{}
 $module.Diff.after = @{}
 
-if (Test-Path -LiteralPath $liteTouchWIMPath) {
-    $previousLiteTouchWIMHash = Get-FileHash -LiteralPath $liteTouchWIMPath -Algorithm SHA256
-    $module.Diff.before.litetouch_wim = @{
-        path = $liteTouchWIMPath
-        sha256_hash = $previousLiteTouchWIMHash.Hash
+$module.Result.changed = $false
+$module.Result.changed_inputs = @{}
+
+$platformStates = @{}
+$stalePlatforms = New-Object -TypeName System.Collections.Generic.List[string]
+
+foreach ($platform in $architectures) {
+
+    $platformState = @{
+        Artifacts = Get-MDTBootImageArtifact -MDTSharePath $mdtSharePath -RootFolder $settings -Platform $platform
+        Inputs = Get-MDTBootImageInput -Module $module -Settings $settings -Platform $platform
+        PreviousStates = @{}
+        Stale = $force
     }
-}
 
-if ((Test-Path -LiteralPath $liteTouchISOPath) -and $useLiteTouchISO) {
-    $previousLiteTouchISOHash = Get-FileHash -LiteralPath $liteTouchISOPath -Algorithm SHA256
-    $module.Diff.before.litetouch_iso = @{
-        path = $liteTouchISOPath
-        sha256_hash = $previousLiteTouchISOHash.Hash
+    $changedInputs = Compare-MDTBootImageInput -CurrentInput $platformState.Inputs -KnownInput $fingerprint.inputs[$platform]
+
+    if ($changedInputs.Length -gt 0) {
+        $platformState.Stale = $true
     }
-}
 
-if ((Test-Path -LiteralPath $genericWIMPath) -and $useGenericWIM) {
-    $previousGenericWIMHash = Get-FileHash -LiteralPath $genericWIMPath -Algorithm SHA256
-    $module.Diff.before.generic_wim = @{
-        path = $genericWIMPath
-        sha256_hash = $previousGenericWIMHash.Hash
+    $module.Result.changed_inputs[$platform] = $changedInputs
+
+    $before = @{}
+
+    foreach ($artifact in $platformState.Artifacts) {
+
+        $knownState = $fingerprint.artifacts[$artifact.FileName]
+        $previousState = Get-MDTBootImageArtifactState -Path $artifact.Path -KnownState $knownState
+
+        if ($null -eq $previousState) {
+            $platformState.Stale = $true
+            continue
+        }
+
+        if ($null -eq $knownState -or $knownState.sha256_hash -ne $previousState.sha256_hash) {
+            $platformState.Stale = $true
+        }
+
+        $platformState.PreviousStates[$artifact.Name] = $previousState
+        $before[$artifact.Name] = @{
+            path = $artifact.Path
+            sha256_hash = $previousState.sha256_hash
+        }
     }
-}
 
-if ((Test-Path -LiteralPath $genericISOPath) -and $useGenericISO) {
-    $previousGenericISOHash = Get-FileHash -LiteralPath $genericISOPath -Algorithm SHA256
-    $module.Diff.before.generic_iso = @{
-        path = $genericISOPath
-        sha256_hash = $previousGenericISOHash.Hash
+    if ($before.Count -gt 0) {
+        $module.Diff.before[$platform] = $before
     }
+
+    $module.Result[$platform] = @{
+        changed = $false
+    }
+
+    foreach ($artifactName in $before.Keys) {
+        $module.Result[$platform][$artifactName] = $before[$artifactName]
+    }
+
+    if ($platformState.Stale) {
+        $stalePlatforms.Add($platform)
+    }
+
+    $platformStates[$platform] = $platformState
 }
 
 if ($module.Diff.before.Count -eq 0) {
     $module.Diff.before = $null
 }
 
-$module.Result.changed = $false
+if ($stalePlatforms.Count -eq 0) {
 
-if ($force) {
-    Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Force | Out-Null
-}
-else {
-    Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Compress:$compress | Out-Null
+    foreach ($platform in $architectures) {
+        $module.Diff.after[$platform] = $module.Diff.before[$platform]
+    }
+
+    Add-BootImageArtifactResult -Module $module
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+
+    $module.ExitJson()
 }
 
-$liteTouchWIMHash = Get-FileHash -LiteralPath $liteTouchWIMPath -Algorithm SHA256
+if ($module.CheckMode) {
+
+    foreach ($platform in $stalePlatforms) {
+        $module.Result[$platform].changed = $true
+    }
 
-if ($null -eq $previousLiteTouchWIMHash) {
     $module.Result.changed = $true
+    $module.Diff.after = $null
+
+    Add-BootImageArtifactResult -Module $module
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+
+    $module.ExitJson()
 }
-elseif ($previousLiteTouchWIMHash.Hash -ne $liteTouchWIMHash.Hash) {
+
+if ($module.Params.detach) {
+
+    $job = Start-BootImageJob -Module $module -Platforms $stalePlatforms.ToArray() -PlatformStates $platformStates -Fingerprint $fingerprint
+
+    foreach ($platform in $stalePlatforms) {
+        $module.Result[$platform].changed = $true
+    }
+
     $module.Result.changed = $true
+    $module.Result.job_id = $job.id
+    $module.Diff.after = $null
+
+    Add-BootImageArtifactResult -Module $module
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+
+    $module.ExitJson()
 }
 
-$litetouchWIM = @{
-    path = $liteTouchWIMPath
-    sha256_hash = $liteTouchWIMHash.Hash
+# Background jobs of this module and the import_drivers module lock the MDT share, so the boot images are not generated
+# while one is running.
+$activeJob = Get-MDTActiveJob -Module $module -Key $mdtSharePath.TrimEnd('\')
+
+if ($null -ne $activeJob) {
+    $module.FailJson("A $($activeJob.name) job is already running for '$($activeJob.key)' with ID '$($activeJob.id)'.")
 }
 
-$module.Result.litetouch_wim = $litetouchWIM
-$module.Diff.after.litetouch_wim = $litetouchWIM
+Import-MDTModule -Module $module | Out-Null
+
+$mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+
+$rootFolder = Get-Item -LiteralPath "$($mdtDrive.Name):\"
+$supportValues = @{}
 
-if ($useLiteTouchISO) {
+foreach ($platform in @("x86", "x64")) {
 
-    $liteTouchISOHash = Get-FileHash -LiteralPath $liteTouchISOPath -Algorithm SHA256
+    $enabledProperty = "Support$($platform.ToUpper())"
+    $supportValue = $rootFolder.Item($enabledProperty)
 
-    if ($null -eq $previousLiteTouchISOHash) {
-        $module.Result.changed = $true
+    if ([bool]::Parse($supportValue) -ne $stalePlatforms.Contains($platform)) {
+        $supportValues[$enabledProperty] = $supportValue
     }
-    elseif ($previousLiteTouchISOHash.Hash -ne $liteTouchISOHash.Hash) {
-        $module.Result.changed = $true
+}
+
+# The original values are recorded before they are changed, so they are restored by the next run if this process is
+# killed during the build.
+if ($supportValues.Count -gt 0) {
+    $fingerprint.support_values = $supportValues
+    Save-MDTBootImageFingerprint -Module $module -Fingerprint $fingerprint | Out-Null
+}
+
+try {
+    foreach ($enabledProperty in $supportValues.Keys) {
+        $rootFolder.Item($enabledProperty) = (-not [bool]::Parse($supportValues[$enabledProperty])).ToString()
     }
 
-    $litetouchISO = @{
-        path = $liteTouchISOPath
-        sha256_hash = $liteTouchISOHash.Hash
+    if ($force) {
+        Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Force | Out-Null
+    }
+    else {
+        Update-MDTDeploymentShare -Path "$($mdtDrive.Name):" -Compress:$compress | Out-Null
+    }
+}
+finally {
+    foreach ($enabledProperty in $supportValues.Keys) {
+        $rootFolder.Item($enabledProperty) = $supportValues[$enabledProperty]
     }
 
-    $module.Result.litetouch_iso = $litetouchISO
-    $module.Diff.after.litetouch_iso = $litetouchISO
+    if ($supportValues.Count -gt 0) {
+        $fingerprint.Remove("support_values")
+        Save-MDTBootImageFingerprint -Module $module -Fingerprint $fingerprint | Out-Null
+    }
 }
 
-if ($useGenericWIM) {
+foreach ($platform in $architectures) {
 
-    $genericWIMHash = Get-FileHash -LiteralPath $genericWIMPath -Algorithm SHA256
+    $platformState = $platformStates[$platform]
 
-    if ($null -eq $previousGenericWIMHash) {
-        $module.Result.changed = $true
-    }
-    elseif ($previousGenericWIMHash.Hash -ne $genericWIMHash.Hash) {
-        $module.Result.changed = $true
+    if (-not $stalePlatforms.Contains($platform)) {
+        $module.Diff.after[$platform] = $module.Diff.before[$platform]
+        continue
     }
 
-    $genericWIM = @{
-        path = $genericWIMPath
-        sha256_hash = $genericWIMHash.Hash
-    }
+    $after = @{}
 
-    $module.Result.generic_wim = $genericWIM
-    $module.Diff.after.generic_wim = $genericWIM
-}
+    foreach ($artifact in $platformState.Artifacts) {
 
-if ($useGenericISO) {
+        $previousState = $platformState.PreviousStates[$artifact.Name]
+        $state = Get-MDTBootImageArtifactState -Path $artifact.Path -KnownState $previousState
 
-    $genericISOHash = Get-FileHash -LiteralPath $genericISOPath -Algorithm SHA256
+        if ($null -eq $state) {
+            $module.FailJson("Boot image artifact '$($artifact.Path)' was not generated.")
+        }
 
-    if ($null -eq $previousGenericISOHash) {
-        $module.Result.changed = $true
-    }
-    elseif ($previousGenericISOHash.Hash -ne $genericISOHash.Hash) {
-        $module.Result.changed = $true
-    }
+        if ($null -eq $previousState -or $previousState.sha256_hash -ne $state.sha256_hash) {
+            $module.Result[$platform].changed = $true
+            $module.Result.changed = $true
+        }
 
-    $genericISO = @{
-        path = $genericISOPath
-        sha256_hash = $genericISOHash.Hash
+        $artifactResult = @{
+            path = $artifact.Path
+            sha256_hash = $state.sha256_hash
+        }
+
+        $module.Result[$platform][$artifact.Name] = $artifactResult
+        $after[$artifact.Name] = $artifactResult
+
+        $fingerprint.artifacts[$artifact.FileName] = $state
     }
 
-    $module.Result.generic_iso = $genericISO
-    $module.Diff.after.generic_iso = $genericISO
+    $module.Diff.after[$platform] = $after
+    $fingerprint.inputs[$platform] = $platformState.Inputs
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Save-MDTBootImageFingerprint -Module $module -Fingerprint $fingerprint
+
+Add-BootImageArtifactResult -Module $module
+
+Remove-MDTPSDrive -Module $module | Out-Null
 
 $module.ExitJson()
@@ -15,12 +15,46 @@ description:
   - >-
     This module cannot be guaranteed to be idempotent.  The boot image SHA256 hash is used to determine if the boot image was changed,
     but changes are not necessarily meaningful.
-  - This module only accounts for x64 boot images, as there are no supported x86 Windows versions.
+  - >-
+    Only the boot images of the platforms in O(architectures) are generated.
+    Other platforms enabled on the MDT share are disabled while the boot images are generated and are not changed.
+    Their original settings are recorded in C(BootImageFingerprint.json) before they are disabled, so that if the build
+    is interrupted, the next run of the module restores them.
+  - >-
+    After each build, the size, last write time, and SHA256 hash of each boot image artifact are written to the
+    C(BootImageFingerprint.json) file in the C(Boot) directory of the MDT share.
+    If the size and last write time of an artifact still match, the recorded hash is used instead of re-reading the artifact.
+  - >-
+    A digest of each input to the boot image of each generated platform is also recorded after each build.
+    The inputs are the C(Boot.x86.*) or C(Boot.x64.*) settings, the drivers resolved from the selection profile and
+    included driver classes, C(Bootstrap.ini), the extra directory, the background file, and the C(Scripts) directory.
+    Files are compared by size and last write time.
+  - >-
+    The boot image of a platform is only regenerated if one of its inputs has changed since the last build or one of its
+    artifacts is missing or has changed.
+  - >-
+    The inputs and artifacts are read directly from the MDT share, so the MDT PowerShell module is only imported and
+    an MDT PowerShell drive is only mounted if a boot image is regenerated without O(detach=true).
+  - >-
+    In check mode, the module reports a change if the boot image would be regenerated.
 extends_documentation_fragment:
   - trippsc2.mdt.action_group
-  - trippsc2.mdt.check_mode_none
+  - trippsc2.mdt.check_mode
   - trippsc2.mdt.common
 options:
+  architectures:
+    type: list
+    elements: str
+    required: false
+    default:
+      - x64
+    choices:
+      - x86
+      - x64
+    version_added: 1.3.0
+    description:
+      - The platforms of the boot images to generate.
+      - Each platform must be enabled on the MDT share.
   compress:
     type: bool
     required: false
@@ -28,12 +62,30 @@ options:
     description:
       - Whether to compress the boot image.
       - When O(force=true), this option is ignored.
+  detach:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether to generate the boot images in a background job.
+      - >-
+        If V(true) and a boot image needs to be regenerated, the module returns as soon as the job has started and
+        reports a change.
+        The ID of the job is returned in RV(job_id) and its progress and result can be retrieved with the
+        M(trippsc2.mdt.job_info) module.
+      - The job result contains C(changed), C(x86), and C(x64), as returned by this module when O(detach=false).
+      - The boot image fingerprint is written by the job once the boot images have been generated.
+      - >-
+        Only one background job of this module or M(trippsc2.mdt.import_drivers) may run for an MDT share at a time.
+        If one is already running, the module fails, whether or not O(detach=true).
   force:
     type: bool
     required: false
     default: false
     description:
       - Whether to discard the existing boot image and create a new one.
+      - If V(true), the boot image is regenerated even if no input has changed.
 """
 
 EXAMPLES = r"""
@@ -48,6 +100,14 @@ EXAMPLES = r"""
     mdt_share_path: C:\\DeploymentShare
     compress: true
 
+- name: Generate x86 and x64 boot images
+  trippsc2.mdt.boot_image:
+    installation_path: C:\\Program Files\\Microsoft Deployment Toolkit
+    mdt_share_path: C:\\DeploymentShare
+    architectures:
+      - x86
+      - x64
+
 - name: Re-generate boot image
   trippsc2.mdt.boot_image:
     installation_path: C:\\Program Files\\Microsoft Deployment Toolkit
@@ -56,11 +116,30 @@ EXAMPLES = r"""
 """
 
 RETURN = r"""
-litetouch_wim:
+job_id:
+  type: str
+  returned: O(detach=true) and changed
+  description:
+    - The ID of the background job generating the boot images.
+changed_inputs:
   type: dict
   returned: success
   description:
-    - The LiteTouch WIM file information.
+    - The inputs to the boot image that changed since the last build, keyed by platform.
+    - Only the platforms in O(architectures) are included.
+    - >-
+      The possible inputs are V(settings), V(drivers), V(bootstrap), V(extra_directory), V(background_file), and
+      V(scripts).
+    - If no build has been recorded, every input is listed.
+  sample:
+    x64:
+      - drivers
+      - scripts
+litetouch_wim:
+  type: dict
+  returned: x64 in O(architectures)
+  description:
+    - The x64 LiteTouch WIM file information.
   contains:
     path:
       type: str
@@ -72,9 +151,9 @@ litetouch_wim:
         - The current SHA256 hash of the LiteTouch WIM file.
 litetouch_iso:
   type: dict
-  returned: success
+  returned: x64 in O(architectures)
   description:
-    - The LiteTouch ISO file information.
+    - The x64 LiteTouch ISO file information.
     - This is only included if the LiteTouch ISO is generated.
   contains:
     path:
@@ -87,9 +166,9 @@ litetouch_iso:
         - The current SHA256 hash of the LiteTouch ISO file.
 generic_wim:
   type: dict
-  returned: success
+  returned: x64 in O(architectures)
   description:
-    - The generic WIM file information.
+    - The x64 generic WIM file information.
     - This is only included if the generic WIM is generated.
   contains:
     path:
@@ -102,9 +181,9 @@ generic_wim:
         - The current SHA256 hash of the generic WIM file.
 generic_iso:
   type: dict
-  returned: success
+  returned: x64 in O(architectures)
   description:
-    - The generic ISO file information.
+    - The x64 generic ISO file information.
     - This is only included if the generic ISO is generated.
   contains:
     path:
@@ -115,4 +194,140 @@ generic_iso:
       type: str
       description:
         - The current SHA256 hash of the generic ISO file.
+x86:
+  type: dict
+  returned: x86 in O(architectures)
+  description:
+    - The x86 boot image information.
+  contains:
+    changed:
+      type: bool
+      description:
+        - Whether the x86 boot image was changed.
+    litetouch_wim:
+      type: dict
+      description:
+        - The LiteTouch WIM file information.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the LiteTouch WIM file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the LiteTouch WIM file.
+    litetouch_iso:
+      type: dict
+      description:
+        - The LiteTouch ISO file information.
+        - This is only included if the LiteTouch ISO is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the LiteTouch ISO file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the LiteTouch ISO file.
+    generic_wim:
+      type: dict
+      description:
+        - The generic WIM file information.
+        - This is only included if the generic WIM is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the generic WIM file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the generic WIM file.
+    generic_iso:
+      type: dict
+      description:
+        - The generic ISO file information.
+        - This is only included if the generic ISO is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the generic ISO file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the generic ISO file.
+x64:
+  type: dict
+  returned: x64 in O(architectures)
+  description:
+    - The x64 boot image information.
+  contains:
+    changed:
+      type: bool
+      description:
+        - Whether the x64 boot image was changed.
+    litetouch_wim:
+      type: dict
+      description:
+        - The LiteTouch WIM file information.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the LiteTouch WIM file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the LiteTouch WIM file.
+    litetouch_iso:
+      type: dict
+      description:
+        - The LiteTouch ISO file information.
+        - This is only included if the LiteTouch ISO is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the LiteTouch ISO file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the LiteTouch ISO file.
+    generic_wim:
+      type: dict
+      description:
+        - The generic WIM file information.
+        - This is only included if the generic WIM is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the generic WIM file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the generic WIM file.
+    generic_iso:
+      type: dict
+      description:
+        - The generic ISO file information.
+        - This is only included if the generic ISO is generated.
+      contains:
+        path:
+          type: str
+          description:
+            - The path to the generic ISO file.
+        sha256_hash:
+          type: str
+          description:
+            - The current SHA256 hash of the generic ISO file.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
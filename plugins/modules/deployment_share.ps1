@@ -80,12 +80,17 @@ function Get-ExpectedDeploymentShare {
 
     if ($null -eq $Existing) {
 
+        $persistentNames = New-Object -TypeName 'System.Collections.Generic.HashSet[string]' -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+
+        foreach ($persistentDrive in (Get-MDTPersistentDriveList)) {
+            $persistentNames.Add($persistentDrive.Name) | Out-Null
+        }
+
         for ($i = 1; $i -lt 1000; $i++) {
 
             $name = "DS$($i.ToString().PadLeft(3, '0'))"
-            $matchingDrive = Get-MDTPersistentDrive | Where-Object { $_.Name -ieq $name }
 
-            if ($null -eq $matchingDrive) {
+            if (-not $persistentNames.Contains($name)) {
                 break
             }
         }
@@ -248,10 +253,12 @@ function Add-DeploymentShare {
         New-Item -Path $path -ItemType Directory -Force | Out-Null
     }
 
-    New-PSDrive -Name $name -PSProvider MDTProvider -Root $path -Scope Global -Description $description -NetworkPath $uncPath |
+    New-MDTPSDrive -Module $Module -Name $name -Description $description -NetworkPath $uncPath |
         Add-MDTPersistentDrive |
         Out-Null
 
+    Clear-MDTPersistentDriveList
+
     $rootFolder = Get-Item -LiteralPath "$($name):\"
 
     $Module.Result.description = $rootFolder.Item("Description")
@@ -289,6 +296,8 @@ function Remove-DeploymentShare {
     }
 
     Remove-MDTPersistentDrive -Name $Name | Out-Null
+
+    Clear-MDTPersistentDriveList
 }
 
 $spec = @{
@@ -369,4 +378,6 @@ elseif ($state -eq 'absent') {
     }
 }
 
+Remove-MDTPSDrive -Module $module | Out-Null
+
 $module.ExitJson()
@@ -81,4 +81,10 @@ unc_path:
   returned: O(state=present)
   description:
     - The UNC share path of the deployment share.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
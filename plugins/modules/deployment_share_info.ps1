@@ -2,7 +2,9 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.DeploymentShare
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Worker
 
 function Confirm-DeploymentShareInfoParamsAreValid {
     <#
@@ -45,6 +47,25 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
+        use_worker = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        worker_idle_timeout = @{
+            type = 'int'
+            required = $false
+            default = 600
+        }
     }
     supports_check_mode = $true
 }
@@ -52,13 +73,61 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-DeploymentShareInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
 
-$mdtDrive = Get-MDTDeploymentShareDrive -Module $module
+if ($module.Params.read_backend -eq 'control_files') {
+
+    $deploymentShare = Get-MDTControlSettings -Module $module |
+        Format-MDTDeploymentShare -IncludeDescription -IncludeUNCPath -IncludeMonitor -IncludeDatabase
+}
+elseif ($module.Params.use_worker) {
+
+    # The root folder is read within the MDT worker, so only its properties are returned and formatted here.
+    $script = {
+        param ($Parameters, $Context)
+
+        $persistentDrive = Get-MDTPersistentDrive | Where-Object { $_.Path -ieq $Context.MDTSharePath } | Select-Object -First 1
+
+        if ($null -eq $persistentDrive) {
+            return $null
+        }
+
+        $rootFolder = Get-Item -LiteralPath "$($Context.DriveName):\" -ErrorAction SilentlyContinue
+
+        if ($null -eq $rootFolder -or $rootFolder.NodeType -ne "RootFolder") {
+            return $null
+        }
 
-$deploymentShare = $mdtDrive |
-    Get-MDTDeploymentShareRootFolder -Module $module |
-    Format-MDTDeploymentShare -IncludeDescription -IncludeUNCPath -IncludeMonitor -IncludeDatabase
+        $properties = @{
+            NodeType = "RootFolder"
+        }
+
+        foreach ($name in $Parameters.property_names) {
+            $properties[$name] = $rootFolder.Item($name)
+        }
+
+        return $properties
+    }
+
+    $parameters = @{
+        property_names = Get-MDTDeploymentSharePropertyName
+    }
+
+    $deploymentShare = Invoke-MDTWorkerScript -Module $module -Script $script.ToString() -Parameters $parameters |
+        Format-MDTDeploymentShare -IncludeDescription -IncludeUNCPath -IncludeMonitor -IncludeDatabase
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+}
+else {
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTDeploymentShareDrive -Module $module
+
+    $deploymentShare = $mdtDrive |
+        Get-MDTDeploymentShareRootFolder -Module $module |
+        Format-MDTDeploymentShare -IncludeDescription -IncludeUNCPath -IncludeMonitor -IncludeDatabase
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+}
 
 $module.Result.exists = $null -ne $deploymentShare
 
@@ -66,8 +135,4 @@ if ($null -ne $deploymentShare) {
     $module.Result.deployment_share = $deploymentShare
 }
 
-if ($null -ne $mdtDrive) {
-    $mdtDrive | Remove-PSDrive | Out-Null
-}
-
 $module.ExitJson()
@@ -12,16 +12,51 @@ author:
 short_description: Gets information about an MDT deployment share
 description:
   - Gets information about an MDT deployment share.
+  - O(use_worker) and O(worker_idle_timeout) are ignored if O(read_backend=control_files).
 extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.read_backend
+options:
+  use_worker:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether the MDT share is read through the MDT worker of the MDT share.
+      - The MDT worker is a PowerShell process on the host that keeps the MDT PowerShell module imported and an MDT PowerShell drive mounted between runs of this module.
+        Runs that use it do not pay the cost of loading the MDT PowerShell module and mounting the MDT share again.
+      - Only this module uses the MDT worker.
+        Other modules of the collection import the MDT PowerShell module within the module process.
+      - If no MDT worker is running for the MDT share, one is started.
+        This module sends requests to it over a named pipe that is local to the host.
+      - Only the user that started the MDT worker, SYSTEM, and the Administrators group may connect to the named pipe.
+        A request is only sent if the process serving the named pipe runs as the current user or SYSTEM.
+      - If a file within the C(Control) directory of the MDT share has changed since the MDT worker last mounted the MDT share, the MDT PowerShell module is imported and the MDT share is mounted again before the request is handled.
+      - If the MDT worker cannot be started, reached, or trusted, the MDT share is read within the module process and a warning is returned.
+      - If V(false), the MDT share is read within the module process.
+  worker_idle_timeout:
+    type: int
+    required: false
+    default: 600
+    version_added: 1.3.0
+    description:
+      - The number of seconds an MDT worker waits for a request before it exits.
+      - This only applies when the module starts a new MDT worker.
+        An MDT worker that is already running keeps the idle timeout it was started with.
 """
 
 EXAMPLES = r"""
 - name: Get MDT deployment share info
   trippsc2.mdt.deployment_share_info:
     mdt_share_path: C:\\MDTShare
+
+- name: Get MDT deployment share info through the MDT worker
+  trippsc2.mdt.deployment_share_info:
+    mdt_share_path: C:\\MDTShare
+    use_worker: true
 """
 
 RETURN = r"""
@@ -317,4 +352,32 @@ deployment_share:
           returned: RV(deployment_share.x64.enabled=true)
           description:
             - The x64 selection profile.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
+mdt_worker:
+  type: dict
+  returned: O(use_worker=true) and the MDT worker read the MDT share
+  description:
+    - The MDT worker that read the MDT share.
+  contains:
+    pid:
+      type: int
+      description:
+        - The process ID of the MDT worker.
+    started:
+      type: bool
+      description:
+        - Whether the MDT worker was started by this module run.
+    invalidated:
+      type: bool
+      description:
+        - Whether the MDT worker imported the MDT PowerShell module and mounted the MDT share again, because a file within the C(Control) directory of the MDT share changed.
+  sample:
+    pid: 4120
+    started: false
+    invalidated: false
 """
@@ -1773,6 +1773,6 @@ if ($propertyChanges.Count -gt 0) {
     Set-MDTDeploymentShareSettingsValue -Module $module -MDTDrive $mdtDrive @propertyChanges
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Remove-MDTPSDrive -Module $module | Out-Null
 
 $module.ExitJson()
@@ -562,4 +562,10 @@ deployment_share:
           returned: RV(deployment_share.x64.enabled=true)
           description:
             - The x64 selection profile.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
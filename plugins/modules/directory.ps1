@@ -128,6 +128,7 @@ function Remove-MDTDirectory {
     }
 
     Remove-Item -LiteralPath $fullPath -Recurse -Force | Out-Null
+    Clear-MDTItemIndex
 
     if (Test-Path -LiteralPath $fullPath -PathType Container) {
         $Module.FailJson("Failed to remove directory '$($fullPath)'.")
@@ -184,6 +185,6 @@ else {
     $module.FailJson("Invalid state '$state'.")
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Remove-MDTPSDrive -Module $module | Out-Null
 
 $module.ExitJson()
@@ -51,4 +51,10 @@ EXAMPLES = r"""
 """
 
 RETURN = r"""
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
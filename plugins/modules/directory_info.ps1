@@ -2,12 +2,35 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Application
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Driver
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.OperatingSystem
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.SelectionProfile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.TaskSequence
 
+$script:mdtFolderTypes = @{
+    ApplicationFolder = "application_folder"
+    DriverFolder = "driver_folder"
+    LinkedDeploymentShareFolder = "linked_deployment_share_folder"
+    MediaFolder = "media_folder"
+    OperatingSystemFolder = "operating_system_folder"
+    PackageFolder = "package_folder"
+    SelectionProfileFolder = "selection_profile_folder"
+    TaskSequenceFolder = "task_sequence_folder"
+}
+
+$script:mdtItemTypes = @{
+    application = "Application"
+    driver = "Driver"
+    linked_deployment_share = "LinkedDeploymentShare"
+    media = "Media"
+    operating_system = "OperatingSystem"
+    package = "Package"
+    selection_profile = "SelectionProfile"
+    task_sequence = "TaskSequence"
+}
+
 function Confirm-DirectoryInfoParamsAreValid {
     <#
     .SYNOPSIS
@@ -39,7 +62,418 @@ function Confirm-DirectoryInfoParamsAreValid {
         if ([string]::IsNullOrEmpty($Module.Params.path)) {
             $Module.FailJson("The 'path' parameter cannot be empty.")
         }
+
+        if ($null -ne $Module.Params.max_depth -and $Module.Params.max_depth -lt 1) {
+            $Module.FailJson("The 'max_depth' parameter must be greater than 0.")
+        }
+
+        if ($null -ne $Module.Params.limit -and $Module.Params.limit -lt 1) {
+            $Module.FailJson("The 'limit' parameter must be greater than 0.")
+        }
+
+        if ($Module.Params.offset -lt 0) {
+            $Module.FailJson("The 'offset' parameter cannot be negative.")
+        }
+    }
+}
+
+function New-DirectoryInfoWalk {
+    <#
+    .SYNOPSIS
+    Creates the state of a walk of the directory tree.
+
+    .DESCRIPTION
+    This function creates the state shared by every directory formatted while walking the directory tree.
+    It contains the depth limit, item type filter, summary mode, page, and item fields requested by the parameters,
+    and the number of entries walked so far.
+    The 'type' field is always returned for items, since it identifies the item type of each entry.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .EXAMPLE
+    $walk = New-DirectoryInfoWalk -Module $module
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module
+    )
+
+    $itemNodeTypes = $null
+
+    if ($null -ne $Module.Params.item_types) {
+
+        $itemNodeTypes = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+
+        foreach ($itemType in $Module.Params.item_types) {
+            $itemNodeTypes.Add($script:mdtItemTypes[$itemType]) | Out-Null
+        }
+    }
+
+    return @{
+        Recurse = $Module.Params.recurse
+        MaxDepth = $Module.Params.max_depth
+        ItemNodeTypes = $itemNodeTypes
+        Fields = New-MDTReturnFieldSet -Module $Module -AdditionalFields @("type")
+        Summary = $Module.Params.summary
+        Offset = $Module.Params.offset
+        Limit = $Module.Params.limit
+        Count = 0
+    }
+}
+
+function Test-DirectoryInfoContentsAreIncluded {
+    <#
+    .SYNOPSIS
+    Tests whether the contents of a directory are included.
+
+    .DESCRIPTION
+    This function tests whether the contents of a directory at the specified depth below the requested directory are
+    included in the result.
+    The contents of the requested directory are always included.
+    The contents of its subdirectories are only included if the 'recurse' parameter is true and the directory is
+    shallower than the 'max_depth' parameter.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER Depth
+    The depth of the directory below the requested directory.
+
+    .EXAMPLE
+    Test-DirectoryInfoContentsAreIncluded -Walk $walk -Depth 1
+
+    .OUTPUTS
+    bool
+    #>
+
+    [OutputType([bool])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $true)]
+        [int]$Depth
+    )
+
+    if ($Depth -eq 0) {
+        return $true
+    }
+
+    if (-not $Walk.Recurse) {
+        return $false
+    }
+
+    return $null -eq $Walk.MaxDepth -or $Depth -lt $Walk.MaxDepth
+}
+
+function Test-DirectoryInfoItemIsIncluded {
+    <#
+    .SYNOPSIS
+    Tests whether an item within a directory is included.
+
+    .DESCRIPTION
+    This function tests whether an item with the specified node type is included by the 'item_types' parameter.
+    Directories are always included.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER NodeType
+    The node type of the item, such as 'Driver'.
+
+    .EXAMPLE
+    Test-DirectoryInfoItemIsIncluded -Walk $walk -NodeType "Driver"
+
+    .OUTPUTS
+    bool
+    #>
+
+    [OutputType([bool])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $true)]
+        [string]$NodeType
+    )
+
+    return $null -eq $Walk.ItemNodeTypes -or $Walk.ItemNodeTypes.Contains($NodeType)
+}
+
+function Set-DirectoryInfoItemTypeValue {
+    <#
+    .SYNOPSIS
+    Sets the type of a formatted item within a directory.
+
+    .DESCRIPTION
+    This function sets the 'type' field of a formatted item to its item type, such as 'application'.
+    If the item has a type of its own, such as the application type, it is moved to the specified field, as long as
+    that field is returned.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER Item
+    The formatted item.
+
+    .PARAMETER Type
+    The item type.
+
+    .PARAMETER ItemTypeField
+    The field to which the type of the item itself is moved, such as 'application_type'.
+
+    .EXAMPLE
+    Set-DirectoryInfoItemTypeValue -Walk $walk -Item $application -Type "application" -ItemTypeField "application_type"
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Item,
+        [Parameter(Mandatory = $true)]
+        [string]$Type,
+        [Parameter(Mandatory = $false)]
+        [string]$ItemTypeField
+    )
+
+    if (-not [string]::IsNullOrEmpty($ItemTypeField) -and (Test-MDTReturnFieldIsIncluded -Fields $Walk.Fields -Name $ItemTypeField)) {
+        $Item[$ItemTypeField] = $Item.type
     }
+
+    $Item.type = $Type
+}
+
+function Add-DirectoryInfoEntry {
+    <#
+    .SYNOPSIS
+    Counts an entry of the directory tree and tests whether it is within the requested page.
+
+    .DESCRIPTION
+    This function counts an entry of the directory tree and returns whether it is within the page requested by the
+    'offset' and 'limit' parameters.
+    Entries are counted in the order in which the directory tree is walked, with each directory counted before its
+    contents, so the position of an entry is stable as long as the directory tree is unchanged.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .EXAMPLE
+    Add-DirectoryInfoEntry -Walk $walk
+
+    .OUTPUTS
+    bool
+    #>
+
+    [OutputType([bool])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk
+    )
+
+    $position = $Walk.Count
+    $Walk.Count++
+
+    if ($position -lt $Walk.Offset) {
+        return $false
+    }
+
+    return $null -eq $Walk.Limit -or $position -lt ($Walk.Offset + $Walk.Limit)
+}
+
+function Set-DirectoryInfoContentsValue {
+    <#
+    .SYNOPSIS
+    Sets the contents of a formatted directory.
+
+    .DESCRIPTION
+    This function sets the contents of a formatted directory.
+    If the 'summary' parameter is true, the number of items and directories directly within the directory are also set.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER Directory
+    The formatted directory.
+
+    .PARAMETER Contents
+    The contents of the directory.
+    This is a hashtable with the formatted 'Entries' and the 'ItemCount' and 'FolderCount' of the directory, or null if
+    the contents of the directory are not included.
+
+    .EXAMPLE
+    Set-DirectoryInfoContentsValue -Walk $walk -Directory $driverFolder -Contents $contents
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Directory,
+        [Parameter(Mandatory = $false)]
+        [AllowNull()]
+        [System.Collections.Hashtable]$Contents
+    )
+
+    if ($null -eq $Contents) {
+        return
+    }
+
+    $Directory.contents = [System.Collections.Hashtable[]]$Contents.Entries.ToArray()
+
+    if ($Walk.Summary) {
+        $Directory.item_count = $Contents.ItemCount
+        $Directory.folder_count = $Contents.FolderCount
+    }
+}
+
+function Add-DirectoryInfoFolderEntry {
+    <#
+    .SYNOPSIS
+    Adds a formatted subdirectory to the contents of a directory.
+
+    .DESCRIPTION
+    This function adds a formatted subdirectory to the contents of a directory if it is within the requested page, or
+    if any of its own contents are, so that every returned entry keeps its place within the directory tree.
+
+    .PARAMETER Contents
+    The contents of the directory.
+
+    .PARAMETER Folder
+    The formatted subdirectory.
+
+    .PARAMETER IsInPage
+    Whether the subdirectory itself is within the requested page.
+
+    .EXAMPLE
+    Add-DirectoryInfoFolderEntry -Contents $contents -Folder $formattedFolder -IsInPage $isInPage
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Contents,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Folder,
+        [Parameter(Mandatory = $true)]
+        [bool]$IsInPage
+    )
+
+    $Contents.FolderCount++
+
+    if ($IsInPage -or ($null -ne $Folder.contents -and $Folder.contents.Length -gt 0)) {
+        $Contents.Entries.Add($Folder)
+    }
+}
+
+function Get-MDTObjectChildIndex {
+    <#
+    .SYNOPSIS
+    Gets the MDT objects within a directory indexed by their parent directory.
+
+    .DESCRIPTION
+    This function enumerates the MDT objects within a directory once and indexes them by the path of their parent
+    directory, relative to the root of the MDT share.
+    If Recurse is specified without MaxDepth, every MDT object within the directory tree is enumerated at once.
+    If Recurse is specified with MaxDepth, the directory tree is enumerated one level at a time, down to MaxDepth levels
+    below the directory, so deeper levels are never enumerated.
+    Otherwise, only the MDT objects directly within the directory are enumerated.
+    The MDT objects within each directory are kept in the order in which the MDT PowerShell provider returns them.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER MDTDriveName
+    The name of the MDT drive.
+
+    .PARAMETER Path
+    The path of the directory relative to the root of the MDT share.
+
+    .PARAMETER Recurse
+    Whether to enumerate the directory tree.
+
+    .PARAMETER MaxDepth
+    The number of levels of the directory tree to enumerate, if Recurse is specified.
+    If not specified, the whole directory tree is enumerated.
+
+    .EXAMPLE
+    Get-MDTObjectChildIndex -Module $module -MDTDriveName "DS001" -Path "Out-of-Box Drivers" -Recurse
+
+    .EXAMPLE
+    Get-MDTObjectChildIndex -Module $module -MDTDriveName "DS001" -Path "Out-of-Box Drivers" -Recurse -MaxDepth 2
+
+    .OUTPUTS
+    System.Collections.Generic.Dictionary[string, System.Collections.Generic.List[Microsoft.BDD.PSSnapIn.MDTObject]]
+    #>
+
+    [OutputType([System.Collections.Generic.Dictionary[string, System.Collections.Generic.List[Microsoft.BDD.PSSnapIn.MDTObject]]])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string]$MDTDriveName,
+        [Parameter(Mandatory = $true)]
+        [string]$Path,
+        [Switch]$Recurse,
+        [Parameter(Mandatory = $false)]
+        [AllowNull()]
+        [System.Nullable[int]]$MaxDepth
+    )
+
+    $pathPrefix = "MicrosoftDeploymentToolkit\MDTProvider::$($MDTDriveName):\"
+    $childIndex = New-Object -TypeName 'System.Collections.Generic.Dictionary[string, System.Collections.Generic.List[Microsoft.BDD.PSSnapIn.MDTObject]]' `
+        -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+
+    if ($Recurse -and $null -eq $MaxDepth) {
+        $levelCount = 1
+        $recurseLevel = $true
+    }
+    elseif ($Recurse) {
+        $levelCount = $MaxDepth
+        $recurseLevel = $false
+    }
+    else {
+        $levelCount = 1
+        $recurseLevel = $false
+    }
+
+    $directoryPaths = New-Object -TypeName System.Collections.Generic.List[string]
+    $directoryPaths.Add($Path)
+
+    for ($level = 1; $level -le $levelCount -and $directoryPaths.Count -gt 0; $level++) {
+
+        $nextDirectoryPaths = New-Object -TypeName System.Collections.Generic.List[string]
+
+        foreach ($directoryPath in $directoryPaths) {
+
+            foreach ($childObject in (Get-ChildItem -LiteralPath "$($MDTDriveName):\$($directoryPath)" -Recurse:$recurseLevel)) {
+
+                $parentPath = $childObject.PSParentPath -replace [regex]::Escape($pathPrefix), ""
+                $parentPath = $parentPath.Trim('\')
+
+                if (-not $childIndex.ContainsKey($parentPath)) {
+                    $childIndex[$parentPath] = New-Object -TypeName System.Collections.Generic.List[Microsoft.BDD.PSSnapIn.MDTObject]
+                }
+
+                $childIndex[$parentPath].Add($childObject)
+
+                if ($childObject.PSIsContainer -and -not $recurseLevel) {
+                    $childPath = $childObject.PSPath -replace [regex]::Escape($pathPrefix), ""
+                    $nextDirectoryPaths.Add($childPath.Trim('\'))
+                }
+            }
+        }
+
+        $directoryPaths = $nextDirectoryPaths
+    }
+
+    return $childIndex
 }
 
 function Format-MDTObject {
@@ -59,8 +493,22 @@ function Format-MDTObject {
     .PARAMETER Object
     The MDT object.
 
+    .PARAMETER ChildIndex
+    The MDT objects within the directory indexed by their parent directory, as returned by Get-MDTObjectChildIndex.
+    The contents of every directory are looked up within the index rather than enumerated again.
+
+    .PARAMETER ApplicationGraph
+    The application dependency graph returned by New-MDTApplicationDependencyGraph.
+    This is used to format the dependencies of every application within the directory.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER Depth
+    The depth of the MDT object below the requested directory.
+
     .EXAMPLE
-    Format-MDTObject -Module $module -MDTDriveName "DS001" -Object $directory
+    Format-MDTObject -Module $module -MDTDriveName "DS001" -Object $directory -ChildIndex $childIndex -Walk $walk
 
     .OUTPUTS
     System.Collections.Hashtable
@@ -73,39 +521,81 @@ function Format-MDTObject {
         [Parameter(Mandatory = $true)]
         [string]$MDTDriveName,
         [Parameter(Mandatory = $true)]
-        [Microsoft.BDD.PSSnapIn.MDTObject]$Object
+        [Microsoft.BDD.PSSnapIn.MDTObject]$Object,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Generic.Dictionary[string, System.Collections.Generic.List[Microsoft.BDD.PSSnapIn.MDTObject]]]$ChildIndex,
+        [Parameter(Mandatory = $false)]
+        [AllowNull()]
+        [System.Collections.Hashtable]$ApplicationGraph,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $false)]
+        [int]$Depth = 0
     )
 
-    $recurse = $Module.Params.recurse
-    $path = $Module.Params.path
+    $contents = $null
 
     $objectPath = $Object.PSPath -replace [regex]::Escape("MicrosoftDeploymentToolkit\MDTProvider::$($MDTDriveName):\"), ""
+    $objectPath = $objectPath.Trim('\')
 
-    if ($Object.PSIsContainer -and ($recurse -or $objectPath -ieq $path)) {
+    if ($Object.PSIsContainer -and (Test-DirectoryInfoContentsAreIncluded -Walk $Walk -Depth $Depth)) {
 
-        $fullPath = "$($MDTDriveName):\$($objectPath)"
-        $contentObjects = [Array](Get-ChildItem -LiteralPath $fullPath)
+        $contentObjects = $null
 
-        if ($null -eq $contentObjects) {
+        if (-not $ChildIndex.TryGetValue($objectPath, [ref]$contentObjects)) {
             $contentObjects = [Array]@()
         }
 
-        $contents = New-Object System.Collections.Generic.List[System.Collections.Hashtable]
+        $contents = @{
+            Entries = New-Object System.Collections.Generic.List[System.Collections.Hashtable]
+            ItemCount = 0
+            FolderCount = 0
+        }
 
         foreach ($contentObject in $contentObjects) {
 
-            $contentObject = Format-MDTObject -Module $Module -MDTDriveName $MDTDriveName -Object $contentObject
+            if (-not $contentObject.PSIsContainer) {
+
+                if (-not (Test-DirectoryInfoItemIsIncluded -Walk $Walk -NodeType $contentObject.NodeType)) {
+                    continue
+                }
+
+                $contents.ItemCount++
+
+                if ($Walk.Summary -or -not (Add-DirectoryInfoEntry -Walk $Walk)) {
+                    continue
+                }
+            }
+            else {
+                $isInPage = Add-DirectoryInfoEntry -Walk $Walk
+            }
+
+            $formatParameters = @{
+                Module = $Module
+                MDTDriveName = $MDTDriveName
+                Object = $contentObject
+                ChildIndex = $ChildIndex
+                ApplicationGraph = $ApplicationGraph
+                Walk = $Walk
+                Depth = $Depth + 1
+            }
 
-            $contents.Add($contentObject) | Out-Null
+            $formattedObject = Format-MDTObject @formatParameters
+
+            if ($contentObject.PSIsContainer) {
+                Add-DirectoryInfoFolderEntry -Contents $contents -Folder $formattedObject -IsInPage $isInPage | Out-Null
+            }
+            else {
+                $contents.Entries.Add($formattedObject)
+            }
         }
     }
 
     switch ($Object.NodeType) {
         "Application" {
 
-            $application = $Object | Format-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -ExcludePaths
-            $application.application_type = $application.type
-            $application.type = "application"
+            $application = $Object | Format-MDTApplication -Module $Module -MDTDriveName $MDTDriveName -Graph $ApplicationGraph -Fields $Walk.Fields -ExcludePaths
+            Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $application -Type "application" -ItemTypeField "application_type" | Out-Null
 
             return $application
         }
@@ -125,16 +615,14 @@ function Format-MDTObject {
                 $applicationFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $applicationFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $applicationFolder -Contents $contents | Out-Null
 
             return $applicationFolder
         }
         "Driver" {
 
-            $driver = $Object | Format-MDTDriver -Module $Module -MDTDriveName $MDTDriveName -ExcludePaths
-            $driver.type = "driver"
+            $driver = $Object | Format-MDTDriver -Module $Module -MDTDriveName $MDTDriveName -Fields $Walk.Fields -ExcludePaths
+            Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $driver -Type "driver" | Out-Null
 
             return $driver
         }
@@ -154,9 +642,7 @@ function Format-MDTObject {
                 $driverFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $driverFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $driverFolder -Contents $contents | Out-Null
 
             return $driverFolder
         }
@@ -165,7 +651,7 @@ function Format-MDTObject {
             $linkedDeploymentShareFolder = @{
                 guid = $Object.guid
                 name = $Object.Name
-                type = "driver_folder"
+                type = "linked_deployment_share_folder"
                 enabled = [bool]::Parse($Object.enable)
             }
 
@@ -176,9 +662,7 @@ function Format-MDTObject {
                 $linkedDeploymentShareFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $linkedDeploymentShareFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $linkedDeploymentShareFolder -Contents $contents | Out-Null
 
             return $linkedDeploymentShareFolder
         }
@@ -187,7 +671,7 @@ function Format-MDTObject {
             $mediaFolder = @{
                 guid = $Object.guid
                 name = $Object.Name
-                type = "linked_deployment_share_folder"
+                type = "media_folder"
                 enabled = [bool]::Parse($Object.enable)
             }
 
@@ -198,17 +682,14 @@ function Format-MDTObject {
                 $mediaFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $mediaFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $mediaFolder -Contents $contents | Out-Null
 
             return $mediaFolder
         }
         "OperatingSystem" {
 
-            $operatingSystem = $Object | Format-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -ExcludePaths
-            $operatingSystem.os_type = $operatingSystem.type
-            $operatingSystem.type = "operating_system"
+            $operatingSystem = $Object | Format-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -Fields $Walk.Fields -ExcludePaths
+            Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $operatingSystem -Type "operating_system" -ItemTypeField "os_type" | Out-Null
 
             return $operatingSystem
         }
@@ -228,9 +709,7 @@ function Format-MDTObject {
                 $operatingSystemFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $operatingSystemFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $operatingSystemFolder -Contents $contents | Out-Null
 
             return $operatingSystemFolder
         }
@@ -250,16 +729,14 @@ function Format-MDTObject {
                 $packageFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $packageFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $packageFolder -Contents $contents | Out-Null
 
             return $packageFolder
         }
         "SelectionProfile" {
 
-            $selectionProfile = $Object | Format-MDTSelectionProfile -Module $Module -MDTDriveName $MDTDriveName
-            $selectionProfile.type = "selection_profile"
+            $selectionProfile = $Object | Format-MDTSelectionProfile -Fields $Walk.Fields
+            Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $selectionProfile -Type "selection_profile" | Out-Null
 
             return $selectionProfile
         }
@@ -279,16 +756,14 @@ function Format-MDTObject {
                 $selectionProfileFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $selectionProfileFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $selectionProfileFolder -Contents $contents | Out-Null
 
             return $selectionProfileFolder
         }
         "TaskSequence" {
 
-            $taskSequence = $Object | Format-MDTTaskSequence -Module $Module -MDTDriveName $MDTDriveName -ExcludePaths
-            $taskSequence.type = "task_sequence"
+            $taskSequence = $Object | Format-MDTTaskSequence -Module $Module -MDTDriveName $MDTDriveName -Fields $Walk.Fields -ExcludePaths
+            Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $taskSequence -Type "task_sequence" | Out-Null
 
             return $taskSequence
         }
@@ -308,23 +783,175 @@ function Format-MDTObject {
                 $taskSequenceFolder.comments = $Object.Comments
             }
 
-            if ($null -ne $contents) {
-                $taskSequenceFolder.contents = [System.Collections.Hashtable[]]$contents.ToArray()
-            }
+            Set-DirectoryInfoContentsValue -Walk $Walk -Directory $taskSequenceFolder -Contents $contents | Out-Null
 
             return $taskSequenceFolder
         }
         Default {
 
-            return @{
+            $item = @{
                 guid = $Object.guid
                 name = $Object.Name
                 type = $Object.NodeType
             }
+
+            Select-MDTReturnField -Fields $Walk.Fields -Item $item | Out-Null
+
+            return $item
         }
     }
 }
 
+function Format-MDTControlObject {
+    <#
+    .SYNOPSIS
+    Formats an MDT folder read from the Control directory.
+
+    .DESCRIPTION
+    This function formats an MDT folder read from the Control directory of an MDT share.
+    The formatted folder is identical to the one returned by Format-MDTObject.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Catalog
+    The catalog of the item type of the folder returned by Get-MDTControlCatalog.
+
+    .PARAMETER Path
+    The path of the folder relative to the root of the MDT share.
+
+    .PARAMETER Walk
+    The state of the walk returned by New-DirectoryInfoWalk.
+
+    .PARAMETER Depth
+    The depth of the folder below the requested directory.
+
+    .EXAMPLE
+    Format-MDTControlObject -Module $module -Catalog $catalog -Path "Applications\Folder" -Walk $walk
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Catalog,
+        [Parameter(Mandatory = $true)]
+        [string]$Path,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Walk,
+        [Parameter(Mandatory = $false)]
+        [int]$Depth = 0
+    )
+
+    $itemTypeInfo = Get-MDTControlItemTypeInfo -ItemType $Catalog.ItemType
+    $folderPath = $Path.Substring($itemTypeInfo.RootFolder.Length).Trim('\')
+    $folder = $Catalog.FoldersByPath[$folderPath]
+
+    $formattedFolder = @{
+        guid = $folder.guid
+        name = $Path.Split('\')[-1]
+        type = $script:mdtFolderTypes[$itemTypeInfo.FolderNodeType]
+        enabled = [bool]::Parse($folder.enable)
+        comments = $folder.Comments
+    }
+
+    if (-not (Test-DirectoryInfoContentsAreIncluded -Walk $Walk -Depth $Depth)) {
+        return $formattedFolder
+    }
+
+    $contents = @{
+        Entries = New-Object System.Collections.Generic.List[System.Collections.Hashtable]
+        ItemCount = 0
+        FolderCount = 0
+    }
+
+    $childFolders = $null
+
+    if ($Catalog.FolderChildren.TryGetValue($folderPath, [ref]$childFolders)) {
+
+        foreach ($childFolder in $childFolders) {
+
+            $isInPage = Add-DirectoryInfoEntry -Walk $Walk
+
+            $formatParameters = @{
+                Module = $Module
+                Catalog = $Catalog
+                Path = "$($itemTypeInfo.RootFolder)\$($childFolder.Path)"
+                Walk = $Walk
+                Depth = $Depth + 1
+            }
+
+            $formattedChildFolder = Format-MDTControlObject @formatParameters
+            Add-DirectoryInfoFolderEntry -Contents $contents -Folder $formattedChildFolder -IsInPage $isInPage | Out-Null
+        }
+    }
+
+    $includeItems = Test-DirectoryInfoItemIsIncluded -Walk $Walk -NodeType $itemTypeInfo.NodeType
+
+    foreach ($member in [string[]]$folder.Member) {
+
+        $item = $null
+
+        if (-not $includeItems -or -not $Catalog.ByGuid.TryGetValue($member, [ref]$item)) {
+            continue
+        }
+
+        $contents.ItemCount++
+
+        if ($Walk.Summary -or -not (Add-DirectoryInfoEntry -Walk $Walk)) {
+            continue
+        }
+
+        switch ($Catalog.ItemType) {
+            "Application" {
+                $formattedItem = $item | Format-MDTControlApplication -Module $Module -Catalog $Catalog -Fields $Walk.Fields -ExcludePaths
+                Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $formattedItem -Type "application" -ItemTypeField "application_type" | Out-Null
+            }
+            "Driver" {
+                $formattedItem = $item | Format-MDTControlDriver -Module $Module -Catalog $Catalog -Fields $Walk.Fields -ExcludePaths
+                Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $formattedItem -Type "driver" | Out-Null
+            }
+            "OperatingSystem" {
+                $formattedItem = $item | Format-MDTControlOperatingSystem -Module $Module -Catalog $Catalog -Fields $Walk.Fields -ExcludePaths
+                Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $formattedItem -Type "operating_system" -ItemTypeField "os_type" | Out-Null
+            }
+            "SelectionProfile" {
+                $formattedItem = $item | Format-MDTControlSelectionProfile -Fields $Walk.Fields
+                Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $formattedItem -Type "selection_profile" | Out-Null
+            }
+            "TaskSequence" {
+                $operatingSystemCatalog = Get-MDTControlCatalog -Module $Module -ItemType OperatingSystem
+                $formattedItem = $item | Format-MDTControlTaskSequence `
+                    -Module $Module `
+                    -Catalog $Catalog `
+                    -OperatingSystemCatalog $operatingSystemCatalog `
+                    -Fields $Walk.Fields `
+                    -ExcludePaths
+                Set-DirectoryInfoItemTypeValue -Walk $Walk -Item $formattedItem -Type "task_sequence" | Out-Null
+            }
+            Default {
+                $formattedItem = @{
+                    guid = $item.guid
+                    name = $item.Name
+                    type = $itemTypeInfo.NodeType
+                }
+
+                Select-MDTReturnField -Fields $Walk.Fields -Item $formattedItem | Out-Null
+            }
+        }
+
+        $contents.Entries.Add($formattedItem)
+    }
+
+    Set-DirectoryInfoContentsValue -Walk $Walk -Directory $formattedFolder -Contents $contents | Out-Null
+
+    return $formattedFolder
+}
+
 $spec = @{
     options = @{
         installation_path = @{
@@ -336,6 +963,15 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
         path = @{
             type = 'str'
             required = $true
@@ -345,6 +981,88 @@ $spec = @{
             required = $false
             default = $false
         }
+        max_depth = @{
+            type = 'int'
+            required = $false
+        }
+        item_types = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'application',
+                'driver',
+                'linked_deployment_share',
+                'media',
+                'operating_system',
+                'package',
+                'selection_profile',
+                'task_sequence'
+            )
+        }
+        summary = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        limit = @{
+            type = 'int'
+            required = $false
+        }
+        offset = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'comments',
+                'enabled',
+                'hidden',
+                'version',
+                'application_type',
+                'publisher',
+                'short_name',
+                'language',
+                'command_line',
+                'working_directory',
+                'files_path',
+                'reboot',
+                'dependencies',
+                'class',
+                'hash',
+                'manufacturer',
+                'os_version',
+                'platform',
+                'pnp_ids',
+                'whql_signed',
+                'os_type',
+                'build',
+                'description',
+                'flags',
+                'hal',
+                'image_file',
+                'image_index',
+                'image_name',
+                'languages',
+                'size',
+                'sms_image',
+                'read_only',
+                'definition',
+                'id',
+                'template',
+                'operating_system',
+                'full_name',
+                'organization',
+                'ie_home_page',
+                'product_key_type'
+            )
+        }
     }
     supports_check_mode = $true
 }
@@ -352,26 +1070,111 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-DirectoryInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
-
-$mdtDrive = Get-MDTPSDrive -Module $module
 
 $path = $module.Params.path
-$fullPath = "$($mdtDrive.Name):\$($path)"
+$walk = New-DirectoryInfoWalk -Module $module
 
 $module.Result.changed = $false
 
-if (Test-Path -LiteralPath $fullPath -PathType Leaf) {
-    $module.FailJson("The specified path is a file, not a directory.")
+if ($module.Params.read_backend -eq 'control_files') {
+
+    $itemType = Get-MDTControlItemType -Path $path
+
+    $module.Result.exists = $false
+
+    if ($null -ne $itemType) {
+
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType $itemType
+        $rootFolder = (Get-MDTControlItemTypeInfo -ItemType $itemType).RootFolder
+        $folderPath = $path.Substring($rootFolder.Length).Trim('\')
+
+        $module.Result.exists = $catalog.FoldersByPath.ContainsKey($folderPath)
+
+        if (-not $module.Result.exists) {
+
+            $separatorIndex = $folderPath.LastIndexOf('\')
+
+            if ($separatorIndex -lt 0) {
+                $parentPath = ""
+            }
+            else {
+                $parentPath = $folderPath.Substring(0, $separatorIndex)
+            }
+
+            $parentFolder = $catalog.FoldersByPath[$parentPath]
+            $leafName = $path.Split('\')[-1]
+
+            if ($null -ne $parentFolder) {
+
+                foreach ($member in [string[]]$parentFolder.Member) {
+
+                    $item = $null
+
+                    if ($catalog.ByGuid.TryGetValue($member, [ref]$item) -and $item.Name -ieq $leafName) {
+                        $module.FailJson("The specified path is a file, not a directory.")
+                    }
+                }
+            }
+        }
+    }
+
+    if ($module.Result.exists) {
+        $module.Result.directory = Format-MDTControlObject -Module $module -Catalog $catalog -Path $path -Walk $walk
+    }
 }
+else {
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module
+
+    $fullPath = "$($mdtDrive.Name):\$($path)"
+
+    if (Test-Path -LiteralPath $fullPath -PathType Leaf) {
+        $module.FailJson("The specified path is a file, not a directory.")
+    }
+
+    $module.Result.exists = Test-Path -LiteralPath $fullPath -PathType Container
+
+    if ($module.Result.exists) {
+
+        $applicationGraph = $null
 
-$module.Result.exists = Test-Path -LiteralPath $fullPath -PathType Container
+        if ((Get-MDTControlItemType -Path $path) -eq "Application" -and
+            (Test-MDTReturnFieldIsIncluded -Fields $walk.Fields -Name "dependencies")) {
 
-if ($module.Result.exists) {
-    $directory = Get-Item -LiteralPath $fullPath
-    $module.Result.directory = Format-MDTObject -Module $module -MDTDriveName $mdtDrive.Name -Object $directory
+            $applicationGraph = New-MDTApplicationDependencyGraph -Applications (Get-MDTApplication -Module $module -MDTDriveName $mdtDrive.Name)
+        }
+
+        $formatParameters = @{
+            Module = $module
+            MDTDriveName = $mdtDrive.Name
+            Object = Get-Item -LiteralPath $fullPath
+            ChildIndex = Get-MDTObjectChildIndex `
+                -Module $module `
+                -MDTDriveName $mdtDrive.Name `
+                -Path $path `
+                -Recurse:$module.Params.recurse `
+                -MaxDepth $module.Params.max_depth
+            ApplicationGraph = $applicationGraph
+            Walk = $walk
+        }
+
+        $module.Result.directory = Format-MDTObject @formatParameters
+    }
+
+    Remove-MDTPSDrive -Module $module | Out-Null
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+if ($module.Result.exists -and $null -ne $module.Params.limit) {
+
+    $module.Result.total = $walk.Count
+
+    if ($walk.Offset + $walk.Limit -lt $walk.Count) {
+        $module.Result.next_offset = $walk.Offset + $walk.Limit
+    }
+    else {
+        $module.Result.next_offset = $null
+    }
+}
 
 $module.ExitJson()
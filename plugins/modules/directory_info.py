@@ -16,6 +16,7 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.read_backend
 options:
   path:
     type: str
@@ -28,6 +29,117 @@ options:
     default: false
     description:
       - Whether to recurse into subdirectories.
+  max_depth:
+    type: int
+    required: false
+    version_added: 1.3.0
+    description:
+      - The maximum depth of subdirectories, below O(path), whose contents are returned.
+      - A value of V(1) only returns the contents of O(path) itself.
+      - This only applies if O(recurse=true).
+      - If not specified, the contents of every subdirectory are returned.
+      - Subdirectories deeper than this are not enumerated, so a small value limits the cost of reading a large tree.
+  item_types:
+    type: list
+    elements: str
+    required: false
+    version_added: 1.3.0
+    choices:
+      - application
+      - driver
+      - linked_deployment_share
+      - media
+      - operating_system
+      - package
+      - selection_profile
+      - task_sequence
+    description:
+      - The types of items to return within the contents of each directory.
+      - Subdirectories are always returned.
+      - If set to an empty list, only subdirectories are returned.
+      - If not specified, items of every type are returned.
+  summary:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether to return the number of items and subdirectories within each directory instead of the items themselves.
+      - If V(true), the contents of each directory only contain its subdirectories.
+  limit:
+    type: int
+    required: false
+    version_added: 1.3.0
+    description:
+      - The maximum number of entries to return within the directory tree.
+      - >-
+        Entries are the items and subdirectories within the directory tree, counted with each directory before its
+        contents and in the order in which they are stored in the MDT deployment share.
+      - The parent directories of every returned entry are also returned so that each entry keeps its place in the tree.
+      - If not specified, every entry is returned.
+  offset:
+    type: int
+    required: false
+    default: 0
+    version_added: 1.3.0
+    description:
+      - The number of entries within the directory tree to skip before returning entries.
+      - Use RV(next_offset) of the previous page to walk a large directory tree incrementally.
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - comments
+      - enabled
+      - hidden
+      - version
+      - application_type
+      - publisher
+      - short_name
+      - language
+      - command_line
+      - working_directory
+      - files_path
+      - reboot
+      - dependencies
+      - class
+      - hash
+      - manufacturer
+      - os_version
+      - platform
+      - pnp_ids
+      - whql_signed
+      - os_type
+      - build
+      - description
+      - flags
+      - hal
+      - image_file
+      - image_index
+      - image_name
+      - languages
+      - size
+      - sms_image
+      - read_only
+      - definition
+      - id
+      - template
+      - operating_system
+      - full_name
+      - organization
+      - ie_home_page
+      - product_key_type
+    version_added: 1.3.0
+    description:
+      - The fields of each item within the directory to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
+      - This only applies to items, such as applications and drivers, not to directories.
+      - The V(type) field of each item is always returned.
+      - Fields that do not apply to the item type of an item are ignored for that item.
 """
 
 EXAMPLES = r"""
@@ -41,6 +153,43 @@ EXAMPLES = r"""
     mdt_share_path: C:\\MDTShare
     path: Operating Systems
     recurse: true
+
+- name: Get the number of drivers within each driver directory
+  trippsc2.mdt.directory_info:
+    mdt_share_path: C:\\MDTShare
+    path: Out-of-Box Drivers
+    recurse: true
+    summary: true
+
+- name: Get the first 500 entries of the driver directory tree
+  trippsc2.mdt.directory_info:
+    mdt_share_path: C:\\MDTShare
+    path: Out-of-Box Drivers
+    recurse: true
+    max_depth: 3
+    limit: 500
+  register: _drivers_page
+
+- name: Get the next 500 entries of the driver directory tree
+  trippsc2.mdt.directory_info:
+    mdt_share_path: C:\\MDTShare
+    path: Out-of-Box Drivers
+    recurse: true
+    max_depth: 3
+    limit: 500
+    offset: "{{ _drivers_page.next_offset }}"
+  when: _drivers_page.next_offset is not none
+
+- name: Get only the names and PnP IDs of the drivers within a directory
+  trippsc2.mdt.directory_info:
+    mdt_share_path: C:\\MDTShare
+    path: Out-of-Box Drivers
+    recurse: true
+    item_types:
+      - driver
+    return_fields:
+      - name
+      - pnp_ids
 """
 
 RETURN = r"""
@@ -81,4 +230,37 @@ directory:
       description:
         - The contents of the directory.
         - The structure of the data depends on the type of data in the directory.
+    item_count:
+      type: int
+      returned: O(summary=true)
+      version_added: 1.3.0
+      description:
+        - The number of items directly within the directory, of the types specified by O(item_types).
+        - This is only returned for directories whose contents are returned.
+    folder_count:
+      type: int
+      returned: O(summary=true)
+      version_added: 1.3.0
+      description:
+        - The number of subdirectories directly within the directory.
+        - This is only returned for directories whose contents are returned.
+total:
+  type: int
+  returned: RV(exists=true) and O(limit) is specified
+  version_added: 1.3.0
+  description:
+    - The total number of entries within the directory tree.
+next_offset:
+  type: int
+  returned: RV(exists=true) and O(limit) is specified
+  version_added: 1.3.0
+  description:
+    - The offset of the next page of entries within the directory tree.
+    - This is null if there are no more entries.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
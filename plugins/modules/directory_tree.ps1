@@ -0,0 +1,353 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
+
+function Format-DirectoryTreePath {
+    <#
+    .SYNOPSIS
+    Formats and validates a path of the directory tree.
+
+    .DESCRIPTION
+    This function converts a path of the directory tree to the expected format and confirms that it is valid.
+    The first segment of the path must be the root folder of an MDT item type, such as 'Out-of-Box Drivers'.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER ParameterName
+    The name of the parameter being validated.
+    This is used in the error message.
+
+    .PARAMETER Path
+    The path to format.
+
+    .EXAMPLE
+    "Out-of-Box Drivers/Dell" | Format-DirectoryTreePath -Module $module -ParameterName "paths[0]"
+
+    .INPUTS
+    string
+
+    .OUTPUTS
+    string
+    #>
+
+    [OutputType([string])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string]$ParameterName,
+        [Parameter(
+            Mandatory = $true,
+            ValueFromPipeline = $true)]
+        [AllowEmptyString()]
+        [AllowNull()]
+        [string]$Path
+    )
+
+    process {
+
+        $Path = $Path | Format-MDTPath
+
+        if ([string]::IsNullOrEmpty($Path)) {
+            $Module.FailJson("The '$($ParameterName)' parameter cannot be empty.")
+        }
+
+        $Path | Confirm-MDTPathIsValid -Module $Module -ParameterName $ParameterName | Out-Null
+
+        if ($null -eq (Get-MDTControlItemType -Path $Path)) {
+            $Module.FailJson("The '$($ParameterName)' parameter must be within the root folder of an MDT item type, such as 'Applications' or 'Out-of-Box Drivers'.")
+        }
+
+        return $Path
+    }
+}
+
+function Add-DirectoryTreeNode {
+    <#
+    .SYNOPSIS
+    Adds the paths of a node of the directory tree to the expected paths.
+
+    .DESCRIPTION
+    This function adds the path of a node of the directory tree, and the paths of all of its child nodes, to the
+    expected paths.
+    The value of each node must be a dictionary of child nodes keyed by name, or null if the node has no children.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER ExpectedPaths
+    The set of expected paths to which the paths are added.
+
+    .PARAMETER Path
+    The path of the node.
+
+    .PARAMETER ParameterName
+    The name of the parameter containing the node.
+    This is used in error messages.
+
+    .PARAMETER Children
+    The child nodes of the node.
+
+    .EXAMPLE
+    Add-DirectoryTreeNode -Module $module -ExpectedPaths $expectedPaths -Path "Out-of-Box Drivers\Dell" -ParameterName "tree" -Children $children
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Generic.HashSet[string]]$ExpectedPaths,
+        [Parameter(Mandatory = $true)]
+        [string]$Path,
+        [Parameter(Mandatory = $true)]
+        [string]$ParameterName,
+        [Parameter(Mandatory = $false)]
+        [AllowNull()]
+        [System.Object]$Children
+    )
+
+    Add-DirectoryTreePath -ExpectedPaths $ExpectedPaths -Path $Path | Out-Null
+
+    if ($null -eq $Children) {
+        return
+    }
+
+    if ($Children -isnot [System.Collections.IDictionary]) {
+        $Module.FailJson("The value of '$($ParameterName)' must be a dictionary of child directories or null.")
+    }
+
+    foreach ($name in $Children.Keys) {
+
+        $childParameterName = "$($ParameterName).$($name)"
+        $childPath = "$($Path)\$($name)" | Format-MDTPath
+
+        $name | Confirm-MDTPathIsValid -Module $Module -ParameterName $childParameterName | Out-Null
+
+        $addParameters = @{
+            Module = $Module
+            ExpectedPaths = $ExpectedPaths
+            Path = $childPath
+            ParameterName = $childParameterName
+            Children = $Children[$name]
+        }
+
+        Add-DirectoryTreeNode @addParameters | Out-Null
+    }
+}
+
+function Add-DirectoryTreePath {
+    <#
+    .SYNOPSIS
+    Adds a path and all of its parent paths to the expected paths.
+
+    .DESCRIPTION
+    This function adds a path and all of its parent paths to the expected paths.
+    The root folder of the MDT item type is not added, since it always exists.
+
+    .PARAMETER ExpectedPaths
+    The set of expected paths to which the paths are added.
+
+    .PARAMETER Path
+    The path to add.
+
+    .EXAMPLE
+    Add-DirectoryTreePath -ExpectedPaths $expectedPaths -Path "Out-of-Box Drivers\Dell\Latitude 7440"
+
+    This example adds 'Out-of-Box Drivers\Dell' and 'Out-of-Box Drivers\Dell\Latitude 7440' to the expected paths.
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Generic.HashSet[string]]$ExpectedPaths,
+        [Parameter(Mandatory = $true)]
+        [string]$Path
+    )
+
+    $segments = $Path.Split('\')
+    $currentPath = $segments[0]
+
+    for ($i = 1; $i -lt $segments.Length; $i++) {
+
+        $currentPath = "$($currentPath)\$($segments[$i])"
+        $ExpectedPaths.Add($currentPath) | Out-Null
+    }
+}
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        tree = @{
+            type = 'dict'
+            required = $false
+        }
+        paths = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+        }
+        prune = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+    }
+    required_one_of = @(
+        , @('tree', 'paths')
+    )
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$comparer = [System.StringComparer]::OrdinalIgnoreCase
+
+$expectedPaths = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+$rootPaths = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+
+if ($null -ne $module.Params.tree) {
+
+    foreach ($name in $module.Params.tree.Keys) {
+
+        $parameterName = "tree.$($name)"
+        $path = $name | Format-DirectoryTreePath -Module $module -ParameterName $parameterName
+
+        $rootPaths.Add($path) | Out-Null
+
+        $addParameters = @{
+            Module = $module
+            ExpectedPaths = $expectedPaths
+            Path = $path
+            ParameterName = $parameterName
+            Children = $module.Params.tree[$name]
+        }
+
+        Add-DirectoryTreeNode @addParameters | Out-Null
+    }
+}
+
+if ($null -ne $module.Params.paths) {
+
+    for ($i = 0; $i -lt $module.Params.paths.Count; $i++) {
+
+        $path = $module.Params.paths[$i] | Format-DirectoryTreePath -Module $module -ParameterName "paths[$($i)]"
+
+        $rootPaths.Add($path.Split('\')[0]) | Out-Null
+
+        Add-DirectoryTreePath -ExpectedPaths $expectedPaths -Path $path | Out-Null
+    }
+}
+
+$existingPaths = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+$itemTypes = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+
+foreach ($rootPath in $rootPaths) {
+    $itemTypes.Add((Get-MDTControlItemType -Path $rootPath)) | Out-Null
+}
+
+foreach ($itemType in $itemTypes) {
+
+    $rootFolder = (Get-MDTControlItemTypeInfo -ItemType $itemType).RootFolder
+
+    foreach ($folderPath in (Get-MDTControlFolderPath -Module $module -ItemType $itemType)) {
+        $existingPaths.Add("$($rootFolder)\$($folderPath)") | Out-Null
+    }
+}
+
+$createPaths = [string[]]@($expectedPaths | Where-Object { -not $existingPaths.Contains($_) } | Sort-Object)
+$removePaths = [string[]]@()
+
+if ($module.Params.prune) {
+
+    $removePaths = [string[]]@(
+        $existingPaths |
+            Where-Object {
+                $existingPath = $_
+
+                if ($expectedPaths.Contains($existingPath)) {
+                    return $false
+                }
+
+                foreach ($rootPath in $rootPaths) {
+
+                    if ($existingPath.StartsWith("$($rootPath)\", [System.StringComparison]::OrdinalIgnoreCase)) {
+                        return $true
+                    }
+                }
+
+                return $false
+            } |
+            Sort-Object
+    )
+}
+
+$module.Result.changed = $createPaths.Length -gt 0 -or $removePaths.Length -gt 0
+$module.Result.created = $createPaths
+$module.Result.removed = $removePaths
+
+if ($module.Result.changed -and -not $module.CheckMode) {
+
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+
+    $removedPaths = New-Object -TypeName System.Collections.Generic.List[string]
+
+    foreach ($path in $removePaths) {
+
+        $isRemoved = $false
+
+        foreach ($removedPath in $removedPaths) {
+
+            if ($path.StartsWith("$($removedPath)\", [System.StringComparison]::OrdinalIgnoreCase)) {
+                $isRemoved = $true
+                break
+            }
+        }
+
+        if ($isRemoved) {
+            continue
+        }
+
+        $fullPath = "$($mdtDrive.Name):\$($path)"
+
+        Remove-Item -LiteralPath $fullPath -Recurse -Force | Out-Null
+
+        if (Test-Path -LiteralPath $fullPath -PathType Container) {
+            $module.FailJson("Failed to remove directory '$($fullPath)'.")
+        }
+
+        $removedPaths.Add($path)
+    }
+
+    if ($removedPaths.Count -gt 0) {
+        Clear-MDTItemIndex
+    }
+
+    foreach ($path in $createPaths) {
+
+        $fullPath = "$($mdtDrive.Name):\$($path)"
+
+        New-Item -Path $fullPath -ItemType Directory | Out-Null
+
+        if (-not (Test-Path -LiteralPath $fullPath -PathType Container)) {
+            $module.FailJson("Failed to create directory '$($fullPath)'.")
+        }
+    }
+}
+
+Remove-MDTPSDrive -Module $module | Out-Null
+
+$module.ExitJson()
@@ -0,0 +1,105 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: directory_tree
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Ensures a tree of MDT deployment share directories is configured as expected
+description:
+  - Ensures that every directory of a tree of MDT deployment share directories exists and, optionally, that no other
+    directories exist below the root of the tree.
+  - >-
+    The existing directories are read once from the folder files in the C(Control) directory of the MDT share, such as
+    C(DriverGroups.xml), and compared with the expected tree.  Parent directories are created before their children.
+  - The MDT PowerShell module is only imported if a directory is created or removed.
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+options:
+  tree:
+    type: dict
+    required: false
+    description:
+      - The expected tree of directories.
+      - Each key is the name of a directory and each value is a dictionary of its child directories, or null if it has none.
+      - >-
+        The keys at the top level are the roots of the tree.  They are paths relative to the root of the MDT deployment share
+        and must be within the root folder of an MDT item type, such as V(Applications) or V(Out-of-Box Drivers).
+      - The parent directories of each root are also created, if they do not exist.
+      - At least one of O(tree) or O(paths) must be provided.
+  paths:
+    type: list
+    required: false
+    elements: str
+    description:
+      - A list of expected directories, as an alternative to O(tree).
+      - These paths are relative to the root of the MDT deployment share and must be within the root folder of an MDT item
+        type, such as V(Applications) or V(Out-of-Box Drivers).
+      - The parent directories of each path are also created, if they do not exist.
+      - For O(prune), the root of each path is the root folder of its MDT item type.
+      - At least one of O(tree) or O(paths) must be provided.
+  prune:
+    type: bool
+    required: false
+    default: false
+    description:
+      - Whether to remove the directories below the roots of the tree that are not expected.
+      - Any items within a removed directory are removed from it in the same way as by the M(trippsc2.mdt.directory) module
+        with O(trippsc2.mdt.directory#module:state=absent).
+"""
+
+EXAMPLES = r"""
+- name: Create a driver directory tree
+  trippsc2.mdt.directory_tree:
+    mdt_share_path: C:\\MDTShare
+    tree:
+      Out-of-Box Drivers:
+        Dell:
+          Latitude 7440:
+            Windows 11:
+          OptiPlex 7010:
+            Windows 10:
+            Windows 11:
+        WinPE:
+
+- name: Create directories from a list of paths and remove all other driver directories
+  trippsc2.mdt.directory_tree:
+    mdt_share_path: C:\\MDTShare
+    paths:
+      - Out-of-Box Drivers\\Dell\\Latitude 7440\\Windows 11
+      - Out-of-Box Drivers\\WinPE
+    prune: true
+"""
+
+RETURN = r"""
+created:
+  type: list
+  elements: str
+  returned: success
+  description:
+    - The paths of the directories that were created, in the order they were created.
+    - These paths are relative to the root of the MDT deployment share.
+  sample:
+    - Out-of-Box Drivers\Dell
+    - Out-of-Box Drivers\Dell\Latitude 7440
+removed:
+  type: list
+  elements: str
+  returned: success
+  description:
+    - The paths of the directories that were removed, including the directories below them.
+    - These paths are relative to the root of the MDT deployment share.
+    - This is always empty if O(prune=false).
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
+"""
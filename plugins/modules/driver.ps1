@@ -0,0 +1,467 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Driver
+
+function Confirm-DriverParamsAreValid {
+    <#
+    .SYNOPSIS
+    Confirms that the parameters are valid.
+
+    .DESCRIPTION
+    This function confirms that the parameters are valid.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .EXAMPLE
+    Confirm-DriverParamsAreValid -Module $module
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(
+            Mandatory = $true,
+            ValueFromPipeline = $true)]
+        [Ansible.Basic.AnsibleModule]$Module
+    )
+
+    process {
+        $Module.Params.guid = $Module.Params.guid | Format-MDTGuid -Module $Module
+
+        if (-not [string]::IsNullOrEmpty($Module.Params.folder)) {
+            $Module.Params.folder = $Module.Params.folder | Format-MDTPath
+            $Module.Params.folder | Confirm-MDTPathIsValid -Module $Module -ParameterName "folder" | Out-Null
+        }
+
+        $paths = $Module.Params.paths
+
+        if ($null -eq $paths) {
+            return
+        }
+
+        foreach ($pathsParameter in @('add', 'remove', 'set')) {
+
+            $pathsValue = $paths[$pathsParameter]
+
+            if ($null -eq $pathsValue) {
+                continue
+            }
+
+            if ($pathsParameter -ne 'set' -and $pathsValue.Count -eq 0) {
+                $Module.FailJson("The 'paths.$($pathsParameter)' parameter must contain at least one path, if provided.")
+            }
+
+            for ($i = 0; $i -lt $pathsValue.Count; $i++) {
+
+                if ([string]::IsNullOrEmpty($pathsValue[$i])) {
+                    continue
+                }
+
+                $pathsValue[$i] = $pathsValue[$i] | Format-MDTPath
+
+                $pathsValue[$i] |
+                    Confirm-MDTPathIsValid -Module $Module -ParameterName "paths.$($pathsParameter)[$($i)]" |
+                    Out-Null
+            }
+        }
+
+        if ($null -ne $paths.add -and $null -ne $paths.remove) {
+
+            $intersection = [Array]($paths.add | Where-Object { $paths.remove -icontains $_ })
+
+            if ($intersection.Length -gt 0) {
+                $Module.FailJson("The 'paths.add' and 'paths.remove' parameters must not contain the same path(s).")
+            }
+        }
+
+        if ($null -ne $paths.set -and $paths.set.Count -eq 0) {
+            $Module.FailJson("The 'paths' parameter would remove the driver.")
+        }
+    }
+}
+
+function Confirm-DriverFoldersExist {
+    <#
+    .SYNOPSIS
+    Confirms that the folders referenced by the parameters exist.
+
+    .DESCRIPTION
+    This function confirms that the folder and the paths to which drivers would be added exist within the driver catalog.
+    If any folder does not exist, the function will fail the Ansible module.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Catalog
+    The driver catalog returned by Get-MDTControlCatalog.
+
+    .EXAMPLE
+    Confirm-DriverFoldersExist -Module $module -Catalog $catalog
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Catalog
+    )
+
+    $folders = New-Object -TypeName System.Collections.Generic.List[string]
+
+    if (-not [string]::IsNullOrEmpty($Module.Params.folder)) {
+        $folders.Add($Module.Params.folder)
+    }
+
+    if ($null -ne $Module.Params.paths) {
+
+        foreach ($path in @($Module.Params.paths.add; $Module.Params.paths.set)) {
+
+            if ($null -ne $path) {
+                $folders.Add($path)
+            }
+        }
+    }
+
+    foreach ($folder in $folders) {
+
+        if (-not $Catalog.FoldersByPath.ContainsKey($folder)) {
+            $Module.FailJson("The directory 'Out-of-Box Drivers\$($folder)' does not exist in the MDT share.")
+        }
+    }
+}
+
+function Get-ExpectedDriver {
+    <#
+    .SYNOPSIS
+    Gets the expected MDT driver.
+
+    .DESCRIPTION
+    This function gets the expected MDT driver.
+    The expected driver is a copy of the existing driver with the comments, enabled, hidden, and paths properties
+    replaced by the values of the parameters, if provided.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Existing
+    The existing MDT driver, as formatted by Format-MDTControlDriver.
+
+    .EXAMPLE
+    Get-ExpectedDriver -Module $module -Existing $existing
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Existing
+    )
+
+    $expected = $Existing.Clone()
+
+    if ($null -ne $Module.Params.comments) {
+        $expected.comments = $Module.Params.comments
+    }
+
+    if ($null -ne $Module.Params.enabled) {
+        $expected.enabled = $Module.Params.enabled
+    }
+
+    if ($null -ne $Module.Params.hidden) {
+        $expected.hidden = $Module.Params.hidden
+    }
+
+    $expected.paths = Get-ExpectedDriverPathsValue -Module $Module -Existing $Existing
+
+    if ($expected.paths.Length -eq 0) {
+        $Module.FailJson("The 'paths' parameter would remove the driver '$($Existing.name)'.")
+    }
+
+    return $expected
+}
+
+function Get-ExpectedDriverPathsValue {
+    <#
+    .SYNOPSIS
+    Gets the expected paths.
+
+    .DESCRIPTION
+    This function gets the expected paths.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Existing
+    The existing MDT driver.
+
+    .EXAMPLE
+    Get-ExpectedDriverPathsValue -Module $Module -Existing $Existing
+
+    .OUTPUTS
+    string[]
+    #>
+
+    [OutputType([string[]])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Existing
+    )
+
+    $paramsPaths = $Module.Params.paths
+
+    if ($null -eq $paramsPaths) {
+        return $Existing.paths
+    }
+
+    if ($null -ne $paramsPaths.set) {
+        return [string[]]$paramsPaths.set.ToArray()
+    }
+
+    $paths = New-Object -TypeName System.Collections.ArrayList
+
+    $removePaths = $paramsPaths.remove
+
+    if ($null -eq $removePaths) {
+        $removePaths = @()
+    }
+
+    foreach ($path in $Existing.paths) {
+
+        if ($removePaths -inotcontains $path) {
+            $paths.Add($path) | Out-Null
+        }
+    }
+
+    foreach ($path in $paramsPaths.add) {
+
+        if ($paths -inotcontains $path) {
+            $paths.Add($path) | Out-Null
+        }
+    }
+
+    return [string[]]$paths.ToArray()
+}
+
+function Compare-ExpectedDriverToExisting {
+    <#
+    .SYNOPSIS
+    Compares the expected MDT driver to the existing MDT driver.
+
+    .DESCRIPTION
+    This function compares the expected MDT driver to the existing MDT driver.
+    The property changes are returned keyed by the property name used within the Drivers.xml control file.
+    If the paths of the driver differ, the expected paths are returned under the 'paths' key.
+
+    .PARAMETER Expected
+    The expected MDT driver.
+
+    .PARAMETER Existing
+    The existing MDT driver.
+
+    .EXAMPLE
+    Compare-ExpectedDriverToExisting -Expected $expected -Existing $existing
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Expected,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Existing
+    )
+
+    $propertyChanges = @{}
+
+    if ($Expected.comments -cne $Existing.comments) {
+        $propertyChanges.Comments = $Expected.comments
+    }
+
+    if ($Expected.enabled -ne $Existing.enabled) {
+        $propertyChanges.enable = $Expected.enabled.ToString()
+    }
+
+    if ($Expected.hidden -ne $Existing.hidden) {
+        $propertyChanges.hide = $Expected.hidden.ToString()
+    }
+
+    $pathsChanged = $Expected.paths.Length -ne $Existing.paths.Length
+
+    foreach ($expectedPath in $Expected.paths) {
+
+        if ($Existing.paths -inotcontains $expectedPath) {
+            $pathsChanged = $true
+            break
+        }
+    }
+
+    if ($pathsChanged) {
+        $propertyChanges.paths = $Expected.paths
+    }
+
+    return $propertyChanges
+}
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        guid = @{
+            type = 'str'
+            required = $false
+        }
+        name = @{
+            type = 'str'
+            required = $false
+        }
+        manufacturer = @{
+            type = 'str'
+            required = $false
+        }
+        class = @{
+            type = 'str'
+            required = $false
+        }
+        platform = @{
+            type = 'str'
+            required = $false
+            choices = @('x86', 'x64')
+        }
+        folder = @{
+            type = 'str'
+            required = $false
+        }
+        comments = @{
+            type = 'str'
+            required = $false
+        }
+        enabled = @{
+            type = 'bool'
+            required = $false
+        }
+        hidden = @{
+            type = 'bool'
+            required = $false
+        }
+        paths = @{
+            type = 'dict'
+            required = $false
+            options = @{
+                add = @{
+                    type = 'list'
+                    elements = 'str'
+                    required = $false
+                }
+                remove = @{
+                    type = 'list'
+                    elements = 'str'
+                    required = $false
+                }
+                set = @{
+                    type = 'list'
+                    elements = 'str'
+                    required = $false
+                }
+            }
+            mutually_exclusive = @(
+                @('add', 'set'),
+                @('remove', 'set')
+            )
+            required_one_of = @(
+                , @('add', 'remove', 'set')
+            )
+        }
+    }
+    required_one_of = @(
+        @('guid', 'name', 'manufacturer', 'class', 'platform', 'folder'),
+        @('comments', 'enabled', 'hidden', 'paths')
+    )
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$module | Confirm-DriverParamsAreValid | Out-Null
+
+$catalog = Get-MDTControlCatalog -Module $module -ItemType Driver
+
+Confirm-DriverFoldersExist -Module $module -Catalog $catalog | Out-Null
+
+$selectParameters = @{
+    Catalog = $catalog
+    Guid = $module.Params.guid
+    Name = $module.Params.name
+    Manufacturer = $module.Params.manufacturer
+    Class = $module.Params.class
+    Platform = $module.Params.platform
+    Folder = $module.Params.folder
+}
+
+$existingDrivers = [Array](Select-MDTControlDriver @selectParameters | Format-MDTControlDriver -Module $module -Catalog $catalog)
+
+if ($null -eq $existingDrivers) {
+    $existingDrivers = @()
+}
+
+$properties = @{}
+$paths = @{}
+
+$drivers = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+$changedDrivers = New-Object -TypeName System.Collections.Generic.List[string]
+$before = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+$after = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+foreach ($existing in $existingDrivers) {
+
+    $expected = Get-ExpectedDriver -Module $module -Existing $existing
+    $drivers.Add($expected)
+
+    $propertyChanges = Compare-ExpectedDriverToExisting -Expected $expected -Existing $existing
+
+    if ($propertyChanges.Count -eq 0) {
+        continue
+    }
+
+    if ($propertyChanges.ContainsKey("paths")) {
+        $paths[$existing.guid] = $propertyChanges.paths
+        $propertyChanges.Remove("paths")
+    }
+
+    if ($propertyChanges.Count -gt 0) {
+        $properties[$existing.guid] = $propertyChanges
+    }
+
+    $changedDrivers.Add($existing.guid)
+    $before.Add($existing)
+    $after.Add($expected)
+}
+
+Set-MDTControlItem -Module $module -ItemType Driver -Properties $properties | Out-Null
+Set-MDTControlItemFolder -Module $module -ItemType Driver -Paths $paths | Out-Null
+
+$module.Result.changed = $changedDrivers.Count -gt 0
+$module.Result.drivers = $drivers.ToArray()
+$module.Result.changed_drivers = $changedDrivers.ToArray()
+$module.Diff.before = $before.ToArray()
+$module.Diff.after = $after.ToArray()
+
+$module.ExitJson()
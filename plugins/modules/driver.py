@@ -0,0 +1,218 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: driver
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Updates the properties and paths of MDT drivers
+description:
+  - Updates the comments, enabled state, hidden state, and paths of every MDT driver that matches the supplied criteria.
+  - >-
+    The drivers are read from and written to the C(Drivers.xml) and C(DriverGroups.xml) files in the C(Control) directory of
+    the MDT share directly.  Each file is read once and, if any driver changes, written once, regardless of the number of
+    matching drivers.  The MDT PowerShell module is not used.
+  - Drivers are matched if they match every supplied criterion.  At least one criterion must be supplied.
+  - Drivers are not imported or removed by this module.  Use the M(trippsc2.mdt.import_drivers) module to import drivers.
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+options:
+  guid:
+    type: str
+    required: false
+    description:
+      - The GUID of the driver to match.
+  name:
+    type: str
+    required: false
+    description:
+      - The name of the drivers to match.
+  manufacturer:
+    type: str
+    required: false
+    description:
+      - The manufacturer of the drivers to match.
+  class:
+    type: str
+    required: false
+    description:
+      - The device class of the drivers to match.
+  platform:
+    type: str
+    required: false
+    choices:
+      - x86
+      - x64
+    description:
+      - A platform supported by the drivers to match.
+  folder:
+    type: str
+    required: false
+    description:
+      - The path of a folder, relative to the V(Out-of-Box Drivers) folder, of the drivers to match.
+      - Drivers found in this folder or in any folder below it are matched.
+      - If the folder does not exist, the module will fail.
+  comments:
+    type: str
+    required: false
+    description:
+      - The comments to set on the matching drivers.
+      - If not provided, the comments will not be changed.
+  enabled:
+    type: bool
+    required: false
+    description:
+      - Whether the matching drivers should be enabled.
+      - If not provided, the enabled state will not be changed.
+  hidden:
+    type: bool
+    required: false
+    description:
+      - Whether the matching drivers should be hidden.
+      - If not provided, the hidden state will not be changed.
+  paths:
+    type: dict
+    required: false
+    description:
+      - The expected configuration for paths at which the matching drivers should be found.
+      - If not provided, the drivers will not be moved or copied into any folders.
+      - The folders must already exist.  Use the M(trippsc2.mdt.directory) module to create folders.
+    suboptions:
+      add:
+        type: list
+        required: false
+        elements: str
+        description:
+          - A list of additional paths to add to the drivers.
+          - These paths are relative to the V(Out-of-Box Drivers) folder within the MDT share.
+          - This is mutually exclusive with O(paths.set).
+      remove:
+        type: list
+        required: false
+        elements: str
+        description:
+          - A list of paths to remove from the drivers.
+          - These paths are relative to the V(Out-of-Box Drivers) folder within the MDT share.
+          - This is mutually exclusive with O(paths.set).
+          - If a matching driver is not found at any other paths than these, the module will fail.
+      set:
+        type: list
+        required: false
+        elements: str
+        description:
+          - A list of paths to set for the drivers.
+          - These paths are relative to the V(Out-of-Box Drivers) folder within the MDT share.
+          - This is mutually exclusive with O(paths.add) and O(paths.remove).
+          - If this is an empty list, the module will fail.
+"""
+
+EXAMPLES = r"""
+- name: Disable all x86 drivers
+  trippsc2.mdt.driver:
+    mdt_share_path: C:\\MDTShare
+    platform: x86
+    enabled: false
+
+- name: Hide the Realtek network drivers in the WinPE folder
+  trippsc2.mdt.driver:
+    mdt_share_path: C:\\MDTShare
+    manufacturer: Realtek
+    class: Net
+    folder: WinPE
+    hidden: true
+    comments: Superseded
+
+- name: Move a driver into the Dell folder
+  trippsc2.mdt.driver:
+    mdt_share_path: C:\\MDTShare
+    guid: "{12345678-1234-1234-1234-123456789012}"
+    paths:
+      set:
+        - Dell
+"""
+
+RETURN = r"""
+drivers:
+  type: list
+  elements: dict
+  returned: success
+  description:
+    - The matching drivers, after any changes.
+  contains:
+      guid:
+        type: str
+        description:
+          - The driver GUID.
+      name:
+        type: str
+        description:
+          - The full name of the driver.
+      paths:
+        type: list
+        elements: str
+        description:
+          - The list of paths relative to the V(Out-of-Box Drivers) folder where the driver exists.
+      class:
+        type: str
+        description:
+          - The driver device class.
+      comments:
+        type: str
+        description:
+          - The driver comments.
+      files_path:
+        type: str
+        description:
+          - The physical directory of the driver files.
+      hash:
+        type: str
+        description:
+          - The SHA256 hash of the driver files.
+      manufacturer:
+        type: str
+        description:
+          - The driver manufacturer.
+      os_version:
+        type: list
+        elements: str
+        description:
+          - The list of OS versions supported by the driver.
+      platform:
+        type: list
+        elements: str
+        description:
+          - The list of platforms supported by the driver.
+      pnp_ids:
+        type: list
+        elements: str
+        description:
+          - The list of Plug and Play IDs supported by the driver.
+      version:
+        type: str
+        description:
+          - The driver version.
+      whql_signed:
+        type: bool
+        description:
+          - Whether the driver is WHQL signed.
+      enabled:
+        type: bool
+        description:
+          - Whether the driver is enabled.
+      hidden:
+        type: bool
+        description:
+          - Whether the driver is hidden.
+changed_drivers:
+  type: list
+  elements: str
+  returned: success
+  description:
+    - The GUIDs of the matching drivers that were changed.
+"""
@@ -2,6 +2,7 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Driver
 
 function Confirm-DriverInfoParamsAreValid {
@@ -30,6 +31,32 @@ function Confirm-DriverInfoParamsAreValid {
     process {
         $Module.Params.name | Confirm-NameIsValid -Module $Module -ParameterName "name" | Out-Null
         $Module.Params.guid = $Module.Params.guid | Format-MDTGuid -Module $Module
+
+        if (-not [string]::IsNullOrEmpty($Module.Params.folder)) {
+            $Module.Params.folder = $Module.Params.folder | Format-MDTPath
+            $Module.Params.folder | Confirm-MDTPathIsValid -Module $Module -ParameterName "folder" | Out-Null
+        }
+
+        $versions = @{}
+
+        foreach ($versionParameter in @('minimum_version', 'maximum_version')) {
+
+            if ([string]::IsNullOrEmpty($Module.Params[$versionParameter])) {
+                continue
+            }
+
+            $version = $null
+
+            if (-not [System.Version]::TryParse($Module.Params[$versionParameter], [ref]$version)) {
+                $Module.FailJson("The '$($versionParameter)' parameter must be a valid version, such as '10.0.19041.1'.")
+            }
+
+            $versions[$versionParameter] = $version
+        }
+
+        if ($versions.Count -eq 2 -and $versions.minimum_version -gt $versions.maximum_version) {
+            $Module.FailJson("The 'minimum_version' parameter cannot be greater than the 'maximum_version' parameter.")
+        }
     }
 }
 
@@ -44,6 +71,15 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
         guid = @{
             type = 'str'
             required = $false
@@ -52,12 +88,83 @@ $spec = @{
             type = 'str'
             required = $false
         }
+        manufacturer = @{
+            type = 'str'
+            required = $false
+        }
+        class = @{
+            type = 'str'
+            required = $false
+        }
+        platform = @{
+            type = 'str'
+            required = $false
+            choices = @('x86', 'x64')
+        }
+        os_version = @{
+            type = 'str'
+            required = $false
+        }
+        minimum_version = @{
+            type = 'str'
+            required = $false
+        }
+        maximum_version = @{
+            type = 'str'
+            required = $false
+        }
+        whql_signed = @{
+            type = 'bool'
+            required = $false
+        }
+        enabled = @{
+            type = 'bool'
+            required = $false
+        }
+        folder = @{
+            type = 'str'
+            required = $false
+        }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'class',
+                'hash',
+                'manufacturer',
+                'os_version',
+                'platform',
+                'pnp_ids',
+                'files_path',
+                'version',
+                'whql_signed',
+                'comments',
+                'enabled',
+                'hidden',
+                'paths'
+            )
+        }
     }
     mutually_exclusive = @(
         , @('name', 'guid')
     )
     required_one_of = @(
-        , @('name', 'guid')
+        , @(
+            'name',
+            'guid',
+            'manufacturer',
+            'class',
+            'platform',
+            'os_version',
+            'minimum_version',
+            'maximum_version',
+            'whql_signed',
+            'enabled',
+            'folder'
+        )
     )
     supports_check_mode = $true
 }
@@ -65,20 +172,65 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-DriverInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
 
-$mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+$fields = New-MDTReturnFieldSet -Module $module
 
-$drivers = Get-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+$filterParameters = @{
+    Manufacturer = $module.Params.manufacturer
+    Class = $module.Params.class
+    Platform = $module.Params.platform
+    OSVersion = $module.Params.os_version
+    MinimumVersion = $module.Params.minimum_version
+    MaximumVersion = $module.Params.maximum_version
+    WHQLSigned = $module.Params.whql_signed
+    Enabled = $module.Params.enabled
+    Folder = $module.Params.folder
+}
 
-if ($null -eq $drivers) {
-    $module.Result.exists = $false
+if ($module.Params.read_backend -eq 'control_files') {
+
+    $catalog = Get-MDTControlCatalog -Module $module -ItemType Driver
+
+    $selectParameters = @{
+        Catalog = $catalog
+        Guid = $module.Params.guid
+        Name = $module.Params.name
+    }
+
+    $drivers = [Array](Select-MDTControlDriver @selectParameters @filterParameters |
+        Format-MDTControlDriver -Module $module -Catalog $catalog -Fields $fields)
 }
 else {
-    $module.Result.exists = $true
-    $module.Result.driver = $drivers | Format-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+
+    $filter = New-MDTDriverFilter @filterParameters
+
+    $drivers = [Array](Get-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name |
+        Select-MDTDriver -MDTDriveName $mdtDrive.Name -Filter $filter |
+        Format-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name -Fields $fields)
+
+    Remove-MDTPSDrive -Module $module | Out-Null
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+if ($null -eq $drivers) {
+    $drivers = @()
+}
+
+$module.Result.exists = $drivers.Count -gt 0
+
+if ([string]::IsNullOrEmpty($module.Params.guid) -and [string]::IsNullOrEmpty($module.Params.name)) {
+    $module.Result.drivers = [System.Collections.Hashtable[]]$drivers
+}
+elseif ($module.Result.exists) {
+
+    if ($drivers.Count -eq 1) {
+        $module.Result.driver = $drivers[0]
+    }
+    else {
+        $module.Result.driver = $drivers
+    }
+}
 
 $module.ExitJson()
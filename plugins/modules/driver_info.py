@@ -12,23 +12,113 @@ author:
 short_description: Gets information about an MDT driver
 description:
   - Gets information about an MDT driver.
+  - Can also get information about every MDT driver matching a filter, such as a manufacturer, class, and platform.
 extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode
   - trippsc2.mdt.common
+  - trippsc2.mdt.read_backend
 options:
   guid:
     type: str
     required: false
     description:
       - The GUID of the driver.
-      - This is mutually exclusive with O(name).  One of the two must be provided.
+      - This is mutually exclusive with O(name).
+      - >-
+        One of O(guid), O(name), O(manufacturer), O(class), O(platform), O(os_version), O(minimum_version),
+        O(maximum_version), O(whql_signed), O(enabled), or O(folder) must be provided.
   name:
     type: str
     required: false
     description:
       - The name of the driver.
-      - This is mutually exclusive with O(guid).  One of the two must be provided.
+      - This is mutually exclusive with O(guid).
+  manufacturer:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - The manufacturer of the drivers to match.
+  class:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - The device class of the drivers to match.
+  platform:
+    type: str
+    required: false
+    choices:
+      - x86
+      - x64
+    version_added: 1.3.0
+    description:
+      - A platform supported by the drivers to match.
+  os_version:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - An OS version supported by the drivers to match, such as V(10.0).
+  minimum_version:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - The minimum version, inclusive, of the drivers to match.
+      - Drivers whose version cannot be parsed do not match.
+  maximum_version:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - The maximum version, inclusive, of the drivers to match.
+      - Drivers whose version cannot be parsed do not match.
+  whql_signed:
+    type: bool
+    required: false
+    version_added: 1.3.0
+    description:
+      - Whether the drivers to match are WHQL signed.
+  enabled:
+    type: bool
+    required: false
+    version_added: 1.3.0
+    description:
+      - Whether the drivers to match are enabled.
+  folder:
+    type: str
+    required: false
+    version_added: 1.3.0
+    description:
+      - The path of a folder, relative to the V(Out-of-Box Drivers) folder, of the drivers to match.
+      - Drivers found in this folder or in any folder below it are matched.
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - class
+      - hash
+      - manufacturer
+      - os_version
+      - platform
+      - pnp_ids
+      - files_path
+      - version
+      - whql_signed
+      - comments
+      - enabled
+      - hidden
+      - paths
+    version_added: 1.3.0
+    description:
+      - The fields of the driver to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
 """
 
 EXAMPLES = r"""
@@ -41,6 +131,30 @@ EXAMPLES = r"""
   trippsc2.mdt.driver_info:
     mdt_share_path: C:\\MDTShare
     guid: "{12345678-1234-1234-1234-123456789012}"
+
+- name: Get the Realtek network drivers for Windows 11 x64
+  trippsc2.mdt.driver_info:
+    mdt_share_path: C:\\MDTShare
+    manufacturer: Realtek
+    class: Net
+    platform: x64
+    os_version: "10.0"
+
+- name: Get the enabled, WHQL signed drivers in the Dell folder with a version of at least 10.0
+  trippsc2.mdt.driver_info:
+    mdt_share_path: C:\\MDTShare
+    folder: Dell
+    minimum_version: "10.0"
+    whql_signed: true
+    enabled: true
+
+- name: Get only the GUID and PnP IDs of a driver
+  trippsc2.mdt.driver_info:
+    mdt_share_path: C:\\MDTShare
+    name: Driver 1
+    return_fields:
+      - guid
+      - pnp_ids
 """
 
 RETURN = r"""
@@ -49,11 +163,13 @@ exists:
   returned: success
   description:
     - Whether the driver exists.
+    - If neither O(guid) nor O(name) is provided, whether any driver matches.
 driver:
   type: dict
-  returned: RV(exists=true)
+  returned: RV(exists=true) and O(guid) or O(name) is provided
   description:
       - The driver information.
+      - The filter options are applied as well, so this is only returned if the driver also matches them.
   contains:
     guid:
       type: str
@@ -119,4 +235,83 @@ driver:
       type: bool
       description:
         - Whether the driver is hidden.
+drivers:
+  type: list
+  elements: dict
+  returned: success and neither O(guid) nor O(name) is provided
+  version_added: 1.3.0
+  description:
+      - The information of every driver matching the filter options.
+      - The drivers are filtered before they are formatted, so only matching drivers are read and returned.
+  contains:
+    guid:
+      type: str
+      description:
+        - The driver GUID.
+    name:
+      type: str
+      description:
+        - The full name of the driver.
+    paths:
+      type: list
+      elements: str
+      description:
+        - The list of paths relative to the V(Out-of-Box Drivers) folder where the driver exists.
+    class:
+      type: str
+      description:
+        - The driver device class.
+    comments:
+      type: str
+      description:
+        - The driver comments.
+    files_path:
+      type: str
+      description:
+        - The physical directory of the driver files.
+    hash:
+      type: str
+      description:
+        - The SHA256 hash of the driver files.
+    manufacturer:
+      type: str
+      description:
+        - The driver manufacturer.
+    os_version:
+      type: list
+      elements: str
+      description:
+        - The list of OS versions supported by the driver.
+    platform:
+      type: list
+      elements: str
+      description:
+        - The list of platforms supported by the driver.
+    pnp_ids:
+      type: list
+      elements: str
+      description:
+        - The list of Plug and Play IDs supported by the driver.
+    version:
+      type: str
+      description:
+        - The driver version.
+    whql_signed:
+      type: bool
+      description:
+        - Whether the driver is WHQL signed.
+    enabled:
+      type: bool
+      description:
+        - Whether the driver is enabled.
+    hidden:
+      type: bool
+      description:
+        - Whether the driver is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -0,0 +1,77 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Driver
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        hardware_ids = @{
+            type = 'list'
+            elements = 'str'
+            required = $true
+        }
+        platform = @{
+            type = 'str'
+            required = $false
+            choices = @('x86', 'x64')
+        }
+        os_version = @{
+            type = 'str'
+            required = $false
+        }
+        include_disabled = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        rebuild_index = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+    }
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+if ($module.Params.hardware_ids.Count -eq 0) {
+    $module.FailJson("The 'hardware_ids' parameter cannot be empty.")
+}
+
+for ($i = 0; $i -lt $module.Params.hardware_ids.Count; $i++) {
+
+    if ([string]::IsNullOrWhiteSpace($module.Params.hardware_ids[$i])) {
+        $module.FailJson("The 'hardware_ids[$($i)]' parameter cannot be empty.")
+    }
+}
+
+$index = Get-MDTDriverPnPIndex -Module $module -Rebuild:$module.Params.rebuild_index
+
+$matchParameters = @{
+    Index = $index
+    HardwareIds = [string[]]$module.Params.hardware_ids
+    Platform = $module.Params.platform
+    OSVersion = $module.Params.os_version
+    IncludeDisabled = $module.Params.include_disabled
+}
+
+$driverMatches = Find-MDTDriverPnPMatch @matchParameters
+
+$module.Result.changed = $false
+$module.Result.exists = $driverMatches.Length -gt 0
+$module.Result.matches = $driverMatches
+$module.Result.pnp_index = $index.Status
+
+$module.ExitJson()
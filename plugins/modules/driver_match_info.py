@@ -0,0 +1,201 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: driver_match_info
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Gets the MDT drivers matching hardware IDs
+description:
+  - Gets the MDT drivers matching the hardware IDs of a device, ranked from best to worst match.
+  - >-
+    Drivers are looked up in an index of driver GUIDs keyed by Plug and Play ID, which is stored in the
+    C(Control\Ansible\DriverPnPIndex.json) file within the MDT share.
+  - >-
+    The index is updated when the C(Drivers.xml) or C(DriverGroups.xml) control files change, and only drivers that
+    were added, removed, or changed are updated.
+  - The index is not saved in check mode.
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+options:
+  hardware_ids:
+    type: list
+    elements: str
+    required: true
+    description:
+      - The hardware IDs of the device, such as V(PCI\VEN_8086&DEV_15BB&SUBSYS_07B01028&REV_10).
+      - Compatible IDs may be included after the hardware IDs.
+      - The IDs should be ordered from most to least specific, as reported by Windows.
+      - >-
+        Each ID also matches drivers for its less specific forms, such as V(PCI\VEN_8086&DEV_15BB&SUBSYS_07B01028) and
+        V(PCI\VEN_8086&DEV_15BB).
+  platform:
+    type: str
+    required: false
+    choices:
+      - x86
+      - x64
+    description:
+      - A platform the matched drivers must support.
+  os_version:
+    type: str
+    required: false
+    description:
+      - An OS version the matched drivers must support, such as V(10.0).
+  include_disabled:
+    type: bool
+    required: false
+    default: false
+    description:
+      - Whether to match disabled drivers.
+  rebuild_index:
+    type: bool
+    required: false
+    default: false
+    description:
+      - Whether to discard the stored index and build it again from the control files.
+"""
+
+EXAMPLES = r"""
+- name: Get the drivers matching a network adapter
+  trippsc2.mdt.driver_match_info:
+    mdt_share_path: C:\\MDTShare
+    hardware_ids:
+      - PCI\VEN_8086&DEV_15BB&SUBSYS_07B01028&REV_10
+      - PCI\VEN_8086&DEV_15BB&SUBSYS_07B01028
+      - PCI\VEN_8086&DEV_15BB&CC_020000
+      - PCI\VEN_8086&DEV_15BB&CC_0200
+    platform: x64
+    os_version: "10.0"
+  register: _driver_matches
+
+- name: Get the best driver for a USB device, including disabled drivers
+  trippsc2.mdt.driver_match_info:
+    mdt_share_path: C:\\MDTShare
+    hardware_ids:
+      - USB\VID_0BDA&PID_8153&REV_3100
+    include_disabled: true
+"""
+
+RETURN = r"""
+exists:
+  type: bool
+  returned: success
+  description:
+    - Whether any driver matches.
+matches:
+  type: list
+  elements: dict
+  returned: success
+  description:
+    - The matching drivers, ranked from best to worst match.
+    - >-
+      A match on an earlier hardware ID ranks above a match on a later one, and a match on a more specific form of
+      the same hardware ID ranks above a match on a less specific one.
+    - Equally ranked matches are ordered by driver version, newest first, and then by name.
+  contains:
+    rank:
+      type: int
+      description:
+        - The rank of the match, starting at V(1) for the best match.
+    guid:
+      type: str
+      description:
+        - The driver GUID.
+    name:
+      type: str
+      description:
+        - The full name of the driver.
+    manufacturer:
+      type: str
+      description:
+        - The driver manufacturer.
+    class:
+      type: str
+      description:
+        - The driver device class.
+    version:
+      type: str
+      description:
+        - The driver version.
+    platform:
+      type: list
+      elements: str
+      description:
+        - The list of platforms supported by the driver.
+    os_version:
+      type: list
+      elements: str
+      description:
+        - The list of OS versions supported by the driver.
+    whql_signed:
+      type: bool
+      description:
+        - Whether the driver is WHQL signed.
+    enabled:
+      type: bool
+      description:
+        - Whether the driver is enabled.
+    paths:
+      type: list
+      elements: str
+      description:
+        - The list of paths relative to the V(Out-of-Box Drivers) folder where the driver exists.
+    hardware_id:
+      type: str
+      description:
+        - The hardware ID from O(hardware_ids) that the driver matched.
+    matched_pnp_id:
+      type: str
+      description:
+        - The normalized Plug and Play ID of the driver that matched the hardware ID.
+    exact:
+      type: bool
+      description:
+        - Whether the driver matched the hardware ID itself, rather than a less specific form of it.
+pnp_index:
+  type: dict
+  returned: success
+  description:
+    - The status of the driver PnP index.
+  contains:
+    path:
+      type: str
+      description:
+        - The path of the index file.
+    rebuilt:
+      type: bool
+      description:
+        - Whether the index was built from scratch.
+        - This happens when the index did not exist, could not be read, or O(rebuild_index=true).
+    updated:
+      type: bool
+      description:
+        - Whether the index was updated from the control files.
+    added:
+      type: int
+      description:
+        - The number of drivers added to the index.
+    modified:
+      type: int
+      description:
+        - The number of drivers whose Plug and Play IDs changed.
+    removed:
+      type: int
+      description:
+        - The number of drivers removed from the index.
+    drivers:
+      type: int
+      description:
+        - The number of drivers in the index.
+    pnp_ids:
+      type: int
+      description:
+        - The number of distinct Plug and Play IDs in the index.
+"""
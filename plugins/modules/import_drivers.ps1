@@ -2,7 +2,9 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Driver
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Job
 
 function Confirm-ImportDriversParamsAreValid {
     <#
@@ -31,9 +33,579 @@ function Confirm-ImportDriversParamsAreValid {
 
         $Module.Params.path = $Module.Params.path | Format-MDTPath
         $Module.Params.path | Confirm-MDTPathIsValid -Module $Module -ParameterName "path" | Out-Null
+
+        if ($Module.Params.staging_size_limit -lt 0) {
+            $Module.FailJson("The 'staging_size_limit' parameter must be greater than or equal to 0.")
+        }
+
+        if ($Module.Params.detach -and @($Module.Params.source_paths | Where-Object { Test-ImportDriversArchivePath -Path $_ }).Count -gt 0) {
+            $Module.FailJson("The 'detach' parameter cannot be used when 'source_paths' contains ZIP or CAB archives.")
+        }
+    }
+}
+
+function Test-ImportDriversArchivePath {
+    <#
+    .SYNOPSIS
+    Tests whether a source path is a driver archive.
+
+    .DESCRIPTION
+    This function tests whether a source path is a ZIP or CAB archive file.
+
+    .PARAMETER Path
+    The source path.
+
+    .EXAMPLE
+    Test-ImportDriversArchivePath -Path "C:\DriverPacks\Latitude-7440.zip"
+
+    .OUTPUTS
+    bool
+    #>
+
+    [OutputType([bool])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [string]$Path
+    )
+
+    if (-not [System.IO.File]::Exists($Path)) {
+        return $false
+    }
+
+    $extension = [System.IO.Path]::GetExtension($Path)
+
+    return $extension -ieq ".zip" -or $extension -ieq ".cab"
+}
+
+function Get-ImportDriversCabSize {
+    <#
+    .SYNOPSIS
+    Gets the expanded size of a CAB archive.
+
+    .DESCRIPTION
+    This function reads the file entries in the header of a CAB archive and returns the total uncompressed size of its
+    files, without expanding the archive.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Path
+    The path of the CAB archive.
+
+    .EXAMPLE
+    Get-ImportDriversCabSize -Module $module -Path "C:\DriverPacks\Latitude-7440.cab"
+
+    .OUTPUTS
+    long
+    #>
+
+    [OutputType([long])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string]$Path
+    )
+
+    $stream = [System.IO.File]::OpenRead($Path)
+
+    try {
+        $reader = New-Object -TypeName System.IO.BinaryReader -ArgumentList $stream
+
+        # The CFHEADER starts with the 'MSCF' signature, and gives the offset of the first CFFILE entry at byte 16 and
+        # the number of CFFILE entries at byte 28.
+        if ($stream.Length -lt 36 -or $reader.ReadUInt32() -ne 0x4643534D) {
+            $Module.FailJson("The source path '$($Path)' is not a valid CAB archive.")
+        }
+
+        $stream.Position = 16
+        $filesOffset = $reader.ReadUInt32()
+
+        $stream.Position = 28
+        $fileCount = $reader.ReadUInt16()
+
+        $stream.Position = $filesOffset
+        $size = [long]0
+
+        for ($i = 0; $i -lt $fileCount; $i++) {
+
+            # Each CFFILE entry is the uncompressed size of the file, 12 bytes of folder, date, time, and attributes,
+            # and the null-terminated name of the file.
+            $size += $reader.ReadUInt32()
+            $stream.Position += 12
+
+            while ($reader.ReadByte() -ne 0) {
+            }
+        }
+    }
+    catch [System.IO.EndOfStreamException] {
+        $Module.FailJson("The source path '$($Path)' is not a valid CAB archive.")
+    }
+    finally {
+        $stream.Dispose()
+    }
+
+    return $size
+}
+
+function Expand-ImportDriversCab {
+    <#
+    .SYNOPSIS
+    Expands a CAB archive.
+
+    .DESCRIPTION
+    This function expands every file within a CAB archive to a directory with expand.exe.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Path
+    The path of the CAB archive.
+
+    .PARAMETER Destination
+    The directory to which the archive is expanded.
+
+    .EXAMPLE
+    Expand-ImportDriversCab -Module $module -Path "C:\DriverPacks\Latitude-7440.cab" -Destination "C:\Temp\staging\0"
+    #>
+
+    [OutputType([System.Void])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string]$Path,
+        [Parameter(Mandatory = $true)]
+        [string]$Destination
+    )
+
+    [System.IO.Directory]::CreateDirectory($Destination) | Out-Null
+
+    $expandPath = [System.IO.Path]::Combine([System.Environment]::SystemDirectory, "expand.exe")
+    $output = & $expandPath $Path "-F:*" $Destination 2>&1
+
+    if ($LASTEXITCODE -ne 0) {
+        $Module.FailJson("Failed to expand CAB archive '$($Path)': $($output -join [System.Environment]::NewLine)")
     }
 }
 
+function Get-ImportDriversPlan {
+    <#
+    .SYNOPSIS
+    Determines which drivers need to be imported.
+
+    .DESCRIPTION
+    This function finds the INF files within the source paths, reads them in parallel, and calculates the package hash
+    of each driver package.
+    Unless duplicates are imported, packages with the same package hash as a driver already in the MDT share, or as
+    another package within the source paths, are not imported again.
+    Existing drivers that are not yet in the target folder are returned as links, so they can be added to the folder
+    without being imported, as MDT would do for a duplicate driver.
+    If the drivers are imported by a background job, MDT adds them to the folder itself, so their directories are
+    returned instead.
+    The directories of the remaining packages are returned as the paths to pass to Import-MDTDriver.
+    Directories within another returned directory are not returned, since Import-MDTDriver imports directories
+    recursively.
+    CAB files within source directories and INF files that cannot be read are not pre-scanned, so their directories are
+    always returned and MDT checks them for duplicates itself.
+
+    ZIP archives in the source paths are read by Read-MDTDriverArchive without being extracted, and their new packages
+    are returned separately, so they can be extracted to the staging directory just before they are imported.
+    CAB archives in the source paths are expanded to the staging directory with expand.exe, since there is no CAB reader
+    within .NET, and are then read like a source directory.
+    Since CAB archives are expanded as a whole, the total expanded size of the CAB archives must not exceed the staging
+    size limit.
+    In check mode, CAB archives are not expanded, and are counted as not pre-scanned instead.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER StagingPath
+    The staging directory for archives.
+
+    .EXAMPLE
+    Get-ImportDriversPlan -Module $module -StagingPath $stagingPath
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string]$StagingPath
+    )
+
+    $comparer = [System.StringComparer]::OrdinalIgnoreCase
+    $parallelism = Get-MDTFileHashParallelism
+
+    $rootFolder = (Get-MDTControlItemTypeInfo -ItemType Driver).RootFolder
+    $targetFolder = $null
+
+    if ($Module.Params.path -ieq $rootFolder) {
+        $targetFolder = ""
+    }
+    elseif ($Module.Params.path.StartsWith("$($rootFolder)\", [System.StringComparison]::OrdinalIgnoreCase)) {
+        $targetFolder = $Module.Params.path.Substring($rootFolder.Length + 1)
+    }
+
+    $infPaths = New-Object -TypeName System.Collections.Generic.SortedSet[string] -ArgumentList $comparer
+    $importDirectories = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+    $archivePackages = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+    $unscannedCount = 0
+    $cabSize = [long]0
+
+    for ($i = 0; $i -lt $Module.Params.source_paths.Count; $i++) {
+
+        $sourcePath = [System.IO.Path]::GetFullPath($Module.Params.source_paths[$i]).TrimEnd('\')
+        $archivePath = [System.IO.Path]::Combine($StagingPath, "archive$($i)")
+
+        if ($sourcePath.EndsWith(".zip", [System.StringComparison]::OrdinalIgnoreCase) -and [System.IO.File]::Exists($sourcePath)) {
+            $archivePackages.AddRange((Read-MDTDriverArchive -Path $sourcePath -ScanPath $archivePath -Parallelism $parallelism))
+            continue
+        }
+
+        if ($sourcePath.EndsWith(".cab", [System.StringComparison]::OrdinalIgnoreCase) -and [System.IO.File]::Exists($sourcePath)) {
+            $cabSize += Get-ImportDriversCabSize -Module $Module -Path $sourcePath
+
+            if ($cabSize -gt [long]$Module.Params.staging_size_limit * 1MB) {
+                $Module.FailJson("The CAB archives in 'source_paths' expand to $([System.Math]::Ceiling($cabSize / 1MB)) MB, which exceeds the 'staging_size_limit' parameter.")
+            }
+
+            if ($Module.CheckMode) {
+                $unscannedCount++
+                continue
+            }
+
+            Expand-ImportDriversCab -Module $Module -Path $sourcePath -Destination $archivePath | Out-Null
+            $sourcePath = $archivePath
+        }
+
+        if ([System.IO.File]::Exists($sourcePath)) {
+
+            if ($sourcePath.EndsWith(".inf", [System.StringComparison]::OrdinalIgnoreCase)) {
+                $infPaths.Add($sourcePath) | Out-Null
+            }
+            else {
+                $importDirectories.Add([System.IO.Path]::GetDirectoryName($sourcePath)) | Out-Null
+                $unscannedCount++
+            }
+
+            continue
+        }
+
+        foreach ($infPath in [System.IO.Directory]::EnumerateFiles($sourcePath, "*.inf", [System.IO.SearchOption]::AllDirectories)) {
+            $infPaths.Add($infPath) | Out-Null
+        }
+
+        foreach ($cabPath in [System.IO.Directory]::EnumerateFiles($sourcePath, "*.cab", [System.IO.SearchOption]::AllDirectories)) {
+            $importDirectories.Add([System.IO.Path]::GetDirectoryName($cabPath)) | Out-Null
+            $unscannedCount++
+        }
+    }
+
+    $packages = Read-MDTDriverInf -Path ([string[]]@($infPaths)) -Parallelism $parallelism
+    Set-MDTDriverPackageHash -Package $packages | Out-Null
+
+    $packages = [System.Collections.Hashtable[]]@($packages; $archivePackages)
+
+    $existingDrivers = New-Object -TypeName 'System.Collections.Generic.Dictionary[string, string]' -ArgumentList $comparer
+
+    if (-not $Module.Params.import_duplicates) {
+
+        $index = Get-MDTDriverPnPIndex -Module $Module -IncludePackageHash
+
+        foreach ($guid in $index.Drivers.Keys) {
+
+            $packageHash = $index.Drivers[$guid].package_hash
+
+            if (-not [string]::IsNullOrEmpty($packageHash) -and -not $existingDrivers.ContainsKey($packageHash)) {
+                $existingDrivers[$packageHash] = $guid
+            }
+        }
+    }
+
+    $newPackages = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+    $existingPackages = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+    $links = @{}
+    $packageHashes = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+
+    foreach ($package in $packages) {
+
+        if ($null -ne $package.error -and $null -ne $package.archive) {
+            $Module.Warn("Failed to read driver INF file '$($package.path)', so it is not imported: $($package.error)")
+            continue
+        }
+
+        if ($null -ne $package.missing_files -and $package.missing_files.Length -gt 0) {
+            $Module.Warn("The files '$($package.missing_files -join "', '")' listed in driver INF file '$($package.path)' were not found within the archive.")
+        }
+
+        if ($null -ne $package.error) {
+            $Module.Warn("Failed to read driver INF file '$($package.path)': $($package.error)")
+            $importDirectories.Add($package.directory) | Out-Null
+            $unscannedCount++
+            continue
+        }
+
+        if (-not $Module.Params.import_duplicates -and $null -ne $package.hash) {
+
+            if (-not $packageHashes.Add($package.hash)) {
+
+                $existingPackages.Add(@{
+                    source = $package.path
+                    name = $package.name
+                    guid = $null
+                    linked = $false
+                })
+                continue
+            }
+
+            $existingGuid = $null
+
+            if ($existingDrivers.TryGetValue($package.hash, [ref]$existingGuid)) {
+
+                $existingPaths = [string[]]$index.Drivers[$existingGuid].paths
+                $isLinked = $existingPaths -inotcontains $targetFolder
+
+                if ($isLinked -and ($null -eq $targetFolder -or $Module.Params.detach)) {
+                    $newPackages.Add($package)
+
+                    if ($null -eq $package.archive) {
+                        $importDirectories.Add($package.directory) | Out-Null
+                    }
+
+                    continue
+                }
+
+                if ($isLinked) {
+                    $links[$existingGuid] = [string[]]@($existingPaths; $targetFolder)
+                }
+
+                $existingPackages.Add(@{
+                    source = $package.path
+                    name = $package.name
+                    guid = $existingGuid
+                    linked = $isLinked
+                })
+                continue
+            }
+        }
+
+        $newPackages.Add($package)
+
+        if ($null -eq $package.archive) {
+            $importDirectories.Add($package.directory) | Out-Null
+        }
+    }
+
+    $importPaths = New-Object -TypeName System.Collections.Generic.List[string]
+
+    foreach ($directory in ($importDirectories | Sort-Object)) {
+
+        $isIncluded = $false
+
+        foreach ($importPath in $importPaths) {
+
+            if ($directory.StartsWith("$($importPath)\", [System.StringComparison]::OrdinalIgnoreCase)) {
+                $isIncluded = $true
+                break
+            }
+        }
+
+        if (-not $isIncluded) {
+            $importPaths.Add($directory)
+        }
+    }
+
+    return @{
+        Packages = $newPackages.ToArray()
+        Existing = $existingPackages.ToArray()
+        Links = $links
+        UnscannedCount = $unscannedCount
+        ImportPaths = $importPaths.ToArray()
+        ArchivePackages = [System.Collections.Hashtable[]]@($newPackages | Where-Object { $null -ne $_.archive })
+    }
+}
+
+function Start-ImportDriversJob {
+    <#
+    .SYNOPSIS
+    Starts a background job that imports drivers.
+
+    .DESCRIPTION
+    This function starts a background job that imports the drivers within each source path into an MDT directory.
+    The number of drivers imported so far is reported as the progress of the job.
+    The job result contains whether any drivers were imported and the GUID, name, class, and version of each.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER SourcePaths
+    The paths to import the drivers from.
+
+    .EXAMPLE
+    Start-ImportDriversJob -Module $module -SourcePaths $plan.ImportPaths
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [string[]]$SourcePaths
+    )
+
+    $mdtSharePath = $Module.Params.mdt_share_path.TrimEnd('\')
+
+    $parameters = @{
+        installation_path = $Module.Params.installation_path
+        mdt_share_path = $mdtSharePath
+        source_paths = $SourcePaths
+        path = $Module.Params.path
+        import_duplicates = $Module.Params.import_duplicates
+    }
+
+    $script = @'
+param (
+    [Parameter(Mandatory = $true)]
+    [System.Object]$Parameters
+)
+
+$ErrorActionPreference = 'Stop'
+
+Import-Module -Name ([System.IO.Path]::Combine($Parameters.installation_path, "Bin", "MicrosoftDeploymentToolkit.psd1")) | Out-Null
+
+$mdtDrive = New-PSDrive -Name "DS001" -PSProvider MDTProvider -Root $Parameters.mdt_share_path
+$fullPath = "$($mdtDrive.Name):\$($Parameters.path)"
+
+$sourcePaths = [string[]]$Parameters.source_paths
+$drivers = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+try {
+    for ($i = 0; $i -lt $sourcePaths.Length; $i++) {
+
+        $progressParameters = @{
+            Activity = "Importing drivers"
+            Status = "$($drivers.Count) drivers imported."
+            CurrentOperation = "Importing drivers from '$($sourcePaths[$i])'."
+            PercentComplete = [int](100 * $i / $sourcePaths.Length)
+        }
+
+        Write-Progress @progressParameters
+
+        $importedDrivers = Import-MDTDriver -Path $fullPath -SourcePath $sourcePaths[$i] -ImportDuplicates:$Parameters.import_duplicates
+
+        foreach ($importedDriver in $importedDrivers) {
+            $drivers.Add(@{
+                guid = $importedDriver.guid
+                name = $importedDriver.Name
+                class = $importedDriver.Class
+                version = $importedDriver.Version
+            })
+        }
+    }
+
+    Write-Progress -Activity "Importing drivers" -Status "$($drivers.Count) drivers imported." -Completed
+}
+finally {
+    $mdtDrive | Remove-PSDrive | Out-Null
+}
+
+return @{
+    changed = $drivers.Count -gt 0
+    drivers = $drivers.ToArray()
+}
+'@
+
+    return Start-MDTJob -Module $Module -Name "import_drivers" -Key $mdtSharePath -Script $script -Parameters $parameters
+}
+
+function Import-ImportDriversArchivePackage {
+    <#
+    .SYNOPSIS
+    Imports driver packages from ZIP archives.
+
+    .DESCRIPTION
+    This function extracts driver packages from ZIP archives to the staging directory in batches, imports each batch
+    into an MDT directory, and deletes each batch before the next one is extracted.
+    Each batch is limited to the staging size limit, except that a package larger than the limit is imported on its own.
+
+    .PARAMETER Module
+    The Ansible module.
+
+    .PARAMETER Package
+    The driver packages returned by Read-MDTDriverArchive.
+
+    .PARAMETER StagingPath
+    The staging directory.
+
+    .PARAMETER FullPath
+    The MDT PowerShell provider path of the directory into which the drivers are imported.
+
+    .EXAMPLE
+    Import-ImportDriversArchivePackage -Module $module -Package $plan.ArchivePackages -StagingPath $stagingPath -FullPath $fullPath
+
+    .OUTPUTS
+    System.Object[]
+    #>
+
+    [OutputType([System.Object[]])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [Ansible.Basic.AnsibleModule]$Module,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable[]]$Package,
+        [Parameter(Mandatory = $true)]
+        [string]$StagingPath,
+        [Parameter(Mandatory = $true)]
+        [string]$FullPath
+    )
+
+    $sizeLimit = [long]$Module.Params.staging_size_limit * 1MB
+    $batchPath = [System.IO.Path]::Combine($StagingPath, "batch")
+    $importedDrivers = New-Object -TypeName System.Collections.Generic.List[System.Object]
+    $batch = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+    $batchSize = [long]0
+
+    for ($i = 0; $i -le $Package.Length; $i++) {
+
+        if ($i -lt $Package.Length -and ($batch.Count -eq 0 -or $batchSize + $Package[$i].size -le $sizeLimit)) {
+            $batch.Add($Package[$i])
+            $batchSize += $Package[$i].size
+            continue
+        }
+
+        Expand-MDTDriverArchivePackage -Package $batch.ToArray() -Destination $batchPath | Out-Null
+
+        try {
+            $sourcePaths = [string[]]@($batch | ForEach-Object { $_.directory })
+            $batchDrivers = Import-MDTDriver -Path $FullPath -SourcePath $sourcePaths -ImportDuplicates:$Module.Params.import_duplicates
+
+            if ($null -ne $batchDrivers) {
+                $importedDrivers.AddRange([System.Object[]]@($batchDrivers))
+            }
+        }
+        finally {
+            [System.IO.Directory]::Delete($batchPath, $true)
+        }
+
+        $batch.Clear()
+        $batchSize = [long]0
+
+        if ($i -lt $Package.Length) {
+            $i--
+        }
+    }
+
+    return , $importedDrivers.ToArray()
+}
+
 $spec = @{
     options = @{
         installation_path = @{
@@ -45,6 +617,21 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        hash_cache = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        rehash = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        hash_parallelism = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
         source_paths = @{
             type = 'list'
             required = $true
@@ -59,13 +646,40 @@ $spec = @{
             required = $false
             default = $false
         }
+        detach = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        staging_path = @{
+            type = 'path'
+            required = $false
+        }
+        staging_size_limit = @{
+            type = 'int'
+            required = $false
+            default = 1024
+        }
     }
-    supports_check_mode = $false
+    supports_check_mode = $true
 }
 
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-ImportDriversParamsAreValid | Out-Null
+
+# Background jobs of this module and the boot_image module lock the MDT share, so no drivers are imported while one is
+# running.
+if (-not $module.CheckMode) {
+
+    $activeJob = Get-MDTActiveJob -Module $module -Key $module.Params.mdt_share_path.TrimEnd('\')
+
+    if ($null -ne $activeJob) {
+        $module.FailJson("A $($activeJob.name) job is already running for '$($activeJob.key)' with ID '$($activeJob.id)'.")
+    }
+}
+
+Open-MDTFileHashSession -Module $module
 Import-MDTModule -Module $module | Out-Null
 
 $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
@@ -89,13 +703,100 @@ if (-not (Test-Path -LiteralPath $fullPath -PathType Container)) {
 
 $module.Result.changed = $false
 
-$importedDrivers = Import-MDTDriver -Path $fullPath -SourcePath $sourcePaths -ImportDuplicates:$importDuplicates
+$stagingRoot = $module.Params.staging_path
+
+if ($null -eq $stagingRoot) {
+    $stagingRoot = [System.IO.Path]::GetTempPath()
+}
+
+# A unique directory is always used within the staging path, so the whole directory can be deleted afterward.
+$stagingPath = [System.IO.Path]::Combine($stagingRoot, "ansible-mdt-import-drivers-$([System.Guid]::NewGuid().ToString())")
+$hasArchives = @($sourcePaths | Where-Object { Test-ImportDriversArchivePath -Path $_ }).Count -gt 0
+$importedDrivers = New-Object -TypeName System.Collections.Generic.List[System.Object]
+
+try {
+
+    if ($module.CheckMode -or -not $importDuplicates -or $hasArchives) {
+
+        $plan = Get-ImportDriversPlan -Module $module -StagingPath $stagingPath
+
+        $sourcePaths = $plan.ImportPaths
+        $module.Result.existing_drivers = $plan.Existing
+    }
+
+    if ($module.CheckMode) {
+
+        $module.Result.changed = $plan.Packages.Length -gt 0 -or $plan.Links.Count -gt 0 -or $plan.UnscannedCount -gt 0
+        $module.Result.drivers = [System.Collections.Hashtable[]]@(
+            $plan.Packages | ForEach-Object {
+                @{
+                    name = $_.name
+                    manufacturer = $_.manufacturer
+                    class = $_.class
+                    version = $_.version
+                    platform = $_.platform
+                    source = $_.path
+                    package_hash = $_.hash
+                }
+            }
+        )
+    }
+    elseif ($sourcePaths.Count -gt 0 -and $module.Params.detach) {
+
+        $job = Start-ImportDriversJob -Module $module -SourcePaths $sourcePaths
+
+        $module.Result.changed = $true
+        $module.Result.job_id = $job.id
+    }
+    else {
+
+        if ($sourcePaths.Count -gt 0) {
+
+            $directoryDrivers = Import-MDTDriver -Path $fullPath -SourcePath $sourcePaths -ImportDuplicates:$importDuplicates
+
+            if ($null -ne $directoryDrivers) {
+                $importedDrivers.AddRange([System.Object[]]@($directoryDrivers))
+            }
+        }
+
+        if ($null -ne $plan -and $plan.ArchivePackages.Length -gt 0) {
+
+            $archiveParameters = @{
+                Module = $module
+                Package = $plan.ArchivePackages
+                StagingPath = $stagingPath
+                FullPath = $fullPath
+            }
+
+            $importedDrivers.AddRange((Import-ImportDriversArchivePackage @archiveParameters))
+        }
+
+        if ($sourcePaths.Count -gt 0 -or ($null -ne $plan -and $plan.ArchivePackages.Length -gt 0)) {
+
+            Clear-MDTItemIndex -NodeType "Driver"
+
+            $module.Result.changed = $importedDrivers.Count -gt 0
+            $module.Result.drivers = $importedDrivers.ToArray() | Format-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name -ExcludePaths
+        }
+    }
+}
+finally {
+
+    if ([System.IO.Directory]::Exists($stagingPath)) {
+        [System.IO.Directory]::Delete($stagingPath, $true)
+    }
+}
+
+Remove-MDTPSDrive -Module $module | Out-Null
+
+# The links are written to the control files after the MDT PowerShell drive is removed, so they cannot be overwritten
+# by the MDT PowerShell provider.
+if (-not $module.CheckMode -and $null -ne $plan -and $plan.Links.Count -gt 0) {
 
-if ($null -ne $importedDrivers) {
-    $module.Result.changed = $importedDrivers.Length -gt 0
-    $module.Result.drivers = $importedDrivers | Format-MDTDriver -Module $module -MDTDriveName $mdtDrive.Name -ExcludePaths
+    Set-MDTControlItemFolder -Module $module -ItemType Driver -Paths $plan.Links | Out-Null
+    $module.Result.changed = $true
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Close-MDTFileHashSession -Module $module
 
 $module.ExitJson()
@@ -14,10 +14,40 @@ description:
   - Imports drivers into an MDT deployment share.
   - When O(import_duplicates=false), the module is idempotent.  Otherwise, the module will always import the drivers.
   - The drivers can be imported from driver files within a source directory or from CAB files within a source directory.
+  - >-
+    When O(import_duplicates=false), the INF files within the source paths are read in parallel before importing and
+    the package hash of each driver is compared to the drivers already in the MDT share.
+    Only the directories of new drivers are passed to C(Import-MDTDriver).
+    Drivers that already exist in the MDT share are added to the O(path) folder, if they are not already in it, without
+    being imported again, as C(Import-MDTDriver) does for duplicate drivers.
+  - >-
+    The package hash of a driver is the SHA256 checksum of its INF file, catalog files, and the source files listed
+    in its INF file.
+    The package hashes of the drivers in the MDT share are stored in C(Control\Ansible\DriverPnPIndex.json) within the
+    MDT share, and are only calculated again for drivers that have changed.
+  - >-
+    CAB files within the source paths, and INF files that cannot be read, are not read in advance.
+    Their directories are always passed to C(Import-MDTDriver), which checks them for duplicates itself.
+  - >-
+    The source paths can also be ZIP or CAB archives, such as OEM driver packs, which do not need to be extracted in
+    advance.
+    The INF files within ZIP archives are read, and the other files hashed, without extracting the archives.
+    Only new drivers are extracted to O(staging_path), in batches limited by O(staging_size_limit), and each batch is
+    deleted as soon as it has been imported.
+    For each new driver, the directory of its INF file and the files listed in its INF file are extracted.
+    Files listed in an INF file that are not found within the archive are reported as warnings, and drivers that list
+    files outside of the archive are not imported.
+  - >-
+    CAB archives cannot be read without being extracted, so each CAB archive is extracted to O(staging_path) as a
+    whole with C(expand.exe) and then read like a source directory.
+    The module fails if the total expanded size of the CAB archives exceeds O(staging_size_limit).
+    In check mode, CAB archives are not extracted, so the drivers within them are not listed and a change is always
+    reported.
 extends_documentation_fragment:
   - trippsc2.mdt.action_group
-  - trippsc2.mdt.check_mode_none
+  - trippsc2.mdt.check_mode
   - trippsc2.mdt.common
+  - trippsc2.mdt.file_hash
 options:
   source_paths:
     type: list
@@ -25,6 +55,7 @@ options:
     elements: path
     description:
       - The list of source paths containing driver files or CAB files.
+      - A source path can also be a ZIP or CAB archive containing driver files.
   path:
     type: str
     required: true
@@ -36,6 +67,49 @@ options:
     default: false
     description:
       - Whether to import duplicate drivers.
+  detach:
+    type: bool
+    required: false
+    default: false
+    version_added: 1.3.0
+    description:
+      - Whether to import the drivers in a background job.
+      - >-
+        If V(true), the module returns as soon as the job has started and reports a change.
+        If no driver needs to be imported, no job is started.
+        The ID of the job is returned in RV(job_id) and its progress and result can be retrieved with the
+        M(trippsc2.mdt.job_info) module.
+      - >-
+        The job result contains C(changed) and C(drivers), which contains the C(guid), C(name), C(class), and C(version)
+        of each imported driver.
+      - This cannot be V(true) when O(source_paths) contains ZIP or CAB archives.
+      - >-
+        Only one background job of this module or M(trippsc2.mdt.boot_image) may run for an MDT share at a time.
+        If one is already running, the module fails, whether or not O(detach=true), unless in check mode.
+  staging_path:
+    type: path
+    required: false
+    version_added: 1.3.0
+    description:
+      - The directory within which drivers are extracted from archives before being imported.
+      - >-
+        A uniquely named directory is created within this directory for each module run, and is deleted when the module
+        completes.
+      - If not specified, the temporary directory of the remote user is used.
+  staging_size_limit:
+    type: int
+    required: false
+    default: 1024
+    version_added: 1.3.0
+    description:
+      - The maximum total size, in megabytes, of the drivers extracted from ZIP archives at the same time.
+      - >-
+        A driver larger than this limit is extracted and imported on its own.
+        If V(0), each driver is extracted and imported on its own.
+      - >-
+        CAB archives cannot be extracted a driver at a time, so they are not bounded in the same way.
+        Instead, the module fails if the total expanded size of the CAB archives in O(source_paths) exceeds this limit.
+      - This must be greater than or equal to V(0).
 """
 
 EXAMPLES = r"""
@@ -55,15 +129,41 @@ EXAMPLES = r"""
     source_paths:
       - C:\\Drivers
     path: Out-of-Box Drivers\\WinPE
+
+- name: List the drivers that would be imported
+  trippsc2.mdt.import_drivers:
+    mdt_share_path: C:\\MDTShare
+    source_paths:
+      - C:\\Drivers
+    path: Out-of-Box Drivers\\WinPE
+  check_mode: true
+  register: _drivers_to_import
+
+- name: Import drivers from an OEM driver pack
+  trippsc2.mdt.import_drivers:
+    mdt_share_path: C:\\MDTShare
+    source_paths:
+      - C:\\DriverPacks\\Latitude-7440.zip
+    path: Out-of-Box Drivers\\Dell\\Latitude 7440
+    staging_path: D:\\Staging
+    staging_size_limit: 512
 """
 
 RETURN = r"""
+job_id:
+  type: str
+  returned: O(detach=true)
+  description:
+    - The ID of the background job importing the drivers.
 drivers:
   type: list
   elements: dict
-  returned: changed
+  returned: changed and O(detach=false)
   description:
     - The list of imported drivers.
+    - >-
+      In check mode, the list of drivers that would be imported, which contains the C(name), C(manufacturer),
+      C(class), C(version), C(platform), C(source), and C(package_hash) of each.
   contains:
     class:
       type: str
@@ -77,6 +177,17 @@ drivers:
       type: str
       description:
         - The SHA-256 hash of the driver file.
+    manufacturer:
+      type: str
+      version_added: 1.3.0
+      description:
+        - The driver manufacturer.
+    package_hash:
+      type: str
+      version_added: 1.3.0
+      description:
+        - The package hash of the driver files.
+        - Only returned in check mode.
     name:
       type: str
       description:
@@ -95,6 +206,9 @@ drivers:
       type: str
       description:
         - The source path of the driver files.
+        - In check mode, the path of the INF file within the source paths.
+        - For a driver within a ZIP archive, the path of the INF file within the archive is appended to the path of the
+          archive.
     version:
       type: str
       description:
@@ -103,4 +217,36 @@ drivers:
       type: bool
       description:
         - Whether the driver is WHQL signed.
+existing_drivers:
+  type: list
+  elements: dict
+  returned: O(import_duplicates=false) or check mode
+  version_added: 1.3.0
+  description:
+    - The drivers within the source paths that were not imported, because they already exist in the MDT share.
+    - A driver found more than once within the source paths is only imported once.
+  contains:
+    source:
+      type: str
+      description:
+        - The path of the INF file within the source paths.
+    name:
+      type: str
+      description:
+        - The name of the driver.
+    guid:
+      type: str
+      description:
+        - The GUID of the existing driver within the MDT share.
+        - V(null) if the driver was not imported because it was found earlier within the source paths.
+    linked:
+      type: bool
+      description:
+        - Whether the existing driver was added to the O(path) folder.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -0,0 +1,58 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Job
+
+$spec = @{
+    options = @{
+        job_id = @{
+            type = 'str'
+            required = $true
+        }
+        remove = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+    }
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$jobId = $module.Params.job_id
+$remove = $module.Params.remove
+
+$module.Result.changed = $false
+
+$job = Get-MDTJob -Module $module -Id $jobId
+
+if ($null -eq $job) {
+    $module.Result.exists = $false
+    $module.ExitJson()
+}
+
+$module.Result.exists = $true
+$module.Result.finished = $job.status -eq "succeeded" -or $job.status -eq "failed"
+$module.Result.job = @{
+    id = $job.id
+    name = $job.name
+    status = $job.status
+    created = $job.created
+    started = $job.started
+    finished = $job.finished
+    progress = $job.progress
+    result = $job.result
+    error = $job.error
+}
+
+if ($remove -and $module.Result.finished) {
+
+    $module.Result.changed = $true
+
+    if (-not $module.CheckMode) {
+        Remove-MDTJob -Module $module -Id $job.id | Out-Null
+    }
+}
+
+$module.ExitJson()
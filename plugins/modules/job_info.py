@@ -0,0 +1,150 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: job_info
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Gets information about an MDT background job
+description:
+  - Gets the status, progress, and result of a background job started by a module with O(trippsc2.mdt.boot_image#module:detach=true)
+    or O(trippsc2.mdt.import_drivers#module:detach=true).
+  - >-
+    Background jobs run in a process that is detached from the module that started them, so they continue to run after
+    the connection to the host is closed.
+    Use this module with C(until) to poll a job until it has finished.
+  - Finished jobs are removed seven days after they finish when another job is started.
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+options:
+  job_id:
+    type: str
+    required: true
+    description:
+      - The ID of the job.
+  remove:
+    type: bool
+    required: false
+    default: false
+    description:
+      - Whether to remove the job after it has finished.
+      - If the job has not finished, it is not removed.
+"""
+
+EXAMPLES = r"""
+- name: Generate boot image in the background
+  trippsc2.mdt.boot_image:
+    mdt_share_path: C:\\DeploymentShare
+    detach: true
+  register: _boot_image
+
+- name: Wait for boot image job to finish
+  when:
+    - _boot_image.job_id is defined
+  trippsc2.mdt.job_info:
+    job_id: "{{ _boot_image.job_id }}"
+    remove: true
+  register: _boot_image_job
+  until: _boot_image_job.finished
+  retries: 120
+  delay: 30
+"""
+
+RETURN = r"""
+exists:
+  type: bool
+  returned: success
+  description:
+    - Whether the job exists.
+finished:
+  type: bool
+  returned: RV(exists=true)
+  description:
+    - Whether the job has finished, either successfully or not.
+job:
+  type: dict
+  returned: RV(exists=true)
+  description:
+    - The job information.
+  contains:
+    id:
+      type: str
+      description:
+        - The ID of the job.
+    name:
+      type: str
+      description:
+        - The name of the module that started the job.
+    status:
+      type: str
+      description:
+        - The status of the job.
+        - >-
+          If the job process exited or did not start without recording a result, the status is V(failed).
+      choices:
+        - pending
+        - running
+        - succeeded
+        - failed
+    created:
+      type: str
+      description:
+        - The time the job was created, in ISO 8601 format.
+    started:
+      type: str
+      description:
+        - The time the job process started, in ISO 8601 format.
+        - This is null if the job process has not started.
+    finished:
+      type: str
+      description:
+        - The time the job finished, in ISO 8601 format.
+        - This is null if the job has not finished.
+    progress:
+      type: list
+      elements: dict
+      description:
+        - The latest progress record of each activity reported by the job.
+      contains:
+        activity:
+          type: str
+          description:
+            - The activity, such as the current phase of the boot image build.
+        status:
+          type: str
+          description:
+            - The status of the activity, such as the number of drivers imported so far.
+        current_operation:
+          type: str
+          description:
+            - The current operation of the activity.
+        percent_complete:
+          type: int
+          description:
+            - The percentage of the activity that is complete.
+            - This is V(-1) if the activity did not report a percentage.
+        completed:
+          type: bool
+          description:
+            - Whether the activity has completed.
+        updated:
+          type: str
+          description:
+            - The time the progress record was last updated, in ISO 8601 format.
+    result:
+      type: dict
+      description:
+        - The result of the job.
+        - This is null until the job has succeeded.
+        - The contents are described by the module that started the job.
+    error:
+      type: str
+      description:
+        - The error that caused the job to fail.
+        - This is null unless the job has failed.
+"""
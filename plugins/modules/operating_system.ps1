@@ -448,14 +448,7 @@ function Get-ExpectedOperatingSystem {
         $imageFileName = [System.IO.Path]::GetFileName($sourcePath)
         $imageFile = ".\Operating Systems\$($destinationFolder)\$($imageFileName)"
 
-        $imageFileChecksum = Get-FileHash -LiteralPath $sourcePath -Algorithm SHA256
-
-        $files = [System.Collections.Hashtable[]]@(
-            @{
-                path = $imageFileName
-                sha256_checksum = $imageFileChecksum.Hash
-            }
-        )
+        $files = [System.Collections.Hashtable[]](Format-MDTFilesValue -FilePath $sourcePath)
     }
 
     $wimImage = Get-WimImage -ImagePath $sourceImagePath -ImageIndex $imageIndex -ImageName $imageName -ImageEditionId $imageEditionId
@@ -790,6 +783,8 @@ function New-MDTOperatingSystem {
         Copy-Item -LiteralPath $firstFullPath -Destination $fullPath | Out-Null
     }
 
+    Clear-MDTItemIndex -NodeType "OperatingSystem"
+
     $currentOperatingSystem = Get-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -Guid $Expected.guid -Name $Expected.name |
         Format-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -IncludeFiles
 
@@ -947,6 +942,14 @@ function Compare-ExpectedOperatingSystemToExisting {
     }
 
     $sourcePath = $Module.Params.source_path
+
+    if ($Expected.type -eq "wim") {
+        $sourceDirectoryPath = [System.IO.Path]::GetDirectoryName($sourcePath)
+    }
+    else {
+        $sourceDirectoryPath = $sourcePath
+    }
+
     $copyFiles = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
 
     if ($null -ne $propertyChanges.FilesPath -and $null -ne $Existing.files -and $Existing.files.Length -gt 0) {
@@ -997,7 +1000,13 @@ function Compare-ExpectedOperatingSystemToExisting {
 
             foreach ($existingFile in $Existing.files) {
 
-                if ($expectedFile.path -eq $existingFile.path -and $expectedFile.sha256_checksum -eq $existingFile.sha256_checksum) {
+                $filesAreSame = Compare-MDTFilesValue `
+                    -ExpectedFile $expectedFile `
+                    -ExpectedDirectoryPath $sourceDirectoryPath `
+                    -ExistingFile $existingFile `
+                    -ExistingDirectoryPath $Existing.files_path
+
+                if ($filesAreSame) {
 
                     $fileDoesNotNeedCopying = $true
                     break
@@ -1329,6 +1338,8 @@ function Set-MDTOperatingSystem {
         }
     }
 
+    Clear-MDTItemIndex -NodeType "OperatingSystem"
+
     $operatingSystem = Get-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -Guid $Module.Params.guid -Name $Module.Params.name |
         Format-MDTOperatingSystem -Module $Module -MDTDriveName $MDTDriveName -IncludeFiles
 
@@ -1378,6 +1389,8 @@ function Remove-MDTOperatingSystem {
         $operatingSystemPath = $operatingSystem.PSPath -replace [regex]::Escape($pathPrefix), ""
         Remove-Item -LiteralPath $operatingSystemPath | Out-Null
     }
+
+    Clear-MDTItemIndex -NodeType "OperatingSystem"
 }
 
 $spec = @{
@@ -1391,6 +1404,31 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        hash_cache = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        rehash = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        hash_parallelism = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
+        change_detection = @{
+            type = 'str'
+            required = $false
+            default = 'sha256'
+            choices = @(
+                'metadata',
+                'fast_hash',
+                'sha256'
+            )
+        }
         guid = @{
             type = 'str'
             required = $false
@@ -1493,6 +1531,7 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-OperatingSystemParamsAreValid | Out-Null
+Open-MDTFileHashSession -Module $module
 Import-MDTModule -Module $module | Out-Null
 Import-Module -Name Dism | Out-Null
 
@@ -1542,6 +1581,8 @@ elseif ($state -eq "absent") {
     }
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Remove-MDTPSDrive -Module $module | Out-Null
+
+Close-MDTFileHashSession -Module $module
 
 $module.ExitJson()
@@ -16,6 +16,7 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode
   - trippsc2.mdt.common
+  - trippsc2.mdt.file_hash
 options:
   guid:
     type: str
@@ -94,6 +95,24 @@ options:
       - If O(state=present) and O(type=source), this is the path to the directory containing the installation media files.
       - This installation media files must have an install.wim (not install.esd) file in the sources subdirectory.
       - If O(state=present) and O(type=wim), this is the path to the WIM file.
+  change_detection:
+    type: str
+    required: false
+    default: sha256
+    choices:
+      - metadata
+      - fast_hash
+      - sha256
+    version_added: 1.3.0
+    description:
+      - The method used to detect whether the operating system files in the MDT share differ from the source files.
+      - If V(sha256), the SHA256 checksum of every file is compared.
+      - If V(fast_hash), the sizes and last write times of the files are compared first.
+        The xxHash64 checksums are only calculated and compared for files whose sizes match but last write times differ.
+        xxHash64 is a non-cryptographic hash that is much faster to calculate than SHA256.
+      - If V(metadata), the sizes and last write times of the files are compared.
+        If the sizes match but the last write times differ, the xxHash64 checksums are compared.
+      - The returned C(files) include the values that were used to compare them.
   destination_folder:
     type: str
     required: false
@@ -230,6 +249,21 @@ EXAMPLES = r"""
 """
 
 RETURN = r"""
+hash_cache:
+  type: dict
+  returned: O(hash_cache=true)
+  version_added: 1.3.0
+  description:
+    - The usage of the file hash cache.
+  contains:
+    hits:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was read from the cache.
+    misses:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was calculated.
 operating_system:
   type: dict
   returned: O(state=present)
@@ -328,6 +362,31 @@ operating_system:
             - The file paths are relative to the source files path (or destination path).
         sha256_checksum:
           type: str
+          returned: O(change_detection=sha256)
           description:
             - The SHA256 checksum of the file.
+        size:
+          type: int
+          returned: O(change_detection=fast_hash) or O(change_detection=metadata)
+          version_added: 1.3.0
+          description:
+            - The size of the file in bytes.
+        last_write_time:
+          type: str
+          returned: O(change_detection=fast_hash) or O(change_detection=metadata)
+          version_added: 1.3.0
+          description:
+            - The last write time of the file in ISO 8601 format (UTC).
+        xxhash64_checksum:
+          type: str
+          returned: O(change_detection=fast_hash) or O(change_detection=metadata), and the last write times of the files differ
+          version_added: 1.3.0
+          description:
+            - The xxHash64 checksum of the file.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
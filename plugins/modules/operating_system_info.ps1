@@ -2,6 +2,7 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.OperatingSystem
 
 function Confirm-OperatingSystemInfoParamsAreValid {
@@ -44,6 +45,30 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
+        hash_cache = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        rehash = @{
+            type = 'bool'
+            required = $false
+            default = $false
+        }
+        hash_parallelism = @{
+            type = 'int'
+            required = $false
+            default = 0
+        }
         guid = @{
             type = 'str'
             required = $false
@@ -52,6 +77,39 @@ $spec = @{
             type = 'str'
             required = $false
         }
+        include_files = @{
+            type = 'bool'
+            required = $false
+            default = $true
+        }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'build',
+                'description',
+                'flags',
+                'hal',
+                'image_file',
+                'image_index',
+                'image_name',
+                'os_type',
+                'platform',
+                'size',
+                'sms_image',
+                'files_path',
+                'languages',
+                'type',
+                'comments',
+                'enabled',
+                'hidden',
+                'paths',
+                'files'
+            )
+        }
     }
     mutually_exclusive = @(
         , @('name', 'guid')
@@ -65,20 +123,43 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-OperatingSystemInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
+Open-MDTFileHashSession -Module $module
+
+$fields = New-MDTReturnFieldSet -Module $module
+$includeFiles = $module.Params.include_files -and (Test-MDTReturnFieldIsIncluded -Fields $fields -Name "files")
+
+if ($module.Params.read_backend -eq 'control_files') {
 
-$mdtDrive = Get-MDTPSDrive -Module $module
+    $catalog = Get-MDTControlCatalog -Module $module -ItemType OperatingSystem
 
-$operatingSystems = Get-MDTOperatingSystem -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+    $operatingSystems = Get-MDTControlItem -Module $module -ItemType OperatingSystem -Guid $module.Params.guid -Name $module.Params.name
 
-if ($null -eq $operatingSystems) {
-    $module.Result.exists = $false
+    if ($null -eq $operatingSystems) {
+        $module.Result.exists = $false
+    }
+    else {
+        $module.Result.exists = $true
+        $module.Result.operating_system = $operatingSystems | Format-MDTControlOperatingSystem -Module $module -Catalog $catalog -Fields $fields -IncludeFiles:$includeFiles
+    }
 }
 else {
-    $module.Result.exists = $true
-    $module.Result.operating_system = $operatingSystems | Format-MDTOperatingSystem -Module $module -MDTDriveName $mdtDrive.Name -IncludeFiles
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module
+
+    $operatingSystems = Get-MDTOperatingSystem -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+
+    if ($null -eq $operatingSystems) {
+        $module.Result.exists = $false
+    }
+    else {
+        $module.Result.exists = $true
+        $module.Result.operating_system = $operatingSystems | Format-MDTOperatingSystem -Module $module -MDTDriveName $mdtDrive.Name -Fields $fields -IncludeFiles:$includeFiles
+    }
+
+    Remove-MDTPSDrive -Module $module | Out-Null
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Close-MDTFileHashSession -Module $module
 
 $module.ExitJson()
@@ -16,6 +16,8 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.file_hash
+  - trippsc2.mdt.read_backend
 options:
   guid:
     type: str
@@ -29,6 +31,46 @@ options:
     description:
       - The name of the operating system.
       - This is mutually exclusive with O(guid).  One of the two must be provided.
+  include_files:
+    type: bool
+    required: false
+    default: true
+    version_added: 1.3.0
+    description:
+      - Whether to include the files of the operating system and their SHA256 checksums in the result.
+      - If V(false), the operating system files are not read, which is much faster for large operating system sources.
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - build
+      - description
+      - flags
+      - hal
+      - image_file
+      - image_index
+      - image_name
+      - os_type
+      - platform
+      - size
+      - sms_image
+      - files_path
+      - languages
+      - type
+      - comments
+      - enabled
+      - hidden
+      - paths
+      - files
+    version_added: 1.3.0
+    description:
+      - The fields of the operating system to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
+      - If V(files) is not included, the files of the operating system are not read, even if O(include_files=true).
 """
 
 EXAMPLES = r"""
@@ -41,6 +83,14 @@ EXAMPLES = r"""
   trippsc2.mdt.operating_system_info:
     mdt_share_path: C:\\MDTShare
     guid: "{12345678-1234-1234-1234-123456789012}"
+
+- name: Get only the GUID and image name of an operating system
+  trippsc2.mdt.operating_system_info:
+    mdt_share_path: C:\\MDTShare
+    name: Windows 11 Enterprise
+    return_fields:
+      - guid
+      - image_name
 """
 
 RETURN = r"""
@@ -49,6 +99,21 @@ exists:
   returned: success
   description:
     - Whether the operating system exists.
+hash_cache:
+  type: dict
+  returned: O(hash_cache=true)
+  version_added: 1.3.0
+  description:
+    - The usage of the file hash cache.
+  contains:
+    hits:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was read from the cache.
+    misses:
+      type: int
+      description:
+        - The number of files whose SHA256 checksum was calculated.
 operating_system:
   type: dict
   returned: RV(exists=true)
@@ -76,6 +141,21 @@ operating_system:
       type: str
       description:
         - The source path for the operating system files.
+    files:
+      type: list
+      elements: dict
+      returned: O(include_files=true)
+      description:
+        - The list of files in the operating system source.
+      contains:
+        path:
+          type: str
+          description:
+            - The relative path of the file within the source path.
+        sha256_checksum:
+          type: str
+          description:
+            - The SHA256 checksum of the file.
     build:
       type: str
       description:
@@ -133,4 +213,10 @@ operating_system:
       type: bool
       description:
         - Whether the operating system is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -2,407 +2,9 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.SelectionProfile
 
-function Confirm-SelectionProfileParamsAreValid {
-    <#
-    .SYNOPSIS
-    Confirms that the parameters are valid.
-
-    .DESCRIPTION
-    This function confirms that the parameters are valid.
-
-    .PARAMETER Module
-    The Ansible module.
-
-    .EXAMPLE
-    Confirm-SelectionProfileParamsAreValid -Module $module
-    #>
-
-    [OutputType([System.Void])]
-    param (
-        [Parameter(
-            Mandatory = $true,
-            ValueFromPipeline = $true)]
-        [Ansible.Basic.AnsibleModule]$Module,
-        [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName
-    )
-
-    process {
-
-        $state = $Module.Params.state
-
-        $Module.Params.mdt_share_path = $Module.Params.mdt_share_path.TrimEnd("\")
-        $Module.Params.name | Confirm-NameIsValid -Module $Module -ParameterName "name" | Out-Null
-        $Module.Params.guid = $Module.Params.guid | Format-MDTGuid -Module $Module
-
-        if ($state -eq "absent") {
-            $Module | Confirm-SelectionProfileParamsAreValidForAbsent | Out-Null
-        }
-        elseif ($state -eq "present") {
-            $Module | Confirm-SelectionProfileParamsAreValidForPresent -MDTDriveName $MDTDriveName | Out-Null
-        }
-    }
-}
-
-function Confirm-SelectionProfileParamsAreValidForAbsent {
-    <#
-    .SYNOPSIS
-    Confirms that the parameters are valid for the module when the state is 'absent'.
-
-    .DESCRIPTION
-    This function confirms that the parameters are valid for the module when the state is 'absent'.
-
-    .PARAMETER Module
-    The module object.
-
-    .EXAMPLE
-    Confirm-SelectionProfileParamsAreValidForAbsent -Module $Module
-    #>
-
-    [OutputType([System.Void])]
-    param (
-        [Parameter(
-            Mandatory = $true,
-            ValueFromPipeline = $true)]
-        [Ansible.Basic.AnsibleModule]$Module
-    )
-
-    process {
-
-        if ($null -ne $Module.Params.guid -and $null -ne $Module.Params.name) {
-            $Module.FailJson("The 'guid' and 'name' parameters are mutually exclusive when state is 'absent'.")
-        }
-
-        $invalidParams = New-Object -TypeName System.Collections.ArrayList
-
-        if ($null -ne $Module.Params.definition_paths) {
-            $invalidParams.Add("definition_paths") | Out-Null
-        }
-
-        if ($null -ne $Module.Params.comments) {
-            $invalidParams.Add("comments") | Out-Null
-        }
-
-        if ($null -ne $Module.Params.enabled) {
-            $invalidParams.Add("enabled") | Out-Null
-        }
-
-        if ($null -ne $Module.Params.hidden) {
-            $invalidParams.Add("hidden") | Out-Null
-        }
-
-        if ($invalidParams.Count -gt 0) {
-            $Module.FailJson("The following parameters are invalid when state is absent: $($invalidParams -join ', ')")
-        }
-    }
-}
-
-function Confirm-SelectionProfileParamsAreValidForPresent {
-    <#
-    .SYNOPSIS
-    Confirms that the parameters are valid for the module when the state is 'present'.
-
-    .DESCRIPTION
-    This function confirms that the parameters are valid for the module when the state is 'present'.
-
-    .PARAMETER Module
-    The module object.
-
-    .EXAMPLE
-    Confirm-SelectionProfileParamsAreValidForPresent -Module $Module
-    #>
-
-    [OutputType([System.Void])]
-    param (
-        [Parameter(
-            Mandatory = $true,
-            ValueFromPipeline = $true)]
-        [Ansible.Basic.AnsibleModule]$Module,
-        [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName
-    )
-
-    process {
-
-        $definitionPaths = $Module.Params.definition_paths
-
-        if ($null -ne $definitionPaths) {
-
-            $addPaths = $definitionPaths.add
-            $removePaths = $definitionPaths.remove
-            $setPaths = $definitionPaths.set
-
-            if ($null -ne $addPaths) {
-
-                if ($addPaths.Count -eq 0) {
-                    $Module.FailJson("The 'definition_paths.add' parameter must contain at least one path, if provided.")
-                }
-
-                for ($i = 0; $i -lt $addPaths.Count; $i++) {
-
-                    if ([string]::IsNullOrEmpty($addPaths[$i])) {
-                        continue
-                    }
-
-                    $addPaths[$i] = $addPaths[$i] | Format-MDTPath
-
-                    $addPaths[$i] |
-                        Confirm-MDTPathIsValid -Module $Module -ParameterName "paths.add[$($i)]" |
-                        Out-Null
-
-                    if (-not (Test-Path -LiteralPath "$($MDTDriveName):\$($addPaths[$i])" -PathType Container)) {
-                        $Module.FailJson("The directory 'Operating Systems\$($addPaths[$i])' does not exist in the MDT share.")
-                    }
-                }
-            }
-
-            if ($null -ne $removePaths) {
-
-                if ($removePaths.Count -eq 0) {
-                    $Module.FailJson("The 'definition_paths.remove' parameter must contain at least one path, if provided.")
-                }
-
-                for ($i = 0; $i -lt $removePaths.Count; $i++) {
-
-                    if ([string]::IsNullOrEmpty($removePaths[$i])) {
-                        continue
-                    }
-
-                    $removePaths[$i] = $removePaths[$i] | Format-MDTPath
-
-                    $removePaths[$i] |
-                        Confirm-MDTPathIsValid -Module $Module -ParameterName "paths.remove[$($i)]" |
-                        Out-Null
-
-                    if (-not (Test-Path -LiteralPath "$($MDTDriveName):\$($removePaths[$i])" -PathType Container)) {
-                        $Module.FailJson("The directory 'Operating Systems\$($removePaths[$i])' does not exist in the MDT share.")
-                    }
-                }
-            }
-
-            if ($null -ne $addPaths -and $null -ne $removePaths) {
-
-                $intersection = [Array]($addPaths | Where-Object { $removePaths -contains $_ })
-
-                if ($intersection.Length -gt 0) {
-                    $Module.FailJson("The 'definition_paths.add' and 'definition_paths.remove' parameters must not contain the same path(s).")
-                }
-            }
-
-            if ($null -ne $setPaths) {
-
-                for ($i = 0; $i -lt $setPaths.Count; $i++) {
-
-                    if ([string]::IsNullOrEmpty($setPaths[$i])) {
-                        continue
-                    }
-
-                    $setPaths[$i] = $setPaths[$i] | Format-MDTPath
-
-                    $setPaths[$i] |
-                        Confirm-MDTPathIsValid -Module $Module -ParameterName "paths.set[$($i)]" |
-                        Out-Null
-
-                    if (-not (Test-Path -LiteralPath "$($MDTDriveName):\$($setPaths[$i])" -PathType Container)) {
-                        $Module.FailJson("The directory 'Operating Systems\$($setPaths[$i])' does not exist in the MDT share.")
-                    }
-                }
-            }
-        }
-    }
-}
-
-function Get-ExpectedSelectionProfile {
-    <#
-    .SYNOPSIS
-    Gets the expected selection profile.
-
-    .DESCRIPTION
-    This function gets the expected selection profile.
-
-    .PARAMETER Module
-    The Ansible module.
-
-    .PARAMETER MDTDriveName
-    The MDT drive name.
-
-    .PARAMETER Existing
-    The existing selection profile.
-
-    .EXAMPLE
-    Get-ExpectedSelectionProfile -Module $Module -MDTDriveName "DS001"
-    #>
-
-    [OutputType([System.Collections.Hashtable])]
-    param (
-        [Parameter(Mandatory = $true)]
-        [Ansible.Basic.AnsibleModule]$Module,
-        [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName,
-        [Parameter(Mandatory = $true)]
-        [AllowNull()]
-        [System.Collections.Hashtable]$Existing
-    )
-
-    $expected = @{
-        name = $Module.Params.name
-        read_only = $false
-    }
-
-    if ($null -ne $Existing.guid) {
-        $expected.guid = $Existing.guid
-    }
-    if ($null -ne $Module.Params.guid) {
-        $expected.guid = $Module.Params.guid
-    }
-
-    if ($null -ne $Module.Params.comments) {
-        $expected.comments = $Module.Params.comments
-    }
-    elseif ($null -ne $Existing) {
-        $expected.comments = $Existing.comments
-    }
-    else {
-        $expected.comments = ""
-    }
-
-    if ($null -ne $Module.Params.enabled) {
-        $expected.enabled = $Module.Params.enabled
-    }
-    elseif ($null -ne $Existing) {
-        $expected.enabled = $Existing.enabled
-    }
-    else {
-        $expected.enabled = $true
-    }
-
-    if ($null -ne $Module.Params.hidden) {
-        $expected.hidden = $Module.Params.hidden
-    }
-    elseif ($null -ne $Existing) {
-        $expected.hidden = $Existing.hidden
-    }
-    else {
-        $expected.hidden = $false
-    }
-
-    $setPaths = $Module.Params.definition_paths.set
-
-    if ($null -ne $setPaths) {
-        $expected.definition = $setPaths
-
-        return $expected
-    }
-
-    if ($null -ne $Existing) {
-        $existingDefinitionPaths = $Existing.definition_paths
-    }
-    else {
-        $existingDefinitionPaths = @{}
-    }
-
-    $addPaths = $Module.Params.definition_paths.add
-
-    if ($null -eq $addPaths) {
-        $addPaths = @()
-    }
-
-    $removePaths = $Module.Params.definition_paths.remove
-
-    if ($null -eq $removePaths) {
-        $removePaths = @()
-    }
-
-    $definitionPaths = New-Object -TypeName System.Collections.ArrayList
-
-    foreach ($existingPath in $existingDefinitionPaths) {
-
-        if ($removePaths -icontains $existingPath) {
-            continue
-        }
-
-        $definitionPaths.Add($existingPath) | Out-Null
-    }
-
-    foreach ($addPath in $addPaths) {
-
-        if ($definitionPaths -icontains $addPath) {
-            continue
-        }
-
-        $definitionPaths.Add($addPath) | Out-Null
-    }
-
-    $expected.definition = [string[]]$definitionPaths.ToArray()
-
-    return $expected
-}
-
-function Compare-ExpectedSelectionProfileToExisting {
-    <#
-    .SYNOPSIS
-    Compares the expected selection profile to the existing selection profile.
-
-    .DESCRIPTION
-    This function compares the expected selection profile to the existing selection profile.
-
-    .PARAMETER Expected
-    The expected selection profile.
-
-    .PARAMETER Existing
-    The existing selection profile.
-
-    .EXAMPLE
-    Compare-ExpectedSelectionProfileToExisting -Expected $expected -Existing $existing
-
-    .OUTPUTS
-    System.Collections.Hashtable
-    #>
-
-    [OutputType([System.Collections.Hashtable])]
-    param (
-        [Parameter(Mandatory = $true)]
-        [System.Collections.Hashtable]$Expected,
-        [Parameter(Mandatory = $true)]
-        [System.Collections.Hashtable]$Existing
-    )
-
-    $propertyChanges = @{}
-
-    if ($Existing.name -ne $Expected.name) {
-        $propertyChanges.Name = $Expected.name
-    }
-
-    $missingDefinitionPaths = [Array]($Expected.definition | Where-Object { $Existing.definition -notcontains $_ })
-    $extraDefinitionPaths = [Array]($Existing.definition | Where-Object { $Expected.definition -notcontains $_ })
-
-    if ($null -ne $missingDefinitionPaths -or $null -ne $extraDefinitionPaths) {
-        $propertyChanges.Definition = Convert-PathsToMDTSelectionProfileDefinition -Paths $Expected.definition
-    }
-
-    if ($Existing.comments -ne $Expected.comments) {
-
-        if ($Expected.comments -eq "") {
-            $propertyChanges.CommentsEmpty = $true
-        }
-        else {
-            $propertyChanges.Comments = $Expected.comments
-        }
-    }
-
-    if ($Existing.enabled -ne $Expected.enabled) {
-        $propertyChanges.Enabled = $Expected.enabled
-    }
-
-    if ($Existing.hidden -ne $Expected.hidden) {
-        $propertyChanges.Hidden = $Expected.hidden
-    }
-
-    return $propertyChanges
-}
-
 function Set-MDTSelectionProfile {
     <#
     .SYNOPSIS
@@ -506,124 +108,15 @@ function Set-MDTSelectionProfile {
         $selectionProfile.RenameItem($Name)
     }
 
-    $selectionProfile = Get-MDTSelectionProfile -Module $Module -MDTDriveName $MDTDriveName -Guid $Module.Params.guid -Name $Module.Params.name |
-        Format-MDTSelectionProfile
-
-    $Module.Diff.after = $selectionProfile
-    $Module.Result.selection_profile = $selectionProfile
-}
-
-function New-MDTSelectionProfile {
-    <#
-    .SYNOPSIS
-    Creates a new MDT selection profile.
-
-    .DESCRIPTION
-    This function creates a new MDT selection profile.
-
-    .PARAMETER Module
-    The Ansible module.
-
-    .PARAMETER MDTDriveName
-    The MDT drive name.
-
-    .PARAMETER Expected
-    The expected selection profile.
-
-    .EXAMPLE
-    New-MDTSelectionProfile -Module $module -MDTDriveName "DS001" -Expected $expected
-    #>
-
-    [OutputType([System.Void])]
-    param (
-        [Parameter(Mandatory = $true)]
-        [Ansible.Basic.AnsibleModule]$Module,
-        [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName,
-        [Parameter(Mandatory = $true)]
-        [System.Collections.Hashtable]$Expected
-    )
-
-    if ($Module.CheckMode) {
-        return
-    }
-
-    $definition = Convert-PathsToMDTSelectionProfileDefinition -Paths $Expected.definition
-
-    if ($Expected.enabled) {
-        $enableValue = "True"
-    }
-    else {
-        $enableValue = "False"
-    }
-
-    if ($Expected.hidden) {
-        $hideValue = "True"
-    }
-    else {
-        $hideValue = "False"
-    }
-
-    $newItemArgs = @{
-        Path = "$($MDTDriveName):\Selection Profiles\$($Expected.name)"
-        Definition = $definition
-        Comments = $Expected.comments
-        enable = $enableValue
-        hide = $hideValue
-        ReadOnly = "False"
-    }
-
-    if ($null -ne $Expected.guid) {
-        $newItemArgs.guid = $Expected.guid
-    }
-
-    New-Item @newItemArgs | Out-Null
+    Clear-MDTItemIndex -NodeType "SelectionProfile"
 
-    $selectionProfile = Get-MDTSelectionProfile -Module $Module -MDTDriveName $MDTDriveName -Guid $Expected.guid -Name $Expected.name |
+    $selectionProfile = Get-MDTSelectionProfile -Module $Module -MDTDriveName $MDTDriveName -Guid $Module.Params.guid -Name $Module.Params.name |
         Format-MDTSelectionProfile
 
     $Module.Diff.after = $selectionProfile
     $Module.Result.selection_profile = $selectionProfile
 }
 
-function Remove-MDTSelectionProfile {
-    <#
-    .SYNOPSIS
-    Removes an MDT selection profile.
-
-    .DESCRIPTION
-    This function removes an MDT selection profile.
-
-    .PARAMETER Module
-    The Ansible module.
-
-    .PARAMETER MDTDriveName
-    The MDT drive name.
-
-    .PARAMETER Existing
-    The existing selection profile.
-
-    .EXAMPLE
-    Remove-MDTSelectionProfile -Module $module -MDTDriveName "DS001" -Existing $existing
-    #>
-
-    [OutputType([System.Void])]
-    param (
-        [Parameter(Mandatory = $true)]
-        [Ansible.Basic.AnsibleModule]$Module,
-        [Parameter(Mandatory = $true)]
-        [string]$MDTDriveName,
-        [Parameter(Mandatory = $true)]
-        [System.Collections.Hashtable]$Existing
-    )
-
-    if ($Module.CheckMode) {
-        return
-    }
-
-    Remove-Item -LiteralPath "$($MDTDriveName):\Selection Profiles\$($Existing.name)" -Force | Out-Null
-}
-
 $spec = @{
     options = @{
         installation_path = @{
@@ -704,12 +197,41 @@ $spec = @{
 
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
+$module.Params.mdt_share_path = $module.Params.mdt_share_path.TrimEnd("\")
+$module.Params | Confirm-SelectionProfileParamsAreValid -Module $module | Out-Null
+
+if ($null -ne $module.Params.definition_paths) {
+
+    $folderPaths = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+    $itemTypes = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+
+    foreach ($path in @($module.Params.definition_paths.add; $module.Params.definition_paths.remove; $module.Params.definition_paths.set)) {
+
+        if ([string]::IsNullOrEmpty($path)) {
+            continue
+        }
+
+        $itemType = Get-MDTControlItemType -Path $path
+
+        if ($null -ne $itemType) {
+            $itemTypes.Add($itemType) | Out-Null
+        }
+    }
+
+    foreach ($itemType in $itemTypes) {
+
+        foreach ($folderPath in (Get-MDTControlFolderPath -Module $module -ItemType $itemType -IncludeRootFolder)) {
+            $folderPaths.Add($folderPath) | Out-Null
+        }
+    }
+
+    $module.Params | Confirm-SelectionProfileDefinitionPathsExist -Module $module -FolderPaths $folderPaths | Out-Null
+}
+
 Import-MDTModule -Module $module | Out-Null
 
 $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
 
-$module | Confirm-SelectionProfileParamsAreValid -MDTDriveName $mdtDrive.Name | Out-Null
-
 $existing = Get-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name |
     Format-MDTSelectionProfile
 
@@ -724,7 +246,7 @@ $state = $module.Params.state
 
 if ($state -eq "present") {
 
-    $expected = Get-ExpectedSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Existing $existing
+    $expected = Get-ExpectedSelectionProfile -Params $module.Params -Existing $existing
 
     $module.Diff.after = $expected
     $module.Result.selection_profile = $expected
@@ -740,10 +262,19 @@ if ($state -eq "present") {
         }
     }
     else {
+
         $module.Result.changed = $true
         New-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Expected $expected | Out-Null
-    }
 
+        if (-not $module.CheckMode) {
+
+            $selectionProfile = Get-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Guid $expected.guid -Name $expected.name |
+                Format-MDTSelectionProfile
+
+            $module.Diff.after = $selectionProfile
+            $module.Result.selection_profile = $selectionProfile
+        }
+    }
 }
 else {
 
@@ -756,6 +287,6 @@ else {
     }
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
+Remove-MDTPSDrive -Module $module | Out-Null
 
 $module.ExitJson()
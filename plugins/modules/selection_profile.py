@@ -162,4 +162,10 @@ selection_profile:
       type: bool
       description:
         - Whether the selection profile is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -2,6 +2,7 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.SelectionProfile
 
 function Confirm-SelectionProfileInfoParamsAreValid {
@@ -44,6 +45,15 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
         guid = @{
             type = 'str'
             required = $false
@@ -52,6 +62,20 @@ $spec = @{
             type = 'str'
             required = $false
         }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'read_only',
+                'definition',
+                'comments',
+                'enabled',
+                'hidden'
+            )
+        }
     }
     mutually_exclusive = @(
         , @('name', 'guid')
@@ -65,20 +89,37 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-SelectionProfileInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
 
-$mdtDrive = Get-MDTPSDrive -Module $module
+$fields = New-MDTReturnFieldSet -Module $module
+
+if ($module.Params.read_backend -eq 'control_files') {
 
-$selectionProfile = Get-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+    $selectionProfile = Get-MDTControlItem -Module $module -ItemType SelectionProfile -Guid $module.Params.guid -Name $module.Params.name
 
-if ($null -eq $selectionProfile) {
-    $module.Result.exists = $false
+    if ($null -eq $selectionProfile) {
+        $module.Result.exists = $false
+    }
+    else {
+        $module.Result.exists = $true
+        $module.Result.selection_profile = $selectionProfile | Format-MDTControlSelectionProfile -Fields $fields
+    }
 }
 else {
-    $module.Result.exists = $true
-    $module.Result.selection_profile = $selectionProfile | Format-MDTSelectionProfile
-}
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module
 
-$mdtDrive | Remove-PSDrive | Out-Null
+    $selectionProfile = Get-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Guid $module.Params.guid -Name $module.Params.name
+
+    if ($null -eq $selectionProfile) {
+        $module.Result.exists = $false
+    }
+    else {
+        $module.Result.exists = $true
+        $module.Result.selection_profile = $selectionProfile | Format-MDTSelectionProfile -Fields $fields
+    }
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+}
 
 $module.ExitJson()
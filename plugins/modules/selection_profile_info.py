@@ -16,6 +16,7 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.read_backend
 options:
   guid:
     type: str
@@ -29,6 +30,24 @@ options:
     description:
       - The name of the selection profile.
       - This is mutually exclusive with O(guid).  One of the two must be provided.
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - read_only
+      - definition
+      - comments
+      - enabled
+      - hidden
+    version_added: 1.3.0
+    description:
+      - The fields of the selection profile to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
+      - The definition of the selection profile is only parsed if V(definition) is included.
 """
 
 EXAMPLES = r"""
@@ -41,6 +60,14 @@ EXAMPLES = r"""
   trippsc2.mdt.selection_profile_info:
     mdt_share_path: C:\\MDTShare
     guid: "{12345678-1234-1234-1234-123456789012}"
+
+- name: Get only the GUID and definition of a selection profile
+  trippsc2.mdt.selection_profile_info:
+    mdt_share_path: C:\\MDTShare
+    name: Windows 11
+    return_fields:
+      - guid
+      - definition
 """
 
 RETURN = r"""
@@ -84,4 +111,10 @@ selection_profile:
       type: bool
       description:
         - Whether the selection profile is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -0,0 +1,442 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.SelectionProfile
+
+function ConvertTo-SelectionProfileControlProperty {
+    <#
+    .SYNOPSIS
+    Converts the property changes of a selection profile to the properties within the control file.
+
+    .DESCRIPTION
+    This function converts the property changes returned by Compare-ExpectedSelectionProfileToExisting to the
+    properties of the selection profile within SelectionProfiles.xml, so that they can be written by Set-MDTControlItem.
+
+    .PARAMETER PropertyChanges
+    The property changes of the selection profile.
+
+    .EXAMPLE
+    ConvertTo-SelectionProfileControlProperty -PropertyChanges $propertyChanges
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$PropertyChanges
+    )
+
+    $properties = @{}
+
+    if ($PropertyChanges.ContainsKey("Name")) {
+        $properties.Name = $PropertyChanges.Name
+    }
+
+    if ($PropertyChanges.ContainsKey("Definition")) {
+        $properties.Definition = $PropertyChanges.Definition
+    }
+
+    if ($PropertyChanges.ContainsKey("CommentsEmpty")) {
+        $properties.Comments = ""
+    }
+    elseif ($PropertyChanges.ContainsKey("Comments")) {
+        $properties.Comments = $PropertyChanges.Comments
+    }
+
+    if ($PropertyChanges.ContainsKey("Enabled")) {
+
+        if ($PropertyChanges.Enabled) {
+            $properties.enable = "True"
+        }
+        else {
+            $properties.enable = "False"
+        }
+    }
+
+    if ($PropertyChanges.ContainsKey("Hidden")) {
+
+        if ($PropertyChanges.Hidden) {
+            $properties.hide = "True"
+        }
+        else {
+            $properties.hide = "False"
+        }
+    }
+
+    return $properties
+}
+
+function Get-SelectionProfileDiff {
+    <#
+    .SYNOPSIS
+    Gets the diff of a selection profile that already exists.
+
+    .DESCRIPTION
+    This function gets the diff of a selection profile that already exists.
+    Only the properties that would change are included.
+    The definition within the diff contains only the include paths that would be removed, before, or added, after.
+
+    .PARAMETER Expected
+    The expected selection profile.
+
+    .PARAMETER Existing
+    The existing selection profile.
+
+    .EXAMPLE
+    Get-SelectionProfileDiff -Expected $expected -Existing $existing
+
+    .OUTPUTS
+    System.Collections.Hashtable
+    #>
+
+    [OutputType([System.Collections.Hashtable])]
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Expected,
+        [Parameter(Mandatory = $true)]
+        [System.Collections.Hashtable]$Existing
+    )
+
+    $before = @{}
+    $after = @{}
+
+    foreach ($property in @("name", "comments", "enabled", "hidden")) {
+
+        if ($Existing[$property] -ne $Expected[$property]) {
+            $before[$property] = $Existing[$property]
+            $after[$property] = $Expected[$property]
+        }
+    }
+
+    $definitionChanges = Compare-SelectionProfileDefinition -Expected $Expected -Existing $Existing
+
+    if ($definitionChanges.added.Length -gt 0 -or $definitionChanges.removed.Length -gt 0) {
+        $before.definition = $definitionChanges.removed
+        $after.definition = $definitionChanges.added
+    }
+
+    return @{
+        before = $before
+        after = $after
+    }
+}
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        selection_profiles = @{
+            type = 'list'
+            elements = 'dict'
+            required = $true
+            options = @{
+                guid = @{
+                    type = 'str'
+                    required = $false
+                }
+                name = @{
+                    type = 'str'
+                    required = $false
+                }
+                definition_paths = @{
+                    type = 'dict'
+                    required = $false
+                    options = @{
+                        add = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                        remove = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                        set = @{
+                            type = 'list'
+                            elements = 'str'
+                            required = $false
+                        }
+                    }
+                    mutually_exclusive = @(
+                        @('add', 'set'),
+                        @('remove', 'set')
+                    )
+                    required_one_of = @(
+                        , @('add', 'remove', 'set')
+                    )
+                }
+                comments = @{
+                    type = 'str'
+                    required = $false
+                }
+                enabled = @{
+                    type = 'bool'
+                    required = $false
+                }
+                hidden = @{
+                    type = 'bool'
+                    required = $false
+                }
+                state = @{
+                    type = 'str'
+                    required = $false
+                    default = 'present'
+                    choices = @(
+                        'absent',
+                        'present'
+                    )
+                }
+            }
+            required_if = @(
+                , @('state', 'present', @('name', 'definition_paths'))
+            )
+            required_one_of = @(
+                , @('name', 'guid')
+            )
+        }
+    }
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+$module.Params.mdt_share_path = $module.Params.mdt_share_path.TrimEnd("\")
+
+$selectionProfileParams = $module.Params.selection_profiles
+
+foreach ($params in $selectionProfileParams) {
+    $params | Confirm-SelectionProfileParamsAreValid -Module $module | Out-Null
+}
+
+$comparer = [System.StringComparer]::OrdinalIgnoreCase
+
+$folderPaths = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+$itemTypes = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+
+foreach ($params in $selectionProfileParams) {
+
+    foreach ($path in @($params.definition_paths.add; $params.definition_paths.remove; $params.definition_paths.set)) {
+
+        if ([string]::IsNullOrEmpty($path)) {
+            continue
+        }
+
+        $itemType = Get-MDTControlItemType -Path $path
+
+        if ($null -ne $itemType) {
+            $itemTypes.Add($itemType) | Out-Null
+        }
+    }
+}
+
+foreach ($itemType in $itemTypes) {
+
+    foreach ($folderPath in (Get-MDTControlFolderPath -Module $module -ItemType $itemType -IncludeRootFolder)) {
+        $folderPaths.Add($folderPath) | Out-Null
+    }
+}
+
+foreach ($params in $selectionProfileParams) {
+    $params | Confirm-SelectionProfileDefinitionPathsExist -Module $module -FolderPaths $folderPaths | Out-Null
+}
+
+$identifiers = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList $comparer
+$plans = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+foreach ($params in $selectionProfileParams) {
+
+    $existing = [Array](Get-MDTControlItem -Module $module -ItemType "SelectionProfile" -Guid $params.guid -Name $params.name |
+        Format-MDTControlSelectionProfile)
+
+    if ($null -ne $existing) {
+        $existing = $existing[0]
+    }
+
+    if ($null -ne $existing -and $existing.read_only) {
+        $module.FailJson("The selection profile '$($existing.name)' is read-only.")
+    }
+
+    $plan = @{
+        Params = $params
+        Existing = $existing
+        Expected = $null
+        PropertyChanges = $null
+        Changed = $false
+    }
+
+    if ($params.state -eq "present") {
+
+        $expected = Get-ExpectedSelectionProfile -Params $params -Existing $existing
+
+        $plan.Expected = $expected
+
+        if ($null -eq $existing) {
+            $plan.Changed = $true
+        }
+        else {
+
+            $plan.PropertyChanges = Compare-ExpectedSelectionProfileToExisting -Expected $expected -Existing $existing
+            $plan.Changed = $plan.PropertyChanges.Count -gt 0
+
+            if ($plan.PropertyChanges.ContainsKey("Name")) {
+
+                foreach ($namedSelectionProfile in (Get-MDTControlItem -Module $module -ItemType "SelectionProfile" -Name $expected.name)) {
+
+                    if ($namedSelectionProfile.guid -ne $existing.guid) {
+                        $module.FailJson("The selection profile '$($existing.name)' cannot be renamed to '$($expected.name)', because a selection profile with that name already exists.")
+                    }
+                }
+            }
+        }
+
+        $planIdentifiers = @{
+            guid = $expected.guid
+            name = $expected.name
+        }
+    }
+    elseif ($null -ne $existing) {
+
+        $plan.Changed = $true
+
+        $planIdentifiers = @{
+            guid = $existing.guid
+            name = $existing.name
+        }
+    }
+    else {
+
+        $planIdentifiers = @{
+            guid = $params.guid
+            name = $params.name
+        }
+    }
+
+    foreach ($identifierType in $planIdentifiers.Keys) {
+
+        $identifier = $planIdentifiers[$identifierType]
+
+        if ([string]::IsNullOrEmpty($identifier)) {
+            continue
+        }
+
+        if (-not $identifiers.Add("$($identifierType)|$($identifier)")) {
+            $module.FailJson("The selection profile with $($identifierType) '$($identifier)' is specified more than once in the 'selection_profiles' parameter.")
+        }
+    }
+
+    $plans.Add($plan)
+}
+
+$changedPlans = [Array]($plans | Where-Object { $_.Changed })
+
+if ($null -eq $changedPlans) {
+    $changedPlans = @()
+}
+
+# The changes to existing selection profiles are written to SelectionProfiles.xml together, before the MDT drive is
+# mounted, so that the provider never holds a stale copy of the control file.
+$controlProperties = @{}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "present" -and $null -ne $plan.Existing) {
+        $controlProperties[$plan.Existing.guid] = ConvertTo-SelectionProfileControlProperty -PropertyChanges $plan.PropertyChanges
+    }
+}
+
+Set-MDTControlItem -Module $module -ItemType "SelectionProfile" -Properties $controlProperties | Out-Null
+
+$providerPlans = [Array]($changedPlans | Where-Object { $_.Params.state -eq "absent" -or $null -eq $_.Existing })
+
+if ($null -ne $providerPlans -and -not $module.CheckMode) {
+
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module -ReadWrite
+
+    foreach ($plan in $providerPlans) {
+
+        if ($plan.Params.state -eq "absent") {
+            Remove-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Existing $plan.Existing | Out-Null
+        }
+    }
+
+    foreach ($plan in $providerPlans) {
+
+        if ($plan.Params.state -eq "present") {
+            New-MDTSelectionProfile -Module $module -MDTDriveName $mdtDrive.Name -Expected $plan.Expected | Out-Null
+        }
+    }
+
+    Clear-MDTControlCatalog -Module $module -ItemType "SelectionProfile"
+}
+
+$results = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+$before = New-Object -TypeName System.Collections.Generic.List[System.Object]
+$after = New-Object -TypeName System.Collections.Generic.List[System.Object]
+
+foreach ($plan in $plans) {
+
+    $result = @{
+        changed = $plan.Changed
+        state = $plan.Params.state
+    }
+
+    if ($plan.Params.state -eq "present") {
+
+        $selectionProfile = $plan.Expected
+
+        if ($plan.Changed -and -not $module.CheckMode) {
+
+            $selectionProfiles = [Array](Get-MDTControlItem -Module $module -ItemType "SelectionProfile" -Guid $plan.Expected.guid -Name $plan.Expected.name |
+                Format-MDTControlSelectionProfile)
+
+            $selectionProfile = $selectionProfiles[0]
+        }
+
+        $result.selection_profile = $selectionProfile
+
+        if ($null -eq $plan.Existing) {
+
+            $result.diff = @{
+                before = $null
+                after = $selectionProfile
+            }
+        }
+        else {
+            $result.diff = Get-SelectionProfileDiff -Expected $plan.Expected -Existing $plan.Existing
+        }
+    }
+    else {
+
+        $result.diff = @{
+            before = $plan.Existing
+            after = $null
+        }
+    }
+
+    $results.Add($result)
+    $before.Add($result.diff.before)
+    $after.Add($result.diff.after)
+}
+
+$module.Result.changed = $changedPlans.Length -gt 0
+$module.Result.selection_profiles = $results.ToArray()
+$module.Diff.before = $before.ToArray()
+$module.Diff.after = $after.ToArray()
+
+Remove-MDTPSDrive -Module $module | Out-Null
+
+$module.ExitJson()
@@ -0,0 +1,200 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: selection_profiles
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Creates, updates, or deletes multiple MDT selection profiles
+description:
+  - Creates, updates, or deletes multiple MDT selection profiles in a single module run.
+  - >-
+    The selection profiles are read once from C(SelectionProfiles.xml) in the C(Control) directory of the MDT share, and the
+    definition paths of every selection profile are compared with their expected values using case-insensitive sets.
+  - >-
+    Changes to selection profiles that already exist are written to C(SelectionProfiles.xml) together, so the control file is
+    saved at most once, no matter how many selection profiles change.
+  - >-
+    Selection profiles are removed and created through the MDT PowerShell provider, which is only loaded when a selection profile
+    is removed or created.
+  - >-
+    Every selection profile is validated before any selection profile is changed, so an invalid item does not leave the MDT share
+    partially changed.
+  - Each item of O(selection_profiles) accepts the same options as the M(trippsc2.mdt.selection_profile) module.
+  - A selection profile must not be specified more than once in O(selection_profiles).
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+options:
+  selection_profiles:
+    type: list
+    required: true
+    elements: dict
+    description:
+      - The selection profiles to create, update, or delete.
+    suboptions:
+      guid:
+        type: str
+        required: false
+        description:
+          - The GUID of the selection profile.
+          - If O(selection_profiles[].state=absent), either O(selection_profiles[].name) or O(selection_profiles[].guid) must be provided.
+          - If provided, the GUID will be used to identify the selection profile.
+      name:
+        type: str
+        required: false
+        description:
+          - The name of the selection profile.
+          - If O(selection_profiles[].state=absent), either O(selection_profiles[].name) or O(selection_profiles[].guid) must be provided.
+          - If O(selection_profiles[].state=present), this is required.
+          - If O(selection_profiles[].guid) is not provided, the name will be used to identify the selection profile.
+          - >-
+            If O(selection_profiles[].guid) is provided, the O(selection_profiles[].guid) will be used to identify the selection
+            profile and the selection profile's name will be set to the provided value.
+      definition_paths:
+        type: dict
+        required: false
+        description:
+          - A list of paths to include in the selection profile.
+          - Each path is relative to the root of the MDT share, such as C(Out-of-Box Drivers\\Dell).
+          - If O(selection_profiles[].state=present), this is required.
+          - If O(selection_profiles[].state=absent), this should not be provided.
+        suboptions:
+          add:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to add to the selection profile.
+              - This cannot be defined as an empty list.
+              - This is mutually exclusive with O(selection_profiles[].definition_paths.set).
+          remove:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to remove from the selection profile.
+              - This cannot be defined as an empty list.
+              - This is mutually exclusive with O(selection_profiles[].definition_paths.set).
+          set:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to set in the selection profile.
+              - >-
+                This is mutually exclusive with O(selection_profiles[].definition_paths.add) and
+                O(selection_profiles[].definition_paths.remove).
+      comments:
+        type: str
+        required: false
+        description:
+          - Comments about the selection profile.
+          - If O(selection_profiles[].state=absent), this should not be provided.
+          - >-
+            If O(selection_profiles[].state=present) and the selection profile does not exist, this will set the comments to an
+            empty string.
+      enabled:
+        type: bool
+        required: false
+        description:
+          - Whether the selection profile is enabled.
+          - If O(selection_profiles[].state=absent), this should not be provided.
+          - >-
+            If O(selection_profiles[].state=present) and the selection profile does not exist, this will set the selection profile
+            to enabled.
+      hidden:
+        type: bool
+        required: false
+        description:
+          - Whether the selection profile is hidden.
+          - If O(selection_profiles[].state=absent), this should not be provided.
+          - >-
+            If O(selection_profiles[].state=present) and the selection profile does not exist, this will set the selection profile
+            to not hidden.
+      state:
+        type: str
+        required: false
+        default: present
+        choices:
+          - present
+          - absent
+        description:
+          - The expected state of the selection profile.
+"""
+
+EXAMPLES = r"""
+- name: Create, update, and remove MDT selection profiles
+  trippsc2.mdt.selection_profiles:
+    mdt_share_path: C:\\MDTShare
+    selection_profiles:
+      - name: Dell Latitude 7440
+        definition_paths:
+          set:
+            - Out-of-Box Drivers\\Dell\\Latitude 7440
+      - name: HP EliteBook 840
+        definition_paths:
+          add:
+            - Out-of-Box Drivers\\HP\\EliteBook 840
+        comments: Drivers for the HP EliteBook 840
+      - name: Lenovo ThinkPad T14
+        state: absent
+"""
+
+RETURN = r"""
+selection_profiles:
+  type: list
+  elements: dict
+  returned: success
+  description:
+    - The result for each item of O(selection_profiles), in the same order.
+  contains:
+    changed:
+      type: bool
+      description:
+        - Whether the selection profile was changed.
+    state:
+      type: str
+      description:
+        - The state of the selection profile.
+    selection_profile:
+      type: dict
+      returned: O(selection_profiles[].state=present)
+      description:
+        - The current state of the selection profile.
+        - >-
+          This has the same structure as the RV(trippsc2.mdt.selection_profile#module:selection_profile) return value of the
+          M(trippsc2.mdt.selection_profile) module.
+    diff:
+      type: dict
+      description:
+        - The changes to the selection profile.
+      contains:
+        before:
+          type: dict
+          description:
+            - The state of the selection profile before the module run.
+            - This is V(null) if the selection profile did not exist.
+            - >-
+              If the selection profile already existed and O(selection_profiles[].state=present), this only contains the
+              properties that changed, and C(definition) only contains the paths that were removed.
+        after:
+          type: dict
+          description:
+            - The state of the selection profile after the module run.
+            - This is V(null) if O(selection_profiles[].state=absent).
+            - >-
+              If the selection profile already existed, this only contains the properties that changed, and C(definition)
+              only contains the paths that were added.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
+"""
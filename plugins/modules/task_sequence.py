@@ -341,4 +341,10 @@ task_sequence:
       type: bool
       description:
         - Whether the task sequence is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
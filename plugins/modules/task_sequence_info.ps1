@@ -2,6 +2,7 @@
 
 #AnsibleRequires -CSharpUtil Ansible.Basic
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.ControlFile
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.OperatingSystem
 #AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.TaskSequence
 
@@ -45,6 +46,15 @@ $spec = @{
             type = 'path'
             required = $true
         }
+        read_backend = @{
+            type = 'str'
+            required = $false
+            default = 'provider'
+            choices = @(
+                'provider',
+                'control_files'
+            )
+        }
         id = @{
             type = 'str'
             required = $false
@@ -58,6 +68,27 @@ $spec = @{
             required = $false
             default = $false
         }
+        return_fields = @{
+            type = 'list'
+            elements = 'str'
+            required = $false
+            choices = @(
+                'guid',
+                'name',
+                'id',
+                'template',
+                'version',
+                'comments',
+                'enabled',
+                'hidden',
+                'paths',
+                'operating_system',
+                'full_name',
+                'organization',
+                'ie_home_page',
+                'product_key_type'
+            )
+        }
     }
     mutually_exclusive = @(
         , @('name', 'id')
@@ -71,12 +102,38 @@ $spec = @{
 $module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
 
 $module | Confirm-TaskSequenceInfoParamsAreValid | Out-Null
-Import-MDTModule -Module $module | Out-Null
 
-$mdtDrive = Get-MDTPSDrive -Module $module
+$additionalFields = @()
+
+if ($module.Params.include_secrets) {
+    $additionalFields = @("product_key", "admin_password")
+}
+
+$fields = New-MDTReturnFieldSet -Module $module -AdditionalFields $additionalFields
+
+if ($module.Params.read_backend -eq 'control_files') {
 
-$taskSequence = Get-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Id $module.Params.id -Name $module.Params.name |
-    Format-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -IncludeSecrets:$module.Params.include_secrets
+    $catalog = Get-MDTControlCatalog -Module $module -ItemType TaskSequence
+    $operatingSystemCatalog = Get-MDTControlCatalog -Module $module -ItemType OperatingSystem
+
+    $taskSequence = Get-MDTControlItem -Module $module -ItemType TaskSequence -Id $module.Params.id -Name $module.Params.name |
+        Format-MDTControlTaskSequence `
+            -Module $module `
+            -Catalog $catalog `
+            -OperatingSystemCatalog $operatingSystemCatalog `
+            -Fields $fields `
+            -IncludeSecrets:$module.Params.include_secrets
+}
+else {
+    Import-MDTModule -Module $module | Out-Null
+
+    $mdtDrive = Get-MDTPSDrive -Module $module
+
+    $taskSequence = Get-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Id $module.Params.id -Name $module.Params.name |
+        Format-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Fields $fields -IncludeSecrets:$module.Params.include_secrets
+
+    Remove-MDTPSDrive -Module $module | Out-Null
+}
 
 if ($null -eq $taskSequence) {
     $module.Result.exists = $false
@@ -86,6 +143,4 @@ else {
     $module.Result.task_sequence = $taskSequence
 }
 
-$mdtDrive | Remove-PSDrive | Out-Null
-
 $module.ExitJson()
@@ -16,6 +16,7 @@ extends_documentation_fragment:
   - trippsc2.mdt.action_group
   - trippsc2.mdt.check_mode_read_only
   - trippsc2.mdt.common
+  - trippsc2.mdt.read_backend
 options:
   id:
     type: str
@@ -35,6 +36,32 @@ options:
     default: false
     description:
       - Whether to include secrets in the output.
+  return_fields:
+    type: list
+    elements: str
+    required: false
+    choices:
+      - guid
+      - name
+      - id
+      - template
+      - version
+      - comments
+      - enabled
+      - hidden
+      - paths
+      - operating_system
+      - full_name
+      - organization
+      - ie_home_page
+      - product_key_type
+    version_added: 1.3.0
+    description:
+      - The fields of the task sequence to return.
+      - If not provided, every field is returned.
+      - Fields that are not returned are not built, which reduces the work done for large MDT shares.
+      - The secrets requested by O(include_secrets) are returned regardless of this option.
+      - The C(Unattend.xml) file of the task sequence is only read if one of its values is returned.
 """
 
 EXAMPLES = r"""
@@ -48,6 +75,14 @@ EXAMPLES = r"""
     mdt_share_path: C:\\MDTShare
     id: WIN11-ENT
     include_secrets: true
+
+- name: Get only the ID and operating system of a task sequence
+  trippsc2.mdt.task_sequence_info:
+    mdt_share_path: C:\\MDTShare
+    id: WIN11-ENT
+    return_fields:
+      - id
+      - operating_system
 """
 
 RETURN = r"""
@@ -142,4 +177,10 @@ task_sequence:
       type: bool
       description:
         - Whether the task sequence is hidden.
+mdt_drive_mount_time:
+  type: float
+  returned: O(read_backend=provider)
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
 """
@@ -0,0 +1,320 @@
+#!powershell
+
+#AnsibleRequires -CSharpUtil Ansible.Basic
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.Common
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.OperatingSystem
+#AnsibleRequires -PowerShell ansible_collections.trippsc2.mdt.plugins.module_utils.TaskSequence
+
+$spec = @{
+    options = @{
+        installation_path = @{
+            type = 'path'
+            required = $false
+            default = 'C:\Program Files\Microsoft Deployment Toolkit'
+        }
+        mdt_share_path = @{
+            type = 'path'
+            required = $true
+        }
+        task_sequences = @{
+            type = 'list'
+            elements = 'dict'
+            required = $true
+            options = @{
+                id = @{
+                    type = 'str'
+                    required = $false
+                }
+                name = @{
+                    type = 'str'
+                    required = $false
+                }
+                paths = @{
+                    type = 'dict'
+                    required = $false
+                    options = @{
+                        add = @{
+                            type = 'list'
+                            required = $false
+                            elements = 'str'
+                        }
+                        remove = @{
+                            type = 'list'
+                            required = $false
+                            elements = 'str'
+                        }
+                        set = @{
+                            type = 'list'
+                            required = $false
+                            elements = 'str'
+                        }
+                    }
+                    mutually_exclusive = @(
+                        @('add', 'set'),
+                        @('remove', 'set')
+                    )
+                    required_one_of = @(
+                        , @('add', 'remove', 'set')
+                    )
+                }
+                template = @{
+                    type = 'str'
+                    required = $false
+                }
+                operating_system_guid = @{
+                    type = 'str'
+                    required = $false
+                }
+                operating_system_name = @{
+                    type = 'str'
+                    required = $false
+                }
+                product_key_type = @{
+                    type = 'str'
+                    required = $false
+                    choices = @('none', 'mak', 'retail')
+                }
+                product_key = @{
+                    type = 'str'
+                    required = $false
+                    no_log = $true
+                }
+                admin_password = @{
+                    type = 'str'
+                    required = $false
+                    no_log = $true
+                }
+                full_name = @{
+                    type = 'str'
+                    required = $false
+                }
+                organization = @{
+                    type = 'str'
+                    required = $false
+                }
+                ie_home_page = @{
+                    type = 'str'
+                    required = $false
+                }
+                version = @{
+                    type = 'str'
+                    required = $false
+                }
+                comments = @{
+                    type = 'str'
+                    required = $false
+                }
+                enabled = @{
+                    type = 'bool'
+                    required = $false
+                }
+                hidden = @{
+                    type = 'bool'
+                    required = $false
+                }
+                state = @{
+                    type = 'str'
+                    required = $false
+                    choices = @('present', 'absent')
+                    default = 'present'
+                }
+            }
+            mutually_exclusive = @(
+                , @('operating_system_guid', 'operating_system_name')
+            )
+            required_by = @{
+                'product_key' = @(, 'product_key_type')
+            }
+            required_if = @(
+                @('state', 'present', @('id', 'name', 'template', 'full_name', 'organization')),
+                @('state', 'present', @('operating_system_guid', 'operating_system_name'), $true)
+            )
+            required_one_of = @(
+                , @('name', 'id')
+            )
+        }
+    }
+    supports_check_mode = $true
+}
+
+$module = [Ansible.Basic.AnsibleModule]::Create($args, $spec)
+
+Import-MDTModule -Module $module | Out-Null
+
+$mdtDrive = Get-MDTPSDrive -Module $module
+
+$taskSequenceParams = $module.Params.task_sequences
+
+foreach ($params in $taskSequenceParams) {
+    $params | Confirm-TaskSequenceParamsAreValid -Module $module -MDTDriveName $mdtDrive.Name | Out-Null
+}
+
+$identifiers = New-Object -TypeName System.Collections.Generic.HashSet[string] -ArgumentList ([System.StringComparer]::OrdinalIgnoreCase)
+$plans = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+
+foreach ($params in $taskSequenceParams) {
+
+    $existingTaskSequences = [Array](Get-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Id $params.id -Name $params.name)
+    $existing = $existingTaskSequences | Format-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -IncludeSecrets
+    $existingWithoutSecrets = $null
+
+    if ($null -ne $existing) {
+
+        $existingWithoutSecrets = $existing.Clone()
+        $existingWithoutSecrets.Remove("admin_password")
+        $existingWithoutSecrets.Remove("product_key")
+    }
+
+    $plan = @{
+        Params = $params
+        ExistingTaskSequences = $existingTaskSequences
+        Existing = $existing
+        ExistingWithoutSecrets = $existingWithoutSecrets
+        Expected = $null
+        ExpectedWithoutSecrets = $null
+        PropertyChanges = $null
+        Changed = $false
+    }
+
+    if ($params.state -eq "present") {
+
+        $expected = Get-ExpectedTaskSequence -Module $module -Params $params -MDTDriveName $mdtDrive.Name -Existing $existing
+
+        $expectedWithoutSecrets = $expected.Clone()
+        $expectedWithoutSecrets.Remove("admin_password")
+        $expectedWithoutSecrets.Remove("product_key")
+
+        $plan.Expected = $expected
+        $plan.ExpectedWithoutSecrets = $expectedWithoutSecrets
+
+        if ($null -eq $existing) {
+            $plan.Changed = $true
+        }
+        else {
+
+            if ($existing.template -ne $expected.template) {
+                $module.Warn("The 'template' parameter cannot be changed for task sequence '$($existing.id)'.")
+            }
+
+            $plan.PropertyChanges = Compare-ExpectedTaskSequenceToExisting -MDTDriveName $mdtDrive.Name -Expected $expected -Existing $existing
+            $plan.Changed = $plan.PropertyChanges.Count -gt 0
+        }
+
+        $planIdentifiers = @{
+            guid = $existing.guid
+            id = $expected.id
+            name = $expected.name
+        }
+    }
+    elseif ($null -ne $existing) {
+
+        $plan.Changed = $true
+
+        $planIdentifiers = @{
+            guid = $existing.guid
+            id = $existing.id
+            name = $existing.name
+        }
+    }
+    else {
+
+        $planIdentifiers = @{
+            id = $params.id
+            name = $params.name
+        }
+    }
+
+    foreach ($identifierType in $planIdentifiers.Keys) {
+
+        $identifier = $planIdentifiers[$identifierType]
+
+        if ([string]::IsNullOrEmpty($identifier)) {
+            continue
+        }
+
+        if (-not $identifiers.Add("$($identifierType)|$($identifier)")) {
+            $module.FailJson("The task sequence with $($identifierType) '$($identifier)' is specified more than once in the 'task_sequences' parameter.")
+        }
+    }
+
+    $plans.Add($plan)
+}
+
+$changedPlans = [Array]($plans | Where-Object { $_.Changed })
+
+if ($null -eq $changedPlans) {
+    $changedPlans = @()
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "absent") {
+        Remove-MDTTaskSequence -Module $module -TaskSequences $plan.ExistingTaskSequences | Out-Null
+    }
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "present" -and $null -ne $plan.Existing) {
+
+        $propertyChanges = $plan.PropertyChanges
+
+        Set-MDTTaskSequence `
+            -Module $module `
+            -TaskSequence $plan.ExistingTaskSequences[0] `
+            -Existing $plan.Existing `
+            @propertyChanges | Out-Null
+    }
+}
+
+foreach ($plan in $changedPlans) {
+
+    if ($plan.Params.state -eq "present" -and $null -eq $plan.Existing) {
+        New-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Expected $plan.Expected | Out-Null
+    }
+}
+
+$results = New-Object -TypeName System.Collections.Generic.List[System.Collections.Hashtable]
+$before = New-Object -TypeName System.Collections.Generic.List[System.Object]
+$after = New-Object -TypeName System.Collections.Generic.List[System.Object]
+
+foreach ($plan in $plans) {
+
+    $result = @{
+        changed = $plan.Changed
+        state = $plan.Params.state
+    }
+
+    $taskSequence = $null
+
+    if ($plan.Params.state -eq "present") {
+
+        $taskSequence = $plan.ExpectedWithoutSecrets
+
+        if ($plan.Changed -and -not $module.CheckMode) {
+
+            $taskSequence = Get-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name -Id $plan.Expected.id -Name $plan.Expected.name |
+                Format-MDTTaskSequence -Module $module -MDTDriveName $mdtDrive.Name
+        }
+
+        $result.task_sequence = $taskSequence
+    }
+
+    $result.diff = @{
+        before = $plan.ExistingWithoutSecrets
+        after = $taskSequence
+    }
+
+    $results.Add($result)
+    $before.Add($plan.ExistingWithoutSecrets)
+    $after.Add($taskSequence)
+}
+
+$module.Result.changed = $changedPlans.Length -gt 0
+$module.Result.task_sequences = $results.ToArray()
+$module.Diff.before = $before.ToArray()
+$module.Diff.after = $after.ToArray()
+
+Remove-MDTPSDrive -Module $module | Out-Null
+
+$module.ExitJson()
@@ -0,0 +1,286 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+
+from __future__ import (absolute_import, division, print_function)
+__metaclass__ = type
+
+DOCUMENTATION = r"""
+module: task_sequences
+version_added: 1.3.0
+author:
+  - Jim Tarpley (@trippsc2)
+short_description: Creates, updates, or deletes multiple MDT task sequences
+description:
+  - Creates, updates, or deletes multiple MDT task sequences in a single module run.
+  - >-
+    The MDT share is scanned for task sequences once, every task sequence is compared with its expected configuration, and then the
+    task sequences are removed, updated, and created in that order.
+  - >-
+    Operating systems referenced by O(task_sequences[].operating_system_guid) or O(task_sequences[].operating_system_name) are
+    looked up once per module run, no matter how many task sequences reference them.
+  - >-
+    The C(ts.xml) and C(Unattend.xml) files of a task sequence are each read and written at most once, and are only written when
+    a value stored in them changes.
+  - >-
+    Every task sequence is validated before any task sequence is changed, so an invalid item does not leave the MDT share
+    partially changed.
+  - Each item of O(task_sequences) accepts the same options as the M(trippsc2.mdt.task_sequence) module.
+  - A task sequence must not be specified more than once in O(task_sequences).
+extends_documentation_fragment:
+  - trippsc2.mdt.action_group
+  - trippsc2.mdt.check_mode
+  - trippsc2.mdt.common
+options:
+  task_sequences:
+    type: list
+    required: true
+    elements: dict
+    description:
+      - The task sequences to create, update, or delete.
+    suboptions:
+      id:
+        type: str
+        required: false
+        description:
+          - The ID of the task sequence.
+          - Either O(task_sequences[].name) or O(task_sequences[].id) must be provided.
+          - The GUID will be used to identify the task sequence, if provided.
+          - If O(task_sequences[].state=absent), O(task_sequences[].name) and O(task_sequences[].id) are mutually exclusive.
+          - If O(task_sequences[].state=present), this is required and will always be used to identify the task sequence.
+      name:
+        type: str
+        required: false
+        description:
+          - The name of the task sequence.
+          - Either O(task_sequences[].name) or O(task_sequences[].id) must be provided.
+          - If O(task_sequences[].id) is not provided, the name will be used to identify the task sequence.
+          - If O(task_sequences[].state=absent), O(task_sequences[].name) and O(task_sequences[].id) are mutually exclusive. If O(task_sequences[].id) is not provided, this will be used to identify the task sequence.
+          - If O(task_sequences[].state=present), this is required.
+      paths:
+        type: dict
+        required: false
+        description:
+          - The expected configuration for paths at which the task sequence should be found.
+          - If not provided and the task sequence does not exist, the task sequence will be placed in the V(Task Sequences) folder.
+          - If not provided and the task sequence exists, the task sequence will not be moved or copied into any folders.
+        suboptions:
+          add:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of additional paths to add to the task sequence.
+              - These paths are relative to the V(Task Sequences) folder within the MDT share.
+              - This is mutually exclusive with O(task_sequences[].paths.set).
+          remove:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to remove from the task sequence.
+              - These paths are relative to the V(Task Sequences) folder within the MDT share.
+              - This is mutually exclusive with O(task_sequences[].paths.set).
+              - >-
+                If the task sequence is not found at any other paths than these, the module will fail.
+                Use O(task_sequences[].state=absent) to remove the task sequence instead.
+          set:
+            type: list
+            required: false
+            elements: str
+            description:
+              - A list of paths to set for the task sequence.
+              - These paths are relative to the V(Task Sequences) folder within the MDT share.
+              - This is mutually exclusive with O(task_sequences[].paths.add) and O(task_sequences[].paths.remove).
+              - If this is an empty list, the module will fail.  Use O(task_sequences[].state=absent) to remove the task sequence instead.
+      template:
+        type: str
+        required: false
+        description:
+          - The template file name from which the task sequence was imported.
+          - The file should be located in the C(Templates) folder within the MDT share or in the C(Templates) folder of the MDT program directory.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If O(task_sequences[].state=present), this is required.
+      operating_system_guid:
+        type: str
+        required: false
+        description:
+          - The GUID of the operating system to use for the task sequence.
+          - O(task_sequences[].operating_system_guid) and O(task_sequences[].operating_system_name) are mutually exclusive.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, this or O(task_sequences[].operating_system_name) are required.
+      operating_system_name:
+        type: str
+        required: false
+        description:
+          - The name of the operating system to use for the task sequence.
+          - O(task_sequences[].operating_system_guid) and O(task_sequences[].operating_system_name) are mutually exclusive.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, this or O(task_sequences[].operating_system_guid) are required.
+      product_key_type:
+        type: str
+        required: false
+        choices:
+          - none
+          - mak
+          - retail
+        description:
+          - The type of product key to provide to the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided, O(task_sequences[].state=present), and the task sequence does not exist, this will default to V(none).
+          - If not provided, O(task_sequences[].state=present), and the task sequence exists, this will default to the existing product key type.
+      product_key:
+        type: str
+        required: false
+        description:
+          - The product key to provide to the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If O(task_sequences[].product_key_type=none), this should not be provided.
+          - If O(task_sequences[].product_key_type=mak) or O(task_sequences[].product_key_type=retail), this is required.
+      admin_password:
+        type: str
+        required: false
+        description:
+          - The administrator password to provide to the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, the administrator password will not be changed.
+          - If not provided and the task sequence does not exist, the administrator password will be left blank.
+          - If provided as an empty string, the administrator password will be removed.
+      full_name:
+        type: str
+        required: false
+        description:
+          - The full name of the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If O(task_sequences[].state=present), this is required.
+      organization:
+        type: str
+        required: false
+        description:
+          - The organization name for the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If O(task_sequences[].state=present), this is required.
+      ie_home_page:
+        type: str
+        required: false
+        description:
+          - The home page for Internet Explorer.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided, O(task_sequences[].state=present), and the task sequence exists, this will not be changed.
+          - If not provided, O(task_sequences[].state=present), and the task sequence does not exist, this will be set to V(about:blank).
+          - If provided and O(task_sequences[].state=present), the home page will be set to the provided value.
+      version:
+        type: str
+        required: false
+        description:
+          - The version of the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, the version will not be changed.
+          - If not provided and the task sequence does not exist, the version will be set to V(1.0).
+      comments:
+        type: str
+        required: false
+        description:
+          - Comments about the task sequence.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, the comments will not be changed.
+          - If not provided and the task sequence does not exist, the comments will be left blank.
+      enabled:
+        type: bool
+        required: false
+        description:
+          - Whether the task sequence is enabled.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, the enabled state will not be changed.
+          - If not provided and the task sequence does not exist, the task sequence will be created enabled.
+      hidden:
+        type: bool
+        required: false
+        description:
+          - Whether the task sequence is hidden.
+          - If O(task_sequences[].state=absent), this should not be provided.
+          - If not provided and the task sequence exists, the hidden state will not be changed.
+          - If not provided and the task sequence does not exist, the task sequence will be created and not be hidden.
+      state:
+        type: str
+        required: false
+        default: present
+        choices:
+          - present
+          - absent
+        description:
+          - The state of the task sequence.
+          - If V(present), the task sequence will be created or updated.
+          - If V(absent), the task sequence will be removed.
+"""
+
+EXAMPLES = r"""
+- name: Create, update, and remove MDT task sequences
+  trippsc2.mdt.task_sequences:
+    mdt_share_path: C:\\MDTShare
+    task_sequences:
+      - id: WIN11-ENT
+        name: Windows 11 Enterprise
+        template: Client.xml
+        operating_system_name: Windows 11 Enterprise
+        product_key_type: mak
+        product_key: 12345-67890-12345-67890-12345
+        full_name: Contoso
+        organization: Contoso
+      - id: WIN11-EDU
+        name: Windows 11 Education
+        template: Client.xml
+        operating_system_name: Windows 11 Education
+        full_name: Contoso
+        organization: Contoso
+        paths:
+          set:
+            - Windows 11\\Site 1
+            - Windows 11\\Site 2
+      - id: WIN10-ENT
+        state: absent
+"""
+
+RETURN = r"""
+task_sequences:
+  type: list
+  elements: dict
+  returned: success
+  description:
+    - The result for each item of O(task_sequences), in the same order.
+  contains:
+    changed:
+      type: bool
+      description:
+        - Whether the task sequence was changed.
+    state:
+      type: str
+      description:
+        - The state of the task sequence.
+    task_sequence:
+      type: dict
+      returned: O(task_sequences[].state=present)
+      description:
+        - The current state of the task sequence.
+        - This has the same structure as the RV(trippsc2.mdt.task_sequence#module:task_sequence) return value of the M(trippsc2.mdt.task_sequence) module.
+    diff:
+      type: dict
+      description:
+        - The state of the task sequence before and after the module run.
+      contains:
+        before:
+          type: dict
+          description:
+            - The state of the task sequence before the module run.
+            - This is V(null) if the task sequence did not exist.
+        after:
+          type: dict
+          description:
+            - The state of the task sequence after the module run.
+            - This is V(null) if O(task_sequences[].state=absent).
+mdt_drive_mount_time:
+  type: float
+  returned: success
+  description:
+    - The time spent mounting MDT PowerShell drives during the module run, in seconds.
+  sample: 1.25
+"""
@@ -0,0 +1,189 @@
+<#
+.SYNOPSIS
+Measures the time taken to hash a tree of files serially, in parallel, and from the file hash cache.
+
+.DESCRIPTION
+This script generates a tree of files with reproducible content and measures the time taken by the file hashing
+functions of Common.psm1 to hash it in three ways.
+Serial - Get-MDTFileChecksum with a parallelism of 1.
+Parallel - Get-MDTFileChecksum with the specified parallelism.
+Cached - Get-MDTFileHash with the file hash cache open, after every file has been hashed once.
+Each mode is run once to warm up the file system cache and then measured the specified number of times.
+The checksums of the serial and parallel runs are compared, so the script fails if they ever differ.
+
+The cached mode identifies files by their file ID, which is only available on Windows.
+The script should be run on Windows PowerShell 5.1 or PowerShell 7 on Windows, on the same kind of volume as the MDT
+share being tuned.
+
+.PARAMETER Path
+The directory in which the file tree is generated.
+Defaults to a new directory within the temporary directory, which is removed afterwards.
+
+.PARAMETER FileCount
+The number of files generated.
+
+.PARAMETER FileSize
+The size of each file in bytes.
+
+.PARAMETER Parallelism
+The parallelism of the parallel mode.
+If 0, the number of logical processors is used, matching the hash_parallelism module option.
+
+.PARAMETER Iterations
+The number of times each mode is measured.
+
+.PARAMETER Seed
+The seed of the random file content.
+
+.EXAMPLE
+.\tests\benchmark\Measure-MDTFileHash.ps1 -FileCount 10000 -FileSize 65536
+
+This example measures hashing a tree of 10,000 files of 64 KiB each.
+#>
+
+[CmdletBinding()]
+param (
+    [Parameter(Mandatory = $false)]
+    [string]$Path,
+    [Parameter(Mandatory = $false)]
+    [ValidateRange(1, [int]::MaxValue)]
+    [int]$FileCount = 10000,
+    [Parameter(Mandatory = $false)]
+    [ValidateRange(0, [int]::MaxValue)]
+    [int]$FileSize = 65536,
+    [Parameter(Mandatory = $false)]
+    [ValidateRange(0, [int]::MaxValue)]
+    [int]$Parallelism = 0,
+    [Parameter(Mandatory = $false)]
+    [ValidateRange(1, [int]::MaxValue)]
+    [int]$Iterations = 3,
+    [Parameter(Mandatory = $false)]
+    [int]$Seed = 4
+)
+
+$ErrorActionPreference = 'Stop'
+
+. (Join-Path -Path $PSScriptRoot -ChildPath '../pester/AnsibleBasic.ps1')
+
+$moduleUtilsPath = Join-Path -Path $PSScriptRoot -ChildPath '../../plugins/module_utils'
+
+if ($null -eq ('ansible_collections.trippsc2.mdt.plugins.module_utils.FileHash.FileHash' -as [type])) {
+    Add-Type -TypeDefinition ([System.IO.File]::ReadAllText((Join-Path -Path $moduleUtilsPath -ChildPath 'FileHash.cs')))
+}
+
+Import-Module -Name (Join-Path -Path $moduleUtilsPath -ChildPath 'Common.psm1') -Force
+
+if ($Parallelism -eq 0) {
+    $Parallelism = [System.Environment]::ProcessorCount
+}
+
+$removePath = [string]::IsNullOrEmpty($Path)
+
+if ($removePath) {
+    $Path = Join-Path -Path ([System.IO.Path]::GetTempPath()) -ChildPath "mdt-file-hash-$([System.Guid]::NewGuid().ToString('N'))"
+}
+
+function Measure-Mode {
+
+    param (
+        [Parameter(Mandatory = $true)]
+        [string]$Mode,
+        [Parameter(Mandatory = $true)]
+        [int]$ModeParallelism,
+        [Parameter(Mandatory = $true)]
+        [scriptblock]$ScriptBlock
+    )
+
+    & $ScriptBlock | Out-Null
+
+    $times = New-Object -TypeName System.Collections.Generic.List[double]
+
+    for ($iteration = 0; $iteration -lt $Iterations; $iteration++) {
+        $stopwatch = [System.Diagnostics.Stopwatch]::StartNew()
+        & $ScriptBlock | Out-Null
+        $stopwatch.Stop()
+        $times.Add($stopwatch.Elapsed.TotalMilliseconds)
+    }
+
+    $times.Sort()
+
+    return [PSCustomObject]@{
+        Mode = $Mode
+        Parallelism = $ModeParallelism
+        Files = $FileCount
+        MedianMs = [System.Math]::Round($times[[int][System.Math]::Floor(($times.Count - 1) / 2)], 1)
+        MinMs = [System.Math]::Round($times[0], 1)
+        MaxMs = [System.Math]::Round($times[$times.Count - 1], 1)
+    }
+}
+
+try {
+    Write-Verbose "Generating $($FileCount) files of $($FileSize) bytes in '$($Path)'."
+
+    $random = New-Object -TypeName System.Random -ArgumentList $Seed
+    $buffer = New-Object -TypeName 'byte[]' -ArgumentList $FileSize
+    $paths = New-Object -TypeName 'string[]' -ArgumentList $FileCount
+
+    for ($index = 0; $index -lt $FileCount; $index++) {
+        $directory = [System.IO.Path]::Combine($Path, "Directory$([System.Math]::Floor($index / 100))")
+        [System.IO.Directory]::CreateDirectory($directory) | Out-Null
+
+        $random.NextBytes($buffer)
+        $paths[$index] = [System.IO.Path]::Combine($directory, "File$($index).bin")
+        [System.IO.File]::WriteAllBytes($paths[$index], $buffer)
+    }
+
+    $files = [System.IO.FileInfo[]]@($paths | ForEach-Object { New-Object -TypeName System.IO.FileInfo -ArgumentList $_ })
+
+    $serialChecksums = Get-MDTFileChecksum -Path $paths -Algorithm SHA256 -Parallelism 1
+    $parallelChecksums = Get-MDTFileChecksum -Path $paths -Algorithm SHA256 -Parallelism $Parallelism
+
+    for ($index = 0; $index -lt $FileCount; $index++) {
+
+        if ($null -eq $serialChecksums[$index] -or $serialChecksums[$index] -ne $parallelChecksums[$index]) {
+            throw "The serial and parallel checksums of '$($paths[$index])' differ."
+        }
+    }
+
+    $results = New-Object -TypeName System.Collections.Generic.List[object]
+
+    $results.Add((Measure-Mode -Mode 'Serial' -ModeParallelism 1 -ScriptBlock {
+        Get-MDTFileChecksum -Path $paths -Algorithm SHA256 -Parallelism 1
+    }))
+
+    $results.Add((Measure-Mode -Mode 'Parallel' -ModeParallelism $Parallelism -ScriptBlock {
+        Get-MDTFileChecksum -Path $paths -Algorithm SHA256 -Parallelism $Parallelism
+    }))
+
+    # The cache is only held in memory, since the module is in check mode and Close-MDTFileHashSession does not save it.
+    $module = New-TestAnsibleModule -Params @{
+        mdt_share_path = $Path
+        hash_cache = $true
+        rehash = $false
+        hash_parallelism = $Parallelism
+    } -CheckMode
+
+    Open-MDTFileHashSession -Module $module
+
+    try {
+        $results.Add((Measure-Mode -Mode 'Cached' -ModeParallelism $Parallelism -ScriptBlock {
+            Get-MDTFileHash -File $files
+        }))
+    }
+    finally {
+        Close-MDTFileHashSession -Module $module
+    }
+
+    if ($module.Result.hash_cache.misses -gt $FileCount) {
+        $misses = $module.Result.hash_cache.misses
+        Write-Warning "The file hash cache missed $($misses) times, so the cached mode was not read from the cache. File IDs are only available on Windows."
+    }
+
+    $results
+}
+finally {
+
+    if ($removePath -and (Test-Path -LiteralPath $Path)) {
+        Remove-Item -LiteralPath $Path -Recurse -Force
+    }
+}
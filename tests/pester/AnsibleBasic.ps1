@@ -0,0 +1,51 @@
+# Defines a stand-in for the Ansible.Basic.AnsibleModule type, so the module utils can be tested under pwsh without
+# Ansible.
+# FailJson throws instead of exiting, so failures can be asserted with Should -Throw.
+
+if ($null -eq ('Ansible.Basic.AnsibleModule' -as [type])) {
+
+    Add-Type -TypeDefinition @'
+using System;
+using System.Collections.Generic;
+
+namespace Ansible.Basic
+{
+    public class AnsibleModule
+    {
+        public Dictionary<string, object> Params = new Dictionary<string, object>(StringComparer.OrdinalIgnoreCase);
+        public Dictionary<string, object> Result = new Dictionary<string, object>();
+        public List<string> Warnings = new List<string>();
+        public bool CheckMode;
+
+        public void FailJson(string message)
+        {
+            throw new InvalidOperationException(message);
+        }
+
+        public void Warn(string message)
+        {
+            Warnings.Add(message);
+        }
+    }
+}
+'@
+}
+
+function New-TestAnsibleModule {
+
+    param (
+        [Parameter(Mandatory = $true)]
+        [System.Collections.IDictionary]$Params,
+        [Switch]$CheckMode
+    )
+
+    $module = New-Object -TypeName Ansible.Basic.AnsibleModule
+
+    foreach ($key in $Params.Keys) {
+        $module.Params[$key] = $Params[$key]
+    }
+
+    $module.CheckMode = $CheckMode.IsPresent
+
+    return $module
+}
@@ -0,0 +1,618 @@
+BeforeAll {
+    . (Join-Path -Path $PSScriptRoot -ChildPath 'AnsibleBasic.ps1')
+
+    $moduleUtilsPath = Join-Path -Path $PSScriptRoot -ChildPath '../../plugins/module_utils'
+
+    foreach ($moduleName in @('Common', 'ControlFile', 'Application', 'Driver', 'OperatingSystem', 'TaskSequence', 'SelectionProfile')) {
+        Import-Module -Name (Join-Path -Path $moduleUtilsPath -ChildPath "$($moduleName).psm1") -Force
+    }
+
+    $fixturePath = Join-Path -Path $PSScriptRoot -ChildPath 'fixtures'
+    $mdtSharePath = Join-Path -Path $fixturePath -ChildPath 'MDTShare'
+    $controlPath = Join-Path -Path $mdtSharePath -ChildPath 'Control'
+
+    function New-FixtureModule {
+        New-TestAnsibleModule -Params @{ mdt_share_path = $mdtSharePath }
+    }
+
+    # Sorts the keys of every hashtable, so that a formatted item and the expected item serialize to the same JSON
+    # only if they have the same keys, values, and value types.
+    function ConvertTo-SortedObject {
+        param ($InputObject)
+
+        if ($InputObject -is [System.Collections.IDictionary]) {
+            $sortedObject = [ordered]@{}
+
+            foreach ($key in (@($InputObject.Keys) | Sort-Object)) {
+                $sortedObject[$key] = ConvertTo-SortedObject -InputObject $InputObject[$key]
+            }
+
+            return $sortedObject
+        }
+
+        if ($InputObject -is [System.Collections.IList]) {
+            return , @(foreach ($value in $InputObject) { ConvertTo-SortedObject -InputObject $value })
+        }
+
+        return $InputObject
+    }
+
+    function ConvertTo-FormattedItemJson {
+        param ($InputObject)
+
+        ConvertTo-Json -InputObject (ConvertTo-SortedObject -InputObject $InputObject) -Depth 5 -Compress
+    }
+}
+
+Describe 'Read-MDTControlFile' {
+
+    It 'Reads the attributes and child elements of each item' {
+        $items = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Applications.xml'))
+
+        $items.Count | Should -Be 5
+        $items[0].guid | Should -Be '{11111111-1111-1111-1111-111111111111}'
+        $items[0].enable | Should -Be 'True'
+        $items[0].Name | Should -Be 'Contoso Runtime 1.0'
+        $items[0].Source | Should -Be '.\Applications\Contoso Runtime 1.0'
+    }
+
+    It 'Does not add child elements that are not present' {
+        $items = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Applications.xml'))
+
+        $items[0].ContainsKey('Dependency') | Should -BeFalse
+        $items[1].ContainsKey('Source') | Should -BeFalse
+    }
+
+    It 'Keeps a single Dependency element as a string' {
+        $items = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Applications.xml'))
+
+        $items[1].Dependency | Should -BeOfType [string]
+        $items[1].Dependency | Should -Be '{11111111-1111-1111-1111-111111111111}'
+    }
+
+    It 'Collects repeated Dependency elements into a list in document order' {
+        $items = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Applications.xml'))
+        $dependency = $items[2].Dependency
+
+        $dependency.GetType().FullName | Should -BeLike 'System.Collections.Generic.List*'
+        $dependency.Count | Should -Be 3
+        $dependency[0] | Should -Be '{11111111-1111-1111-1111-111111111111}'
+        $dependency[2] | Should -Be '{99999999-9999-9999-9999-999999999999}'
+    }
+
+    It 'Collects repeated Member elements into a list' {
+        $groups = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'ApplicationGroups.xml'))
+        $member = ($groups | Where-Object { $_.Name -eq 'Contoso' }).Member
+
+        $member.Count | Should -Be 3
+        $member[1] | Should -Be '{22222222-2222-2222-2222-222222222222}'
+    }
+
+    It 'Reads CDATA sections and escaped text' {
+        $applications = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Applications.xml'))
+        $drivers = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Drivers.xml'))
+
+        $applications[2].Comments | Should -Be 'Installs <everything>'
+        $drivers[1].PNPId | Should -Be 'USB\VID_0BDA&PID_8153'
+    }
+
+    It 'Reads the root element as the only item when Root is specified' {
+        $settings = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Settings.xml') -Root)
+
+        $settings.Count | Should -Be 1
+        $settings[0].SupportX86 | Should -Be 'False'
+        $settings[0].'Boot.x64.SelectionProfile' | Should -Be 'All Drivers and Packages'
+        $settings[0].'Boot.x64.ExtraDirectory' | Should -Be ''
+    }
+
+    It 'Returns an empty array when the file does not exist' {
+        $items = @(Read-MDTControlFile -Path (Join-Path -Path $controlPath -ChildPath 'Medias.xml'))
+
+        $items.Count | Should -Be 0
+    }
+
+    It 'Rejects a file containing a DTD' {
+        $path = Join-Path -Path $fixturePath -ChildPath 'Invalid/Dtd.xml'
+
+        { Read-MDTControlFile -Path $path } | Should -Throw -ExpectedMessage '*DTD is prohibited*'
+    }
+}
+
+Describe 'Get-MDTControlCatalog' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'Application'
+        Clear-MDTControlCatalog -Module $module -ItemType 'Driver'
+    }
+
+    It 'Excludes the hidden folder and the items only within it' {
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        $catalog.FoldersByPath.ContainsKey('hidden') | Should -BeFalse
+        $catalog.ByGuid.ContainsKey('{44444444-4444-4444-4444-444444444444}') | Should -BeFalse
+        $catalog.Items.Count | Should -Be 4
+    }
+
+    It 'Maps the default folder to the root path' {
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        $catalog.FoldersByPath.ContainsKey('') | Should -BeTrue
+        $catalog.FoldersByPath[''].Name | Should -Be 'default'
+        $catalog.FoldersByPath.ContainsKey('default') | Should -BeFalse
+    }
+
+    It 'Records every folder of an item that is a member of more than one folder' {
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+        $paths = $catalog.Paths['{11111111-1111-1111-1111-111111111111}']
+
+        $paths.Count | Should -Be 2
+        $paths | Should -Contain ''
+        $paths | Should -Contain 'Contoso'
+    }
+
+    It 'Indexes items case-insensitively by GUID and by name' {
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        $catalog.ByGuid.ContainsKey('{aaaaaaaa-0000-0000-0000-000000000003}') | Should -BeFalse
+        $catalog.ByGuid['{22222222-2222-2222-2222-222222222222}'].Name | Should -Be 'Contoso Editor 2.0'
+        $catalog.ByName['contoso editor 2.0'].Count | Should -Be 2
+    }
+
+    It 'Indexes the children of each folder by the path of the parent folder' {
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        @($catalog.FolderChildren[''] | ForEach-Object { $_.Path }) | Should -Be @('Contoso', 'Empty')
+        @($catalog.FolderChildren['Contoso'] | ForEach-Object { $_.Path }) | Should -Be @('Contoso\Legacy')
+    }
+
+    It 'Returns the cached catalog until it is cleared' {
+        $first = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+        $second = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        [object]::ReferenceEquals($first, $second) | Should -BeTrue
+
+        Clear-MDTControlCatalog -Module $module -ItemType 'Application'
+        $third = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+
+        [object]::ReferenceEquals($first, $third) | Should -BeFalse
+    }
+
+    It 'Fails when the MDT share path does not exist' {
+        $missingModule = New-TestAnsibleModule -Params @{ mdt_share_path = (Join-Path -Path $fixturePath -ChildPath 'Missing') }
+
+        { Get-MDTControlCatalog -Module $missingModule -ItemType 'Application' } | Should -Throw -ExpectedMessage '*does not exist*'
+    }
+}
+
+Describe 'Get-MDTControlFolderPath' {
+
+    It 'Returns the visible folders relative to the root folder' {
+        $module = New-FixtureModule
+
+        Get-MDTControlFolderPath -Module $module -ItemType 'Driver' | Should -Be @('WinPE', 'Dell\Latitude 7440')
+    }
+
+    It 'Prefixes every folder with the root folder when IncludeRootFolder is specified' {
+        $module = New-FixtureModule
+        $expected = @('Out-of-Box Drivers', 'Out-of-Box Drivers\WinPE', 'Out-of-Box Drivers\Dell\Latitude 7440')
+
+        Get-MDTControlFolderPath -Module $module -ItemType 'Driver' -IncludeRootFolder | Should -Be $expected
+    }
+}
+
+Describe 'Get-MDTControlItem' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'Application'
+        Clear-MDTControlCatalog -Module $module -ItemType 'Driver'
+    }
+
+    It 'Gets an item by GUID' {
+        $item = Get-MDTControlItem -Module $module -ItemType 'Application' -Guid '{33333333-3333-3333-3333-333333333333}'
+
+        $item.Name | Should -Be 'Contoso Suite'
+        $item.hide | Should -Be 'True'
+    }
+
+    It 'Does not get an item that is only within the hidden folder' {
+        Get-MDTControlItem -Module $module -ItemType 'Application' -Guid '{44444444-4444-4444-4444-444444444444}' | Should -BeNullOrEmpty
+        Get-MDTControlItem -Module $module -ItemType 'Application' -Name 'Hidden Application' | Should -BeNullOrEmpty
+    }
+
+    It 'Gets every item with the same name' {
+        $items = @(Get-MDTControlItem -Module $module -ItemType 'Application' -Name 'Contoso Editor 2.0')
+
+        $items.Count | Should -Be 2
+        $items[1].Version | Should -Be '2.1'
+    }
+
+    It 'Fails when the GUID does not match but the name is already in use' {
+        $guid = '{00000000-0000-0000-0000-000000000000}'
+
+        { Get-MDTControlItem -Module $module -ItemType 'Application' -Guid $guid -Name 'Contoso Suite' } |
+            Should -Throw -ExpectedMessage "*named 'Contoso Suite' already exists*"
+    }
+
+    It 'Reads repeated Platform and PNPId elements of a driver' {
+        $item = Get-MDTControlItem -Module $module -ItemType 'Driver' -Guid '{d1d1d1d1-0000-0000-0000-000000000001}'
+
+        @($item.Platform) | Should -Be @('x86', 'x64')
+        @($item.PNPId).Count | Should -Be 2
+    }
+}
+
+Describe 'Get-MDTControlSettings' {
+
+    It 'Reads the settings of the MDT share' {
+        $settings = Get-MDTControlSettings -Module (New-FixtureModule)
+
+        $settings.NodeType | Should -Be 'RootFolder'
+        $settings.UNCPath | Should -Be '\\mdt01\DeploymentShare$'
+        $settings.SupportX64 | Should -Be 'True'
+    }
+
+    It 'Returns null when the MDT share has no settings' {
+        $module = New-TestAnsibleModule -Params @{ mdt_share_path = (Join-Path -Path $fixturePath -ChildPath 'Invalid') }
+
+        Get-MDTControlSettings -Module $module | Should -BeNullOrEmpty
+    }
+}
+
+Describe 'Set-MDTControlItemFolder' {
+
+    BeforeEach {
+        $writableSharePath = Join-Path -Path $TestDrive -ChildPath ([System.Guid]::NewGuid().ToString())
+        Copy-Item -Path $mdtSharePath -Destination $writableSharePath -Recurse
+        $writableControlPath = Join-Path -Path $writableSharePath -ChildPath 'Control'
+        $writableModule = New-TestAnsibleModule -Params @{ mdt_share_path = $writableSharePath }
+    }
+
+    It 'Replaces the folder control file without leaving a temporary file' {
+        $guid = '{d1d1d1d1-0000-0000-0000-000000000002}'
+
+        Set-MDTControlItemFolder -Module $writableModule -ItemType 'Driver' -Paths @{ $guid = @('WinPE') }
+
+        $catalog = Get-MDTControlCatalog -Module $writableModule -ItemType 'Driver'
+
+        @($catalog.Paths[$guid]) | Should -Be @('WinPE')
+        @(Get-ChildItem -LiteralPath $writableControlPath -Filter '*.tmp') | Should -HaveCount 0
+    }
+
+    It 'Does not change the folder control file in check mode' {
+        $checkModule = New-TestAnsibleModule -Params @{ mdt_share_path = $writableSharePath } -CheckMode
+        $groupFilePath = Join-Path -Path $writableControlPath -ChildPath 'DriverGroups.xml'
+        $before = Get-Content -LiteralPath $groupFilePath -Raw
+
+        Set-MDTControlItemFolder -Module $checkModule -ItemType 'Driver' -Paths @{ '{d1d1d1d1-0000-0000-0000-000000000002}' = @('WinPE') }
+
+        Get-Content -LiteralPath $groupFilePath -Raw | Should -Be $before
+    }
+
+    It 'Rejects a folder control file containing a DTD' {
+        $groupFilePath = Join-Path -Path $writableControlPath -ChildPath 'DriverGroups.xml'
+        Copy-Item -Path (Join-Path -Path $fixturePath -ChildPath 'Invalid/Dtd.xml') -Destination $groupFilePath -Force
+
+        { Set-MDTControlItemFolder -Module $writableModule -ItemType 'Driver' -Paths @{ '{d1d1d1d1-0000-0000-0000-000000000002}' = @('WinPE') } } |
+            Should -Throw -ExpectedMessage '*DTD is prohibited*'
+    }
+}
+
+Describe 'Format-MDTControlApplication' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'Application'
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Application'
+    }
+
+    It 'Formats an application with source files like Format-MDTApplication' {
+        $expected = @{
+            guid = '{11111111-1111-1111-1111-111111111111}'
+            name = 'Contoso Runtime 1.0'
+            publisher = 'Contoso'
+            short_name = 'Runtime'
+            version = '1.0'
+            language = 'en-US'
+            type = 'source'
+            command_line = 'setup.exe /quiet'
+            working_directory = '.\Applications\Contoso Runtime 1.0'
+            files_path = "$($mdtSharePath)\Applications\Contoso Runtime 1.0"
+            comments = ''
+            enabled = $true
+            hidden = $false
+            reboot = $true
+            dependencies = @()
+            paths = @('', 'Contoso')
+        }
+
+        $applications = @(Get-MDTControlItem -Module $module -ItemType 'Application' -Guid $expected.guid |
+            Format-MDTControlApplication -Module $module -Catalog $catalog)
+
+        $applications | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $applications[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Formats an application without source files like Format-MDTApplication' {
+        $expected = @{
+            guid = '{22222222-2222-2222-2222-222222222222}'
+            name = 'Contoso Editor 2.0'
+            publisher = 'Contoso'
+            short_name = 'Editor'
+            version = '2.0'
+            language = $null
+            type = 'no_source'
+            command_line = 'setup.exe /quiet'
+            working_directory = $null
+            comments = ''
+            enabled = $true
+            hidden = $false
+            reboot = $false
+            dependencies = @(
+                @{ guid = '{11111111-1111-1111-1111-111111111111}'; name = 'Contoso Runtime 1.0' }
+            )
+            paths = @('Contoso')
+        }
+
+        $applications = @(Get-MDTControlItem -Module $module -ItemType 'Application' -Guid $expected.guid |
+            Format-MDTControlApplication -Module $module -Catalog $catalog)
+
+        $applications | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $applications[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Formats an application bundle like Format-MDTApplication' {
+        $expected = @{
+            guid = '{33333333-3333-3333-3333-333333333333}'
+            name = 'Contoso Suite'
+            publisher = $null
+            short_name = 'Suite'
+            version = $null
+            language = $null
+            type = 'bundle'
+            comments = 'Installs <everything>'
+            enabled = $false
+            hidden = $true
+            reboot = $false
+            dependencies = @(
+                @{ guid = '{11111111-1111-1111-1111-111111111111}'; name = 'Contoso Runtime 1.0' },
+                @{ guid = '{22222222-2222-2222-2222-222222222222}'; name = 'Contoso Editor 2.0' },
+                @{ guid = '{99999999-9999-9999-9999-999999999999}' }
+            )
+            paths = @('Contoso')
+        }
+
+        $applications = @(Get-MDTControlItem -Module $module -ItemType 'Application' -Guid $expected.guid |
+            Format-MDTControlApplication -Module $module -Catalog $catalog)
+
+        $applications | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $applications[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+}
+
+Describe 'Format-MDTControlDriver' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'Driver'
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'Driver'
+    }
+
+    It 'Formats a driver like Format-MDTDriver' {
+        $expected = @{
+            guid = '{d1d1d1d1-0000-0000-0000-000000000001}'
+            name = 'Intel Net e1d68x64.inf 12.19.1.37'
+            class = 'Net'
+            hash = '0123456789ABCDEF0123456789ABCDEF'
+            manufacturer = 'Intel'
+            files_path = "$($mdtSharePath)\Out-of-Box Drivers\Net\e1d68x64_12.19.1.37"
+            version = '12.19.1.37'
+            whql_signed = $true
+            os_version = @('10.0', '6.3')
+            platform = @('x86', 'x64')
+            pnp_ids = @('PCI\VEN_8086&DEV_15BB', 'PCI\VEN_8086&DEV_15BC')
+            comments = 'WinPE and Latitude 7440'
+            enabled = $true
+            hidden = $false
+            paths = @('WinPE', 'Dell\Latitude 7440')
+        }
+
+        $drivers = @(Get-MDTControlItem -Module $module -ItemType 'Driver' -Guid $expected.guid |
+            Format-MDTControlDriver -Module $module -Catalog $catalog)
+
+        $drivers | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $drivers[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Formats a driver without a hash or operating system versions like Format-MDTDriver' {
+        $expected = @{
+            guid = '{d1d1d1d1-0000-0000-0000-000000000002}'
+            name = 'Realtek Net rtux64w10.inf 10.50.0.0'
+            class = 'Net'
+            hash = $null
+            manufacturer = 'Realtek'
+            files_path = "$($mdtSharePath)\Out-of-Box Drivers\Net\rtux64w10_10.50.0.0"
+            version = '10.50.0.0'
+            whql_signed = $true
+            os_version = $null
+            platform = @('x64')
+            pnp_ids = @('USB\VID_0BDA&PID_8153')
+            comments = ''
+            enabled = $true
+            hidden = $false
+            paths = @('Dell\Latitude 7440')
+        }
+
+        $drivers = @(Get-MDTControlItem -Module $module -ItemType 'Driver' -Guid $expected.guid |
+            Format-MDTControlDriver -Module $module -Catalog $catalog)
+
+        $drivers | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $drivers[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+}
+
+Describe 'Format-MDTControlOperatingSystem' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'OperatingSystem'
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'OperatingSystem'
+    }
+
+    It 'Formats an operating system with setup files like Format-MDTOperatingSystem' {
+        $expected = @{
+            guid = '{0e0e0e0e-0000-0000-0000-000000000001}'
+            name = 'Windows 11 Enterprise in Windows 11 23H2 x64 install.wim'
+            build = '10.0.22631.2428'
+            description = 'Windows 11 Enterprise'
+            flags = 'Enterprise'
+            hal = 'acpiapic'
+            image_file = '.\Operating Systems\Windows 11 23H2 x64\Sources\install.wim'
+            image_index = 3
+            image_name = 'Windows 11 Enterprise'
+            os_type = 'Windows IBS'
+            platform = 'x64'
+            size = 16384
+            sms_image = $false
+            files_path = "$($mdtSharePath)\Operating Systems\Windows 11 23H2 x64"
+            languages = @('en-US')
+            type = 'source'
+            comments = ''
+            enabled = $true
+            hidden = $false
+            paths = @('Windows 11')
+        }
+
+        $operatingSystems = @(Get-MDTControlItem -Module $module -ItemType 'OperatingSystem' -Guid $expected.guid |
+            Format-MDTControlOperatingSystem -Module $module -Catalog $catalog)
+
+        $operatingSystems | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $operatingSystems[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Formats a custom image like Format-MDTOperatingSystem' {
+        $expected = @{
+            guid = '{0e0e0e0e-0000-0000-0000-000000000002}'
+            name = 'Reference in Reference x64 reference.wim'
+            build = '10.0.22631.2428'
+            description = 'Reference'
+            flags = 'Enterprise'
+            hal = 'acpiapic'
+            image_file = '.\Operating Systems\Reference x64\reference.wim'
+            image_index = 1
+            image_name = 'Reference'
+            os_type = 'Windows IBS'
+            platform = 'x64'
+            size = 20480
+            sms_image = $false
+            files_path = "$($mdtSharePath)\Operating Systems\Reference x64"
+            languages = @('en-US', 'de-DE')
+            type = 'wim'
+            comments = 'Captured image'
+            enabled = $false
+            hidden = $true
+            paths = @('')
+        }
+
+        $operatingSystems = @(Get-MDTControlItem -Module $module -ItemType 'OperatingSystem' -Guid $expected.guid |
+            Format-MDTControlOperatingSystem -Module $module -Catalog $catalog)
+
+        $operatingSystems | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $operatingSystems[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+}
+
+Describe 'Format-MDTControlTaskSequence' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'TaskSequence'
+        Clear-MDTControlCatalog -Module $module -ItemType 'OperatingSystem'
+        $catalog = Get-MDTControlCatalog -Module $module -ItemType 'TaskSequence'
+        $operatingSystemCatalog = Get-MDTControlCatalog -Module $module -ItemType 'OperatingSystem'
+
+        $expected = @{
+            guid = '{7a7a7a7a-0000-0000-0000-000000000001}'
+            name = 'Deploy Windows 11'
+            id = 'WIN11'
+            template = 'Client.xml'
+            version = '1.0'
+            comments = ''
+            enabled = $true
+            hidden = $false
+            paths = @('Production')
+            operating_system = @{
+                guid = '{0e0e0e0e-0000-0000-0000-000000000001}'
+                name = 'Windows 11 Enterprise in Windows 11 23H2 x64 install.wim'
+            }
+            full_name = 'Contoso User'
+            organization = 'Contoso'
+            ie_home_page = 'about:blank'
+            product_key_type = 'mak'
+        }
+    }
+
+    It 'Formats a task sequence like Format-MDTTaskSequence' {
+        $taskSequences = @(Get-MDTControlItem -Module $module -ItemType 'TaskSequence' -Guid $expected.guid |
+            Format-MDTControlTaskSequence -Module $module -Catalog $catalog -OperatingSystemCatalog $operatingSystemCatalog)
+
+        $taskSequences | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $taskSequences[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Adds the product key and administrator password when IncludeSecrets is specified' {
+        $expected.product_key = 'AAAAA-BBBBB-CCCCC-DDDDD-EEEEE'
+        $expected.admin_password = 'P@ssw0rd'
+
+        $taskSequences = @(Get-MDTControlItem -Module $module -ItemType 'TaskSequence' -Guid $expected.guid |
+            Format-MDTControlTaskSequence -Module $module -Catalog $catalog -OperatingSystemCatalog $operatingSystemCatalog -IncludeSecrets)
+
+        $taskSequences | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $taskSequences[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+}
+
+Describe 'Format-MDTControlSelectionProfile' {
+
+    BeforeEach {
+        $module = New-FixtureModule
+        Clear-MDTControlCatalog -Module $module -ItemType 'SelectionProfile'
+    }
+
+    It 'Formats a selection profile like Format-MDTSelectionProfile' {
+        $expected = @{
+            guid = '{5e5e5e5e-0000-0000-0000-000000000001}'
+            name = 'WinPE x64'
+            read_only = $false
+            definition = @('Out-of-Box Drivers\WinPE', 'Packages\WinPE')
+            comments = 'Drivers for the boot image'
+            enabled = $true
+            hidden = $false
+        }
+
+        $selectionProfiles = @(Get-MDTControlItem -Module $module -ItemType 'SelectionProfile' -Guid $expected.guid |
+            Format-MDTControlSelectionProfile)
+
+        $selectionProfiles | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $selectionProfiles[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+
+    It 'Formats a selection profile without included folders like Format-MDTSelectionProfile' {
+        $expected = @{
+            guid = '{5e5e5e5e-0000-0000-0000-000000000002}'
+            name = 'Nothing'
+            read_only = $true
+            definition = @()
+            comments = ''
+            enabled = $true
+            hidden = $false
+        }
+
+        $selectionProfiles = @(Get-MDTControlItem -Module $module -ItemType 'SelectionProfile' -Guid $expected.guid |
+            Format-MDTControlSelectionProfile)
+
+        $selectionProfiles | Should -HaveCount 1
+        ConvertTo-FormattedItemJson -InputObject $selectionProfiles[0] | Should -Be (ConvertTo-FormattedItemJson -InputObject $expected)
+    }
+}
@@ -0,0 +1,236 @@
+BeforeAll {
+    . (Join-Path -Path $PSScriptRoot -ChildPath 'AnsibleBasic.ps1')
+
+    $moduleUtilsPath = Join-Path -Path $PSScriptRoot -ChildPath '../../plugins/module_utils'
+
+    if ($null -eq ('ansible_collections.trippsc2.mdt.plugins.module_utils.WorkerPipe.WorkerPipe' -as [type])) {
+        Add-Type -Path (Join-Path -Path $moduleUtilsPath -ChildPath 'WorkerPipe.cs')
+    }
+
+    Import-Module -Name (Join-Path -Path $moduleUtilsPath -ChildPath 'Common.psm1') -Force
+    Import-Module -Name (Join-Path -Path $moduleUtilsPath -ChildPath 'Worker.psm1') -Force
+}
+
+Describe 'Get-MDTWorkerPipeName' {
+
+    It 'Ignores the case and trailing backslash of the MDT share path' {
+        Get-MDTWorkerPipeName -MDTSharePath 'C:\MDTShare' | Should -Be (Get-MDTWorkerPipeName -MDTSharePath 'c:\mdtshare\')
+    }
+
+    It 'Differs between MDT shares' {
+        Get-MDTWorkerPipeName -MDTSharePath 'C:\MDTShare' | Should -Not -Be (Get-MDTWorkerPipeName -MDTSharePath 'D:\MDTShare')
+    }
+
+    It 'Includes the version of the worker protocol' {
+        Get-MDTWorkerPipeName -MDTSharePath 'C:\MDTShare' | Should -BeLike 'trippsc2.mdt.worker.v1.*'
+    }
+}
+
+Describe 'Invoke-MDTWorkerScript' {
+
+    BeforeAll {
+        # The worker mounts the MDT share with the FileSystem provider and imports the stand-in MDT module.
+        InModuleScope -ModuleName Worker -Parameters @{ Path = (Join-Path -Path $TestDrive -ChildPath 'Workers') } {
+            param ($Path)
+
+            $script:mdtWorkerRootPath = $Path
+            $script:mdtWorkerProviderName = 'FileSystem'
+        }
+
+        $installationPath = Join-Path -Path $PSScriptRoot -ChildPath 'fixtures/MDT'
+        $workerPids = New-Object -TypeName System.Collections.Generic.List[int]
+
+        $script = {
+            param ($Parameters, $Context)
+
+            @{
+                pid = $PID
+                drive_name = $Context.DriveName
+                imports = [System.AppDomain]::CurrentDomain.GetData('MDTStandInImportCount')
+                value = $Parameters.value
+                settings_exists = Test-Path -LiteralPath "$($Context.DriveName):\Control\Settings.xml"
+            }
+        }.ToString()
+
+        function New-WorkerShare {
+            param ([string]$Name)
+
+            $path = Join-Path -Path $TestDrive -ChildPath $Name
+            Copy-Item -Path (Join-Path -Path $PSScriptRoot -ChildPath 'fixtures/MDTShare') -Destination $path -Recurse
+
+            return $path
+        }
+
+        function New-WorkerModule {
+            param (
+                [string]$SharePath,
+                [int]$IdleTimeout = 60,
+                [bool]$UseWorker = $true
+            )
+
+            New-TestAnsibleModule -Params @{
+                installation_path = $installationPath
+                mdt_share_path = $SharePath
+                use_worker = $UseWorker
+                worker_idle_timeout = $IdleTimeout
+            }
+        }
+
+        $sharePath = New-WorkerShare -Name 'Share'
+    }
+
+    AfterAll {
+        foreach ($workerPid in $workerPids) {
+            Stop-Process -Id $workerPid -Force -ErrorAction SilentlyContinue
+        }
+
+        InModuleScope -ModuleName Worker {
+            $script:mdtWorkerRootPath = $null
+            $script:mdtWorkerProviderName = 'MDTProvider'
+        }
+    }
+
+    It 'Starts a worker and runs the script within it' {
+        $module = New-WorkerModule -SharePath $sharePath
+
+        $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'first' }
+        $workerPids.Add($result.pid)
+
+        $result.pid | Should -Not -Be $PID
+        $result.value | Should -Be 'first'
+        $result.settings_exists | Should -BeTrue
+        $result.imports | Should -Be 1
+        $module.Result.mdt_worker.pid | Should -Be $result.pid
+        $module.Result.mdt_worker.started | Should -BeTrue
+        $module.Result.mdt_worker.invalidated | Should -BeFalse
+    }
+
+    It 'Reuses the running worker without importing the MDT module again' {
+        $first = Invoke-MDTWorkerScript -Module (New-WorkerModule -SharePath $sharePath) -Script $script -Parameters @{ value = 'first' }
+        $module = New-WorkerModule -SharePath $sharePath
+
+        $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'second' }
+
+        $result.pid | Should -Be $first.pid
+        $result.value | Should -Be 'second'
+        $result.imports | Should -Be 1
+        $module.Result.mdt_worker.started | Should -BeFalse
+        $module.Result.mdt_worker.invalidated | Should -BeFalse
+    }
+
+    It 'Imports the MDT module and mounts the MDT share again when a control file changes' {
+        $first = Invoke-MDTWorkerScript -Module (New-WorkerModule -SharePath $sharePath) -Script $script -Parameters @{ value = 'first' }
+        Add-Content -LiteralPath (Join-Path -Path $sharePath -ChildPath 'Control/Settings.xml') -Value '<!-- changed -->'
+        $module = New-WorkerModule -SharePath $sharePath
+
+        $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'second' }
+
+        $result.pid | Should -Be $first.pid
+        $result.imports | Should -Be ($first.imports + 1)
+        $result.settings_exists | Should -BeTrue
+        $module.Result.mdt_worker.invalidated | Should -BeTrue
+    }
+
+    It 'Returns the warnings written by the script' {
+        $module = New-WorkerModule -SharePath $sharePath
+
+        $result = Invoke-MDTWorkerScript -Module $module -Script 'Write-Warning "Check the share."; "done"' -Parameters @{}
+
+        $result | Should -Be 'done'
+        $module.Warnings | Should -Contain 'Check the share.'
+    }
+
+    It 'Fails the module with the errors written by the script' {
+        $module = New-WorkerModule -SharePath $sharePath
+
+        { Invoke-MDTWorkerScript -Module $module -Script 'Write-Error "The request failed."' -Parameters @{} } |
+            Should -Throw -ExpectedMessage '*The request failed.*'
+    }
+
+    It 'Exits once no request is received within the idle timeout' {
+        $module = New-WorkerModule -SharePath (New-WorkerShare -Name 'IdleShare') -IdleTimeout 2
+
+        $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{}
+        $workerPids.Add($result.pid)
+
+        $deadline = [System.DateTime]::UtcNow.AddSeconds(15)
+
+        while ($null -ne (Get-Process -Id $result.pid -ErrorAction SilentlyContinue) -and [System.DateTime]::UtcNow -lt $deadline) {
+            Start-Sleep -Milliseconds 250
+        }
+
+        Get-Process -Id $result.pid -ErrorAction SilentlyContinue | Should -BeNullOrEmpty
+    }
+
+    Context 'When the script is run within the module process' {
+
+        BeforeAll {
+            $inProcessSharePath = New-WorkerShare -Name 'InProcessShare'
+            New-PSDrive -Name 'WorkerTest' -PSProvider FileSystem -Root $inProcessSharePath -Scope Global | Out-Null
+
+            InModuleScope -ModuleName Worker {
+                $script:mdtWorkerStartTimeout = [System.TimeSpan]::FromSeconds(1)
+            }
+        }
+
+        AfterAll {
+            Remove-PSDrive -Name 'WorkerTest' -Scope Global -ErrorAction SilentlyContinue
+
+            InModuleScope -ModuleName Worker {
+                $script:mdtWorkerStartTimeout = [System.TimeSpan]::FromSeconds(30)
+            }
+        }
+
+        BeforeEach {
+            Mock -ModuleName Worker -CommandName Import-MDTModule -MockWith { }
+            Mock -ModuleName Worker -CommandName Get-MDTPSDrive -MockWith { [PSCustomObject]@{ Name = 'WorkerTest' } }
+        }
+
+        It 'Falls back to the module process when the worker cannot be reached' {
+            Mock -ModuleName Worker -CommandName Start-MDTWorker -MockWith { }
+            $module = New-WorkerModule -SharePath $inProcessSharePath
+
+            $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'fallback' }
+
+            $result.pid | Should -Be $PID
+            $result.value | Should -Be 'fallback'
+            $result.settings_exists | Should -BeTrue
+            $module.Result.ContainsKey('mdt_worker') | Should -BeFalse
+            $module.Warnings | Should -HaveCount 1
+            $module.Warnings[0] | Should -BeLike '*could not be reached*'
+            Should -Invoke -ModuleName Worker -CommandName Start-MDTWorker -Times 1 -Exactly
+        }
+
+        It 'Falls back to the module process when the worker is not run by a trusted user' {
+            Mock -ModuleName Worker -CommandName Start-MDTWorker -MockWith { }
+            Mock -ModuleName Worker -CommandName Write-MDTWorkerMessage -MockWith { }
+            Mock -ModuleName Worker -CommandName Test-MDTWorkerIsTrusted -MockWith { $false }
+            Mock -ModuleName Worker -CommandName Connect-MDTWorker -MockWith {
+                New-Object -TypeName System.IO.Pipes.NamedPipeClientStream -ArgumentList '.', 'trippsc2.mdt.worker.test'
+            }
+            $module = New-WorkerModule -SharePath $inProcessSharePath
+
+            $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'untrusted' }
+
+            $result.pid | Should -Be $PID
+            $result.value | Should -Be 'untrusted'
+            $module.Warnings | Should -HaveCount 1
+            $module.Warnings[0] | Should -BeLike '*not run by a trusted user*'
+            Should -Invoke -ModuleName Worker -CommandName Write-MDTWorkerMessage -Times 0 -Exactly
+            Should -Invoke -ModuleName Worker -CommandName Start-MDTWorker -Times 0 -Exactly
+        }
+
+        It 'Does not start a worker when use_worker is false' {
+            Mock -ModuleName Worker -CommandName Start-MDTWorker -MockWith { }
+            $module = New-WorkerModule -SharePath $inProcessSharePath -UseWorker $false
+
+            $result = Invoke-MDTWorkerScript -Module $module -Script $script -Parameters @{ value = 'in-process' }
+
+            $result.pid | Should -Be $PID
+            $result.value | Should -Be 'in-process'
+            $module.Warnings | Should -HaveCount 0
+            Should -Invoke -ModuleName Worker -CommandName Start-MDTWorker -Times 0 -Exactly
+            Should -Invoke -ModuleName Worker -CommandName Import-MDTModule -Times 1 -Exactly
+        }
+    }
+}